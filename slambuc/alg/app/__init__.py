@@ -12,3 +12,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from .common import PLATFORM, RUNTIME, MEMORY, RATE, DATA, NAME, Flavor
+from .compact import CompactTree
@@ -0,0 +1,356 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections.abc
+import typing
+from collections.abc import Generator
+
+import networkx as nx
+import numpy as np
+
+from slambuc.alg.app.common import *
+
+# Index of the PLATFORM node in the compact arrays and parent index of absent node IDs
+P_IDX, NO_PARENT = 0, -1
+
+
+class CompactAttrs(typing.NamedTuple):
+    """Store the plain list copies of the compact tree arrays for fast scalar access in pure Python loops."""
+    parent: list[int]  # Parent index of nodes
+    runtime: list[int]  # Node runtimes
+    memory: list[int]  # Node memory demands
+    rate: list[int]  # Invocation rates of the ingress edges
+    data: list[int]  # Data overheads of the ingress edges
+    cpu: list[int]  # Node CPU demands
+    ptr: list[int]  # CSR offsets of child lists
+    children: list[int]  # CSR concatenated child lists
+
+
+class CompactTree:
+    """
+    Read-only, array-backed representation of an app tree with a (virtual) PLATFORM node at index 0.
+
+    Node IDs must be positive integers and are used directly as indices of the attribute arrays, while the structure
+    is stored as a parent array and CSR-encoded child lists (*child_ptr*, *child_idx*) preserving the successor order
+    of the original graph. Edge attributes are stored at the index of the edge's head (child) node.
+
+    Implements the read-only subset of the :class:`networkx.DiGraph` interface used by the algorithms, e.g.,
+    ``tree.nodes[v][RUNTIME]``, ``tree[p][v][RATE]``, ``tree.succ[v]``, ``tree.predecessors(v)``. The serial
+    pseudo-polynomial tree algorithms convert their input into this form once per call, while other algorithms that
+    only read node and edge attributes accept it in place of the original graph, or use :func:`as_digraph`.
+    """
+
+    def __init__(self, parent: np.ndarray, child_ptr: np.ndarray, child_idx: np.ndarray, runtime: np.ndarray,
+                 memory: np.ndarray, rate: np.ndarray, data: np.ndarray, cpu: np.ndarray = None,
+                 graph: dict = None):
+        """
+        Initialize the compact tree with the given arrays indexed by node IDs.
+
+        :param parent:      parent node index of each node (PLATFORM: 0, absent/PLATFORM node: -1)
+        :param child_ptr:   offsets of each node's children in *child_idx* (CSR row pointer)
+        :param child_idx:   concatenated child node indices (CSR column indices)
+        :param runtime:     node runtime values
+        :param memory:      node memory values
+        :param rate:        invocation rate of the ingress edge of each node
+        :param data:        data overhead of the ingress edge of each node
+        :param cpu:         optional node CPU demands (default: 1)
+        :param graph:       graph attributes
+        """
+        self.parent = parent
+        self.child_ptr = child_ptr
+        self.child_idx = child_idx
+        self.runtime = runtime
+        self.memory = memory
+        self.rate = rate
+        self.data = data
+        self.cpu = cpu if cpu is not None else np.ones_like(runtime)
+        self.graph = dict(graph) if graph is not None else {}
+        # Plain list caches for fast scalar access with native int values
+        self.attr = CompactAttrs(parent.tolist(), runtime.tolist(), memory.tolist(), rate.tolist(), data.tolist(),
+                                 self.cpu.tolist(), child_ptr.tolist(), child_idx.tolist())
+        self._parent, self._ptr, self._children = self.attr.parent, self.attr.ptr, self.attr.children
+        self._runtime, self._memory, self._cpu = self.attr.runtime, self.attr.memory, self.attr.cpu
+        self._rate, self._data = self.attr.rate, self.attr.data
+        self._size = 1 + sum(p != NO_PARENT for p in self._parent[1:])
+
+    @classmethod
+    def from_digraph(cls, tree: nx.DiGraph) -> 'CompactTree':
+        """
+        Convert the given app tree into compact form.
+
+        :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+        :return:        compact tree
+        """
+        if any(v is not PLATFORM and (not isinstance(v, int) or v < 1) for v in tree):
+            raise ValueError("Compact tree representation requires positive integer node IDs!")
+        size = max((v for v in tree if v is not PLATFORM), default=0) + 1
+        parent = np.full(size, NO_PARENT, dtype=np.int64)
+        runtime, memory, rate, data = (np.zeros(size, dtype=np.int64) for _ in range(4))
+        cpu = np.ones(size, dtype=np.int64)
+        child_ptr, child_idx = np.zeros(size + 1, dtype=np.int64), []
+        for v in range(size):
+            _v = PLATFORM if v == P_IDX else v
+            if _v in tree:
+                for c in tree.successors(_v):
+                    parent[c] = v
+                    rate[c], data[c] = tree[_v][c][RATE], tree[_v][c][DATA]
+                    child_idx.append(c)
+                if v != P_IDX:
+                    runtime[v], memory[v] = tree.nodes[v][RUNTIME], tree.nodes[v][MEMORY]
+                    cpu[v] = tree.nodes[v].get(CPU, 1)
+            child_ptr[v + 1] = len(child_idx)
+        return cls(parent, child_ptr, np.array(child_idx, dtype=np.int64), runtime, memory, rate, data, cpu,
+                   tree.graph)
+
+    def to_digraph(self) -> nx.DiGraph:
+        """
+        Convert the compact tree back into an annotated :class:`networkx.DiGraph`.
+
+        :return:    app tree
+        """
+        tree = nx.DiGraph(**self.graph)
+        tree.add_node(PLATFORM)
+        for v in self:
+            if v is PLATFORM:
+                continue
+            tree.add_node(v, **{RUNTIME: self._runtime[v], MEMORY: self._memory[v]})
+            if self._cpu[v] != 1:
+                tree.nodes[v][CPU] = self._cpu[v]
+        for p, v in self.edges():
+            tree.add_edge(p, v, **{RATE: self._rate[v], DATA: self._data[v]})
+        return tree
+
+    def _idx(self, v: int | str) -> int:
+        """Return the array index of node *v* or raise KeyError."""
+        i = P_IDX if v is PLATFORM or v == PLATFORM else v
+        if isinstance(i, int) and (i == P_IDX or 0 < i < len(self._parent) and self._parent[i] != NO_PARENT):
+            return i
+        raise KeyError(v)
+
+    @staticmethod
+    def _node(i: int) -> int | str:
+        """Return the node ID of array index *i*."""
+        return PLATFORM if i == P_IDX else i
+
+    def children(self, v: int | str) -> list[int]:
+        """
+        Return the children of node *v* in the original successor order.
+
+        :param v:   node ID
+        :return:    list of child nodes
+        """
+        i = self._idx(v)
+        return self._children[self._ptr[i]:self._ptr[i + 1]]
+
+    def parent_of(self, v: int) -> int | str | None:
+        """
+        Return the parent of node *v* or None for the PLATFORM node.
+
+        :param v:   node ID
+        :return:    parent node
+        """
+        i = self._idx(v)
+        return self._node(self._parent[i]) if i != P_IDX else None
+
+    ####################################################################################################################
+
+    def __iter__(self) -> Generator[int | str]:
+        yield PLATFORM
+        yield from (v for v in range(1, len(self._parent)) if self._parent[v] != NO_PARENT)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, v: int | str) -> bool:
+        try:
+            self._idx(v)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+    def __getitem__(self, v: int | str) -> '_AdjacencyView':
+        return _AdjacencyView(self, self._idx(v))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.graph.get(NAME)!r}, nodes={len(self)})"
+
+    def __reduce__(self) -> tuple:
+        # Only the arrays are pickled, while the plain list caches are rebuilt at unpickling
+        return self.__class__, (self.parent, self.child_ptr, self.child_idx, self.runtime, self.memory, self.rate,
+                                self.data, self.cpu, self.graph)
+
+    def is_directed(self) -> bool:
+        return True
+
+    def is_multigraph(self) -> bool:
+        return False
+
+    def number_of_nodes(self) -> int:
+        return len(self)
+
+    def number_of_edges(self) -> int:
+        return len(self) - 1
+
+    def successors(self, v: int | str) -> Generator[int]:
+        yield from self.children(v)
+
+    neighbors = successors
+
+    def predecessors(self, v: int | str) -> Generator[int | str]:
+        if (i := self._idx(v)) != P_IDX:
+            yield self._node(self._parent[i])
+
+    @property
+    def nodes(self) -> '_NodeView':
+        return _NodeView(self)
+
+    @property
+    def succ(self) -> '_SuccessorView':
+        return _SuccessorView(self)
+
+    adj = succ
+
+    @property
+    def pred(self) -> '_PredecessorView':
+        return _PredecessorView(self)
+
+    def edges(self, nbunch: int | str | collections.abc.Iterable = None,
+              data: bool = False) -> list[tuple[int | str, int] | tuple[int | str, int, dict[str, int]]]:
+        if nbunch is None:
+            nbunch = self
+        elif nbunch in self:
+            nbunch = (nbunch,)
+        return [(p, v, {RATE: self._rate[v], DATA: self._data[v]}) if data else (p, v)
+                for p in nbunch if p in self for v in self.children(p)]
+
+    def out_degree(self, v: int | str) -> int:
+        i = self._idx(v)
+        return self._ptr[i + 1] - self._ptr[i]
+
+    def in_degree(self, v: int | str) -> int:
+        return int(self._idx(v) != P_IDX)
+
+
+class _NodeView(collections.abc.Mapping):
+    """Read-only node attribute view of a compact tree."""
+
+    def __init__(self, tree: CompactTree):
+        self._tree = tree
+
+    def __getitem__(self, v: int | str) -> dict[str, int]:
+        i, t = self._tree._idx(v), self._tree
+        return {RUNTIME: t._runtime[i], MEMORY: t._memory[i], CPU: t._cpu[i]} if i != P_IDX else {}
+
+    def __iter__(self) -> Generator[int | str]:
+        return iter(self._tree)
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def __call__(self, data: bool = False) -> collections.abc.Iterable:
+        return ((v, self[v]) for v in self._tree) if data else self
+
+
+class _AdjacencyView(collections.abc.Mapping):
+    """Read-only view of the egress edges of a given node in a compact tree."""
+
+    def __init__(self, tree: CompactTree, i: int):
+        self._tree, self._i = tree, i
+
+    def __getitem__(self, v: int) -> dict[str, int]:
+        t = self._tree
+        if v is PLATFORM or not isinstance(v, int) or not 0 < v < len(t._parent) or t._parent[v] != self._i:
+            raise KeyError(v)
+        return {RATE: t._rate[v], DATA: t._data[v]}
+
+    def __iter__(self) -> Generator[int]:
+        t = self._tree
+        return iter(t._children[t._ptr[self._i]:t._ptr[self._i + 1]])
+
+    def __len__(self) -> int:
+        t = self._tree
+        return t._ptr[self._i + 1] - t._ptr[self._i]
+
+
+class _SuccessorView(collections.abc.Mapping):
+    """Read-only successor adjacency view of a compact tree."""
+
+    def __init__(self, tree: CompactTree):
+        self._tree = tree
+
+    def __getitem__(self, v: int | str) -> '_AdjacencyView':
+        return self._tree[v]
+
+    def __iter__(self) -> Generator[int | str]:
+        return iter(self._tree)
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+
+class _PredecessorView(_SuccessorView):
+    """Read-only predecessor adjacency view of a compact tree."""
+
+    def __getitem__(self, v: int | str) -> dict[int | str, dict[str, int]]:
+        t, i = self._tree, self._tree._idx(v)
+        return {t._node(t._parent[i]): {RATE: t._rate[i], DATA: t._data[i]}} if i != P_IDX else {}
+
+
+def compact_tree(tree: nx.DiGraph | CompactTree) -> 'CompactTree':
+    """
+    Return the compact representation of the given *tree* converting it only if necessary.
+
+    :param tree:    app tree in any supported form
+    :return:        compact tree
+    """
+    return tree if isinstance(tree, CompactTree) else CompactTree.from_digraph(tree)
+
+
+def as_digraph(tree: nx.DiGraph | CompactTree) -> nx.DiGraph:
+    """
+    Return the given *tree* as a :class:`networkx.DiGraph` converting it only if necessary.
+
+    :param tree:    app tree in any supported form
+    :return:        app tree as a DiGraph
+    """
+    return tree.to_digraph() if isinstance(tree, CompactTree) else tree
+
+
+def compact_tree_indexed(tree: nx.DiGraph | CompactTree) -> tuple[CompactTree, dict[typing.Any, int] | None]:
+    """
+    Return the compact representation of the given *tree* while relabeling the nodes to contiguous integer indices
+    if the node IDs cannot be used as indices directly, e.g., string or 0-based node IDs.
+
+    :param tree:    app tree in any supported form
+    :return:        compact tree and the node ID -> index mapping (None if no relabeling was necessary)
+    """
+    try:
+        return compact_tree(tree), None
+    except ValueError:
+        mapping = {v: i for i, v in enumerate((v for v in tree if v != PLATFORM), start=1)}
+        mapping[PLATFORM] = PLATFORM
+        return CompactTree.from_digraph(nx.relabel_nodes(tree, mapping, copy=True)), mapping
+
+
+def restore_partition(partition: list[list[int]], mapping: dict[typing.Any, int] | None) -> list[list[typing.Any]]:
+    """
+    Replace node indices in the given *partition* with the original node IDs of the relabeling *mapping*.
+
+    :param partition:   partition blocks of node indices
+    :param mapping:     node ID -> index mapping created by :func:`compact_tree_indexed`
+    :return:            partition blocks of original node IDs
+    """
+    if mapping is None:
+        return partition
+    labels = {i: v for v, i in mapping.items()}
+    return sorted([labels[v] for v in blk] for blk in partition)
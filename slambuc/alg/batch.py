@@ -0,0 +1,200 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import importlib
+import os
+import signal
+import time
+import typing
+from collections.abc import Generator, Iterable
+
+import networkx as nx
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Partitioning algorithm and its parameters resolved once per worker process
+_worker_alg: typing.Callable | None = None
+_worker_params: dict | typing.Callable[[nx.DiGraph], dict] = {}
+
+
+class BatchResult(typing.NamedTuple):
+    """Store the outcome of partitioning a single tree of a batch."""
+    index: int  # Index of the tree in the input sequence
+    result: tuple | None  # Return value of the partitioning algorithm or None in case of failure
+    error: BaseException | None = None  # Raised exception in case of failure, e.g., TimeoutError or MemoryError
+    elapsed: float = 0.0  # Elapsed time of the partitioning in sec
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def resolve_algorithm(alg: typing.Callable | str) -> typing.Callable:
+    """
+    Return the partitioning function referred by its fully qualified name, e.g.,
+    ``slambuc.alg.tree.serial.pseudo.pseudo_ltree_partitioning``, or the given callable itself.
+
+    :param alg: partitioning function or its qualified name
+    :return:    partitioning function
+    """
+    if callable(alg):
+        return alg
+    module_name, _, func_name = alg.replace(':', '.').rpartition('.')
+    if not module_name:
+        raise ValueError(f"Algorithm name must be fully qualified: {alg}")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _raise_timeout(signum: int, frame):
+    """Signal handler raising timeout in the worker process."""
+    raise TimeoutError("Partitioning exceeded the time limit")
+
+
+def _init_worker(alg: typing.Callable | str, params: dict | typing.Callable[[nx.DiGraph], dict], memory: int | None):
+    """
+    Initialize a worker process by resolving the partitioning function and setting the resource limits.
+
+    :param alg:     partitioning function or its qualified name
+    :param params:  algorithm parameters or a function calculating the parameters of a given tree
+    :param memory:  memory (address space) limit of the worker process in MB
+    """
+    global _worker_alg, _worker_params
+    _worker_alg, _worker_params = resolve_algorithm(alg), params
+    if hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    if memory and resource is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory * 2 ** 20, hard))
+
+
+def _partition_tree(idx: int, tree: nx.DiGraph, timeout: float | None) -> BatchResult:
+    """
+    Partition the given *tree* in a worker process with the preloaded algorithm and parameters.
+
+    :param idx:     index of the tree
+    :param tree:    app tree
+    :param timeout: time limit of the partitioning in sec
+    :return:        result of the partitioning
+    """
+    start = time.perf_counter()
+    try:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        params = _worker_params(tree) if callable(_worker_params) else _worker_params
+        result = _worker_alg(tree, **params)
+        return BatchResult(idx, result, None, time.perf_counter() - start)
+    except Exception as e:
+        return BatchResult(idx, None, e, time.perf_counter() - start)
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def ipartition_many(trees: Iterable[nx.DiGraph], alg: typing.Callable | str,
+                    params: dict | typing.Callable[[nx.DiGraph], dict] = None, workers: int = None,
+                    ordered: bool = True, timeout: float = None, memory: int = None,
+                    prefetch: int = None) -> Generator[BatchResult]:
+    """
+    Partition the given *trees* with the same partitioning algorithm in a pool of worker processes.
+
+    Trees are streamed into the pool, i.e., at most *prefetch* trees are pending or buffered at the same time,
+    therefore, *trees* can be given as a lazy generator, e.g., using :func:`slambuc.misc.io.iload_trees_from_file`.
+
+    The partitioning function and its parameters are passed to each worker only once at startup, so imported
+    modules and solver objects given in *params* are reused across trees. If *params* is a callable, it must be
+    picklable and is called in the worker with each tree to get the tree-specific parameters.
+
+    Time and memory limits are enforced within the workers, and exceeding them is reported as an error of the
+    given tree (*TimeoutError* or *MemoryError*) while the worker remains available for the next trees. If a worker
+    process dies unexpectedly, the trees under processing are reported with *BrokenProcessPool* errors and the pool
+    is restarted for the remaining trees.
+
+    :param trees:       app trees
+    :param alg:         partitioning function or its qualified name
+    :param params:      algorithm parameters or a function calculating the parameters of a given tree
+    :param workers:     number of worker processes (default: CPU count)
+    :param ordered:     return results in the order of the input trees instead of the order of completion
+    :param timeout:     time limit of partitioning a single tree in sec
+    :param memory:      memory (address space) limit of each worker process in MB
+    :param prefetch:    max number of trees under processing (default: 2 * workers)
+    :return:            generator of partitioning results
+    """
+    workers = workers if workers else os.cpu_count()
+    prefetch = prefetch if prefetch else 2 * workers
+    if timeout and not hasattr(signal, 'setitimer'):
+        raise ValueError("Time limit is not supported on this platform")
+    params = params if params is not None else {}
+    # Resolve the algorithm in advance to fail early
+    resolve_algorithm(alg)
+    executor, itrees = None, enumerate(trees)
+    futures, buffer, next_idx = {}, {}, 0
+    try:
+        while True:
+            # Keep the pool busy while the number of pending and buffered results are bounded
+            while len(futures) + len(buffer) < prefetch and (item := next(itrees, None)) is not None:
+                if executor is None:
+                    executor = concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                                      initargs=(alg, params, memory))
+                futures[executor.submit(_partition_tree, *item, timeout)] = item[0], executor
+            if not futures:
+                break
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in done:
+                idx, ex = futures.pop(f)
+                try:
+                    res = f.result()
+                except concurrent.futures.process.BrokenProcessPool as e:
+                    res = BatchResult(idx, None, e)
+                    # Restart the pool for the remaining trees if a worker process died unexpectedly
+                    if ex is executor:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = None
+                except Exception as e:
+                    res = BatchResult(idx, None, e)
+                if ordered:
+                    buffer[idx] = res
+                else:
+                    yield res
+            # Return buffered results in the input order
+            while next_idx in buffer:
+                yield buffer.pop(next_idx)
+                next_idx += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def partition_many(trees: Iterable[nx.DiGraph], alg: typing.Callable | str,
+                   params: dict | typing.Callable[[nx.DiGraph], dict] = None, workers: int = None,
+                   ordered: bool = True, timeout: float = None, memory: int = None,
+                   prefetch: int = None) -> list[BatchResult]:
+    """
+    Partition the given *trees* with the same partitioning algorithm in a pool of worker processes and return the
+    collected results.
+
+    See :func:`ipartition_many` for details.
+
+    :param trees:       app trees
+    :param alg:         partitioning function or its qualified name
+    :param params:      algorithm parameters or a function calculating the parameters of a given tree
+    :param workers:     number of worker processes (default: CPU count)
+    :param ordered:     return results in the order of the input trees instead of the order of completion
+    :param timeout:     time limit of partitioning a single tree in sec
+    :param memory:      memory (address space) limit of each worker process in MB
+    :param prefetch:    max number of trees under processing (default: 2 * workers)
+    :return:            list of partitioning results
+    """
+    return list(ipartition_many(trees, alg, params, workers, ordered, timeout, memory, prefetch))
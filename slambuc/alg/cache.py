@@ -0,0 +1,260 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import pathlib
+import pickle
+import sqlite3
+import time
+import typing
+from collections.abc import Iterable
+
+import networkx as nx
+import numpy as np
+import pulp as lp
+
+from slambuc.alg.app.common import CPU
+from slambuc.alg.app.compact import CompactTree, as_digraph
+
+# Default location of the result cache
+DEFAULT_CACHE_PATH = pathlib.Path(os.environ.get('XDG_CACHE_HOME', '~/.cache'), 'slambuc', 'results.db')
+# Default upper bound of the cache size in bytes
+DEFAULT_CACHE_SIZE = 256 * 2 ** 20
+# Algorithm parameters that only affect the execution but not the results
+IGNORED_PARAMS = frozenset(('pool', 'workers', 'backend', 'shared'))
+# Solver options that only affect the logging but not the results
+IGNORED_SOLVER_OPTIONS = frozenset(('msg', 'keepFiles', 'logPath'))
+
+
+def _json_default(obj: typing.Any) -> typing.Any:
+    """Convert numpy scalars and other non-JSON values into stable JSON values."""
+    return obj.item() if isinstance(obj, np.generic) else str(obj)
+
+
+def tree_fingerprint(tree: nx.DiGraph | CompactTree) -> str:
+    """
+    Calculate a stable fingerprint of the given *tree* based on its structure and node/edge attributes.
+
+    The fingerprint is independent of the graph attributes, e.g., the name of the tree, and the node insertion order,
+    while the successor order of nodes is taken into account.
+
+    :param tree:    app tree
+    :return:        hex digest of the tree
+    """
+    tree = as_digraph(tree)
+    content = []
+    for v in sorted(tree, key=str):
+        # CPU demand of 1 is the default value of nodes
+        attrs = {k: a for k, a in tree.nodes[v].items() if not (k == CPU and a == 1)}
+        content.append((str(v), attrs, [(str(c), tree[v][c]) for c in tree.successors(v)]))
+    data = json.dumps(content, sort_keys=True, separators=(',', ':'), default=_json_default)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def normalize_value(value: typing.Any) -> typing.Any:
+    """
+    Convert the given algorithm argument into a stable, JSON-serializable form.
+
+    Trees are replaced by their fingerprint, integral floats by integers, solvers by their name and options, while
+    types and module-level functions are referred by their qualified names. Other objects, e.g., lambdas, closures
+    or arbitrary instances, cannot be identified by their content, hence they are rejected by a :class:`TypeError`.
+
+    :param value:   argument value
+    :return:        normalized value
+    """
+    if isinstance(value, (nx.DiGraph, CompactTree)):
+        return {'tree': tree_fingerprint(value)}
+    elif isinstance(value, enum.Enum):
+        return normalize_value(value.value)
+    elif isinstance(value, (bool, str, type(None))):
+        return value
+    elif isinstance(value, (int, np.integer)):
+        return int(value)
+    elif isinstance(value, (float, np.floating)):
+        return int(value) if math.isfinite(value) and float(value).is_integer() else repr(float(value))
+    elif isinstance(value, np.ndarray):
+        return normalize_value(value.tolist())
+    elif isinstance(value, (list, tuple)):
+        return [normalize_value(v) for v in value]
+    elif isinstance(value, (set, frozenset)):
+        return sorted((normalize_value(v) for v in value), key=repr)
+    elif isinstance(value, dict):
+        return {str(k): normalize_value(v) for k, v in value.items()}
+    elif isinstance(value, lp.LpSolver):
+        # Solver options, e.g., time limit and gap, may alter the results
+        return {'solver': f"{type(value).__module__}.{type(value).__qualname__}",
+                'options': normalize_value({k: v for k, v in value.toDict().items()
+                                            if k not in IGNORED_SOLVER_OPTIONS})}
+    elif ((isinstance(value, type) or inspect.isfunction(value) or inspect.isbuiltin(value))
+          and '<' not in value.__qualname__):
+        return f"{value.__module__}.{value.__qualname__}"
+    else:
+        raise TypeError(f"Argument of type {type(value).__qualname__} cannot be normalized: {value!r}")
+
+
+def result_key(alg: str, args: dict[str, typing.Any], ignore: Iterable[str] = IGNORED_PARAMS) -> str:
+    """
+    Calculate the cache key of a partitioning call based on the algorithm name and its normalized arguments.
+
+    :param alg:     qualified name of the partitioning algorithm
+    :param args:    arguments of the algorithm including the input data
+    :param ignore:  names of arguments that do not affect the results
+    :return:        hex digest of the call
+    """
+    params = {k: normalize_value(v) for k, v in args.items() if k not in ignore}
+    data = json.dumps([alg, params], sort_keys=True, separators=(',', ':'), default=_json_default)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk, content-addressed store of partitioning results backed by an SQLite database.
+
+    Results are stored in pickled form and the least recently used entries are evicted when the total size of stored
+    results exceeds *max_size*. The database can be shared between processes, while connections are reopened
+    lazily in forked subprocesses.
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_CACHE_PATH, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Open (or create) the result cache.
+
+        :param path:        path of the database file
+        :param max_size:    upper bound of the total size of stored results in bytes
+        """
+        self.path = pathlib.Path(path).expanduser()
+        self.max_size = max_size
+        self._conn, self._pid = None, None
+
+    def __enter__(self) -> 'ResultCache':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, max_size={self.max_size})"
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection of the current process."""
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn, self._pid = sqlite3.connect(self.path, timeout=30), os.getpid()
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                               "size INTEGER NOT NULL, atime REAL NOT NULL)")
+        return self._conn
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored results in bytes."""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """
+        Return the stored result of the given *key* and mark it as recently used.
+
+        :param key:     cache key
+        :param default: return value in case of a missing key
+        :return:        stored result
+        """
+        if (row := self.conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()) is None:
+            return default
+        with self.conn:
+            self.conn.execute("UPDATE results SET atime = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key: str, result: typing.Any) -> bool:
+        """
+        Store the given *result* with *key* and evict the least recently used results exceeding the size limit.
+
+        :param key:     cache key
+        :param result:  partitioning result
+        :return:        whether the result is stored
+        """
+        try:
+            value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                              (key, value, len(value), time.time()))
+            # Keep the most recently used results within the size limit
+            self.conn.execute("DELETE FROM results WHERE key IN (SELECT key FROM (SELECT key, SUM(size) OVER "
+                              "(ORDER BY atime DESC, rowid DESC) AS total FROM results) WHERE total > ?)",
+                              (self.max_size,))
+        return key in self
+
+    def clear(self):
+        """Remove all the stored results."""
+        with self.conn:
+            self.conn.execute("DELETE FROM results")
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn, self._pid = None, None
+
+
+def cached(cache: ResultCache | str | os.PathLike | typing.Callable = None, name: str = None,
+           ignore: Iterable[str] = IGNORED_PARAMS) -> typing.Callable:
+    """
+    Decorator that stores the results of a partitioning function in a :class:`ResultCache`.
+
+    Can be used both as ``@cached`` and ``@cached(path, ...)``. Results are looked up based on the function's
+    qualified name and its (normalized) arguments including the default values, while *None* results and calls with
+    arguments that cannot be normalized, e.g., lambdas, are not cached.
+
+    :param cache:   result cache or path of its database file (default: user cache directory)
+    :param name:    name of the algorithm used in cache keys (default: qualified name of the function)
+    :param ignore:  names of arguments that do not affect the results
+    :return:        decorated function
+    """
+    if callable(cache):
+        return cached()(cache)
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        sig, alg = inspect.signature(func), name if name else f"{func.__module__}.{func.__qualname__}"
+        store = cache if isinstance(cache, ResultCache) else ResultCache(cache if cache else DEFAULT_CACHE_PATH)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            try:
+                key = result_key(alg, bound.arguments, ignore)
+            except TypeError:
+                # Bypass the cache for arguments that cannot be identified
+                return func(*args, **kwargs)
+            if (result := store.get(key)) is None:
+                result = func(*args, **kwargs)
+                store.put(key, result)
+            return result
+
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
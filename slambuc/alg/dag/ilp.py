@@ -16,9 +16,11 @@ import math
 import networkx as nx
 import pulp as lp
 
-from slambuc.alg import LP_LAT, INFEASIBLE, T_RESULTS
+from slambuc.alg import LP_LAT, INFEASIBLE, T_RESULTS, T_PART
 from slambuc.alg.app import *
-from slambuc.alg.tree.serial.ilp import extract_subtrees_from_xmatrix
+from slambuc.alg.solver import (SparseLpModel, decision_matrix, solution_matrix, WARM_START_SOLVERS,
+                                 warm_start_solver)
+from slambuc.alg.tree.serial.ilp import extract_subtrees_from_xmatrix, init_xmatrix_from_partition
 from slambuc.alg.util import (par_inst_count, ibacktrack_chain, verify_limits, par_subchain_latency,
                               iclosed_subgraph, par_subgraph_cost)
 
@@ -135,99 +137,117 @@ def greedy_dag_partitioning(dag: nx.DiGraph, root: int = 1, M: int = math.inf, L
 
 ########################################################################################################################
 
-def build_dag_mtx_model(dag: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
-                        M: int = math.inf, L: int = math.inf, N: int = 1, cpath: set[int] = frozenset(), delay: int = 1,
-                        subchains: bool = False) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+def build_dag_mtx_arrays(dag: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                         M: int = math.inf, L: int = math.inf, N: int = 1, cpath: set[int] = frozenset(),
+                         delay: int = 1,
+                         subchains: bool = False) -> tuple[SparseLpModel, dict[int, dict[int, int | None]]]:
     """
-    Generate the matrix ILP model based on parallel metric calculations.
+    Generate the matrix ILP model based on parallel metric calculations directly in sparse array form without
+    creating PuLP objects.
 
-    :return: tuple of the created model and list of decision variables
+    The variables, objective terms, and constraint rows of each closed subgraph are added at once.
+
+    :return: tuple of the created sparse model and the matrix of column indices
     """
     # Model
-    model = lp.LpProblem(name="DAG_Partitioning", sense=lp.LpMinimize)
-    # Decision variable matrix with trivial variables
-    X = {j: {j: lp.LpVariable(f"x_{j:02d}_{j:02d}", cat=lp.LpBinary) if j != root else 1}
-         for j in dag.nodes if j is not PLATFORM}
-    # Empty objective
-    sum_cost = lp.LpAffineExpression()
+    model = SparseLpModel(name="DAG_Partitioning", sense=lp.LpMinimize)
+    nodes = [j for j in dag.nodes if j is not PLATFORM]
+    # Column matrix of decision variables with trivial variables, the constant 1 is denoted by None
+    cols = iter(model.add_variables(f"x_{j:02d}_{j:02d}" for j in nodes if j != root))
+    C = {j: {j: next(cols) if j != root else None} for j in nodes}
+    # Node-level memory demands and ingress rates
+    mem = {v: dag.nodes[v][MEMORY] for v in C}
+    R = {v: sum(dag[p][v][RATE] for p in dag.predecessors(v)) for v in C}
     # Empty latency constraint
-    sum_lat = lp.LpAffineExpression()
+    sum_lat = []
     # Generate decision variables
-    for j in X:
-        blk_mem = dag.nodes[j][MEMORY] * X[j][j]
+    for j in C:
         # Add coefficients for single node block [j]
-        R_j = sum(dag[p][j][RATE] for p in dag.predecessors(j))
+        R_j = R[j]
         # noinspection PyUnresolvedReferences
         D_j = sum(dag[p][j][RATE] * dag[p][j][DATA] for p in dag.predecessors(j))
         t_j = dag.nodes[j][RUNTIME]
-        sum_cost += (D_j + R_j * t_j
-                     + sum(par_inst_count(R_j, dag[j][js][RATE], N) * dag[j][js][DATA]
-                           for js in dag.successors(j))) * X[j][j]
+        model.add_objective(C[j][j], D_j + R_j * t_j + sum(par_inst_count(R_j, dag[j][js][RATE], N) * dag[j][js][DATA]
+                                                           for js in dag.successors(j)))
         if j in cpath:
             jp = next(filter(lambda _p: _p in cpath or _p is PLATFORM, dag.predecessors(j)), None)
             jc = next(filter(lambda _c: _c in cpath, dag.successors(j)), None)
-            sum_lat += (dag[jp][j][DATA] + t_j
-                        + (math.ceil(dag[j][jc][RATE] / (dag[jp][j][RATE] * N)) * dag[j][jc][DATA]
-                           if jc else 0)) * X[j][j]
+            sum_lat.append((C[j][j], dag[jp][j][DATA] + t_j
+                            + (math.ceil(dag[j][jc][RATE] / (dag[jp][j][RATE] * N)) * dag[j][jc][DATA]
+                               if jc else 0)))
             if j != root:
-                sum_lat += delay * X[j][j]
+                sum_lat.append((C[j][j], delay))
+        # Candidate nodes for block_j
+        blk = list(iclosed_subgraph(dag, source=j, inclusive=False))
+        blk_cols = model.add_variables(f"x_{v:02d}_{j:02d}" for v in blk)
+        for v, c in zip(blk, blk_cols):
+            C[v][j] = c
+        # Add coefficients for merging single nodes to block [j,...]
+        model.add_objectives(blk_cols, [par_inst_count(R_j, R[v], N) * dag.nodes[v][RUNTIME]
+                                        - sum(par_inst_count(R_j, dag[vp][v][RATE], N) * dag[vp][v][DATA]
+                                              for vp in dag.predecessors(v))
+                                        + sum(par_inst_count(R_j, dag[v][vs][RATE], N) * dag[v][vs][DATA]
+                                              for vs in dag.successors(v)) for v in blk])
         # Cache instance factor for nodes in cpath
         n_v = 1
-        # Candidate nodes for block_j
-        for v in iclosed_subgraph(dag, source=j, inclusive=False):
-            X[v][j] = lp.LpVariable(f"x_{v:02d}_{j:02d}", cat=lp.LpBinary)
-            blk_mem += dag.nodes[v][MEMORY] * X[v][j]
-            # Add coefficients for merging single node v to block [j,...]
-            t_v = dag.nodes[v][RUNTIME]
-            R_v = sum(dag[p][v][RATE] for p in dag.predecessors(v))
-            # sum_cost += (r_v * (t_v - d_v) + sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values())) * X[v][j]
-            sum_cost += ((par_inst_count(R_j, R_v, N) * t_v
-                          - sum(par_inst_count(R_j, dag[vp][v][RATE], N) * dag[vp][v][DATA]
-                                for vp in dag.predecessors(v))
-                          + sum(par_inst_count(R_j, dag[v][vs][RATE], N) * dag[v][vs][DATA]
-                                for vs in dag.successors(v)))) * X[v][j]
-            # u -> v edge on cpath
-            if v in cpath:
-                vp = next(filter(lambda _p: _p in cpath, dag.predecessors(v)), None)
-                vpp = next(filter(lambda _p: _p in cpath or _p is PLATFORM, dag.predecessors(vp)), None)
-                n_v *= math.ceil(dag[vp][v][RATE] / (dag[vpp][vp][RATE] * N))
-                vc = next(filter(lambda _c: _c in cpath, dag.successors(v)), None)
-                w_v = math.ceil(dag[v][vc][RATE] / (dag[vp][v][RATE] * N)) * dag[v][vc][DATA] if vc else 0
-                sum_lat += n_v * (t_v - dag[vp][v][DATA] + w_v) * X[v][j]
-            # Add knapsack constraint for operative memory demand
-            vj_sat = min(math.ceil(R_v / R_j), N)
-            # Add only non-trivial memory constraint
-            if vj_sat > 1 and M < math.inf:
-                model += vj_sat * dag.nodes[v][MEMORY] * X[v][j] <= M, f"Ck2_{j:02d}_{v:02d}"
-            # Connectivity constraint
-            for u in dag.predecessors(v):
-                if j in X[u]:
-                    model += X[u][j] - X[v][j] >= 0, f"Cc_{j:02d}_{u:02d}_{v:02d}"
+        # u -> v edges on cpath
+        for v in filter(lambda _v: _v in cpath, blk):
+            vp = next(filter(lambda _p: _p in cpath, dag.predecessors(v)), None)
+            vpp = next(filter(lambda _p: _p in cpath or _p is PLATFORM, dag.predecessors(vp)), None)
+            n_v *= math.ceil(dag[vp][v][RATE] / (dag[vpp][vp][RATE] * N))
+            vc = next(filter(lambda _c: _c in cpath, dag.successors(v)), None)
+            w_v = math.ceil(dag[v][vc][RATE] / (dag[vp][v][RATE] * N)) * dag[v][vc][DATA] if vc else 0
+            sum_lat.append((C[v][j], n_v * (dag.nodes[v][RUNTIME] - dag[vp][v][DATA] + w_v)))
+        # Add only non-trivial knapsack constraints for operative memory demand
+        if M < math.inf:
+            sat = [(v, vj_sat) for v in blk if (vj_sat := min(math.ceil(R[v] / R_j), N)) > 1]
+            model.add_constraints(range(len(sat)), [C[v][j] for v, _ in sat], [n * mem[v] for v, n in sat],
+                                  lp.LpConstraintLE, [M] * len(sat), names=[f"Ck2_{j:02d}_{v:02d}" for v, _ in sat])
+        # Connectivity constraints
+        edges = [(u, v) for v in blk for u in dag.predecessors(v) if j in C[u]]
+        model.add_difference_constraints([C[u][j] for u, _ in edges], [C[v][j] for _, v in edges],
+                                         lp.LpConstraintGE, names=[f"Cc_{j:02d}_{u:02d}_{v:02d}" for u, v in edges])
         # Knapsack constraint, X[l][l] <= M for each leaf node l can be omitted
-        if len(blk_mem) > 1 and M < math.inf:
-            model += blk_mem <= M, f"Ck_{j:02d}"
+        blk_nodes = blk if j == root else [j, *blk]
+        if len(blk_nodes) > 1 and M < math.inf:
+            model.add_constraints([0] * len(blk_nodes), [C[v][j] for v in blk_nodes], [mem[v] for v in blk_nodes],
+                                  lp.LpConstraintLE, [M - mem[j] if j == root else M], names=[f"Ck_{j:02d}"])
     # Path-tree constraints
     if subchains:
-        for j in X:
-            for v in iclosed_subgraph(dag, source=j):
-                model += lp.lpSum(X[s][j] for s in dag.successors(v) if j in X[s]) <= 1, f"Cpp_{j:02d}_{v:02d}"
-    # Objective
-    model += sum_cost
+        paths = [(v, j) for j in C for v in iclosed_subgraph(dag, source=j)]
+        model.add_sum_constraints([[C[s][j] for s in dag.successors(v) if j in C[s]] for v, j in paths],
+                                  lp.LpConstraintLE, 1, names=[f"Cpp_{j:02d}_{v:02d}" for v, j in paths])
     # Feasibility constraints, X[root][root] = 1 can be omitted else it ensures that X[root][root] must be 1
-    for i in filter(lambda x: x != root, X):
-        model += lp.lpSum(X[i].values()) == 1, f"Cf_{i:02d}"
+    feasible = [i for i in C if i != root]
+    model.add_sum_constraints([list(C[i].values()) for i in feasible], lp.LpConstraintEQ, 1,
+                              names=[f"Cf_{i:02d}" for i in feasible])
     # Latency constraint
     if L < math.inf:
-        model += sum_lat <= L, LP_LAT
+        model.add_constraint(sum_lat, lp.LpConstraintLE, L, name=LP_LAT)
     else:
         # Add redundant constraint to implicitly calculate the latency value
-        model += sum_lat >= 0, LP_LAT
-    return model, X
+        model.add_constraint(sum_lat, lp.LpConstraintGE, 0, name=LP_LAT)
+    return model, C
+
+
+def build_dag_mtx_model(dag: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                        M: int = math.inf, L: int = math.inf, N: int = 1, cpath: set[int] = frozenset(), delay: int = 1,
+                        subchains: bool = False) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+    """
+    Generate the matrix ILP model based on parallel metric calculations.
+
+    The PuLP model is materialized at once from the sparse model of :func:`build_dag_mtx_arrays`.
+
+    :return: tuple of the created model and list of decision variables
+    """
+    model, C = build_dag_mtx_arrays(dag, root, M, L, N, cpath, delay, subchains)
+    return model.to_problem(), decision_matrix(model, C)
 
 
 def dag_partitioning(dag: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                      N: int = 1, cp_end: int = None, delay: int = 1, subchains: bool = False,
-                     solver: lp.LpSolver = None, timeout: int = None, **lpargs) -> T_RESULTS:
+                     solver: lp.LpSolver = None, timeout: int = None, warm_start: T_PART = None,
+                     **lpargs) -> T_RESULTS:
     """
     Calculate minimal-cost partitioning of a DAG based on matrix LP formulation.
 
@@ -243,6 +263,7 @@ def dag_partitioning(dag: nx.DiGraph, root: int = 1, M: int = math.inf, L: int =
     :param subchains:   only subchain blocks are considered (path-tree)
     :param solver:      specific solver class (default: COIN-OR CBC)
     :param timeout:     time limit in sec
+    :param warm_start:  initial partitioning as a starting solution (ignored by, e.g., SCIPY_MILP)
     :param lpargs:      additional LP solver parameters
     :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
@@ -252,12 +273,17 @@ def dag_partitioning(dag: nx.DiGraph, root: int = 1, M: int = math.inf, L: int =
     if not all(verify_limits(dag, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    model, X = build_dag_mtx_model(dag, root, M, L, N, cpath, delay, subchains)
+    model, C = build_dag_mtx_arrays(dag, root, M, L, N, cpath, delay, subchains)
     solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
     solver.timeLimit = timeout
+    # Initial values are passed to a copy of the solver only if the whole DAG is covered
+    if (warm_start and solver.name in WARM_START_SOLVERS
+            and init_xmatrix_from_partition(decision_matrix(model, C), warm_start)):
+        solver = warm_start_solver(solver)
     status = model.solve(solver=solver, **lpargs)
     if status == lp.LpStatusOptimal:
-        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
-        return extract_subtrees_from_xmatrix(X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+        opt_cost, opt_lat = round(model.objective_value(), 0), round(model.constraint_value(LP_LAT), 0)
+        partition = extract_subtrees_from_xmatrix(solution_matrix(model, C))
+        return partition, opt_cost, L + opt_lat if L < math.inf else opt_lat
     else:
         return INFEASIBLE
@@ -20,6 +20,7 @@ import networkx as nx
 
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import RATE, DATA, PLATFORM
+from slambuc.alg.app.compact import as_digraph
 from slambuc.alg.util import recreate_subtree_blocks, recalculate_partitioning
 
 
@@ -77,6 +78,7 @@ def min_weight_ksplit(tree: nx.DiGraph, root: int, k: int) -> set[int]:
     :param k:       number of clusters
     :return:        set of barrier nodes
     """
+    tree = as_digraph(tree)
     dist_tree = nx.to_undirected(tree)
     # Define distance of two nodes as the reciprocal of the sum transferred data between the nodes
     D = {(u, v): sum(1 / (attr[RATE] * attr[DATA]) if attr[RATE] and attr[DATA] else 0
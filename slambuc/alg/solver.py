@@ -0,0 +1,566 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import importlib.util
+import itertools
+import math
+import time
+import typing
+
+import numpy as np
+import pulp as lp
+
+
+class MILPArrays(typing.NamedTuple):
+    """Store the array form of a PuLP model in the form of ``min c^T x s.t. lb_A <= A x <= ub_A, lb <= x <= ub``."""
+    names: list[str]  # Variable names in column order
+    c: np.ndarray  # Objective coefficients
+    offset: float  # Constant term of the objective
+    rows: np.ndarray  # Row indices of the nonzero constraint coefficients (COO format)
+    cols: np.ndarray  # Column indices of the nonzero constraint coefficients (COO format)
+    vals: np.ndarray  # Nonzero constraint coefficients (COO format)
+    lb_A: np.ndarray  # Lower bounds of constraint rows
+    ub_A: np.ndarray  # Upper bounds of constraint rows
+    lb: np.ndarray  # Lower bounds of variables
+    ub: np.ndarray  # Upper bounds of variables
+    integrality: np.ndarray  # Integrality flags of variables
+
+
+def model_to_arrays(model: lp.LpProblem) -> MILPArrays:
+    """
+    Convert the given PuLP *model* into in-memory arrays of a minimization problem.
+
+    :param model:   PuLP model
+    :return:        array form of the model
+    """
+    variables = model.variables()
+    idx = {v.name: i for i, v in enumerate(variables)}
+    sign = -1 if model.sense == lp.LpMaximize else 1
+    # Objective
+    c = np.zeros(len(variables))
+    for v, coeff in model.objective.items():
+        c[idx[v.name]] = sign * coeff
+    offset = sign * model.objective.constant
+    # Constraints in COO format with row bounds
+    rows, cols, vals, lb_A, ub_A = [], [], [], [], []
+    for i, constr in enumerate(model.constraints.values()):
+        for v, coeff in constr.items():
+            rows.append(i)
+            cols.append(idx[v.name])
+            vals.append(coeff)
+        rhs = -constr.constant
+        lb_A.append(rhs if constr.sense in (lp.LpConstraintGE, lp.LpConstraintEQ) else -math.inf)
+        ub_A.append(rhs if constr.sense in (lp.LpConstraintLE, lp.LpConstraintEQ) else math.inf)
+    # Variable bounds and types
+    lb = np.array([v.lowBound if v.lowBound is not None else -math.inf for v in variables], dtype=float)
+    ub = np.array([v.upBound if v.upBound is not None else math.inf for v in variables], dtype=float)
+    integrality = np.array([v.cat == lp.LpInteger for v in variables], dtype=np.uint8)
+    return MILPArrays([v.name for v in variables], c, offset, np.array(rows, dtype=np.int64),
+                      np.array(cols, dtype=np.int64), np.array(vals, dtype=float), np.array(lb_A, dtype=float),
+                      np.array(ub_A, dtype=float), lb, ub, integrality)
+
+
+class SCIPY_MILP(lp.LpSolver):
+    """
+    In-process MILP solver backend that passes PuLP models to the HiGHS solver of :func:`scipy.optimize.milp`
+    via in-memory arrays.
+
+    Compared to the command-line solvers, e.g., :class:`pulp.PULP_CBC_CMD`, it avoids writing model and solution
+    files and spawning a solver process for each solve, which dominates the overall runtime of small models.
+    Can be used in place of any PuLP solver via the ``solver`` parameter of the ILP-based algorithms.
+
+    If *mip* is not set, the LP relaxation is solved by :func:`scipy.optimize.linprog` and the dual values of the
+    constraints are also assigned to the model, e.g., for column generation.
+    """
+    name = 'SCIPY_MILP'
+
+    def __init__(self, mip: bool = True, msg: bool = True, timeLimit: float = None, gapRel: float = None,
+                 **solverParams):
+        """
+        Initialize the solver backend.
+
+        :param mip:             solve the problem as MIP (otherwise, the LP relaxation is solved)
+        :param msg:             show solver output
+        :param timeLimit:       time limit in sec
+        :param gapRel:          relative MIP gap
+        :param solverParams:    additional options of :func:`scipy.optimize.milp`
+        """
+        super().__init__(mip=mip, msg=msg, timeLimit=timeLimit, gapRel=gapRel, **solverParams)
+
+    def available(self) -> bool:
+        """Check whether SciPy's MILP interface is available."""
+        return importlib.util.find_spec('scipy') is not None
+
+    def actualSolve(self, model: lp.LpProblem, **kwargs) -> int:
+        """
+        Solve the given *model* in-process and assign the solution values to the model's variables.
+
+        :param model:   PuLP model
+        :param kwargs:  unused solver arguments
+        :return:        PuLP status of the solution
+        """
+        if not self.available():
+            raise lp.PulpSolverError(f"{self.name}: SciPy is not available")
+        arrays = model_to_arrays(model)
+        if not self.mip:
+            return self._solve_relaxation(model, arrays, self._constraints(arrays), self._options())
+        start = time.perf_counter()
+        status, sol_status, x = self.solve_arrays(arrays)
+        model.solutionTime = time.perf_counter() - start
+        if x is not None:
+            model.assignVarsVals(dict(zip(arrays.names, x.tolist())))
+        model.assignStatus(status, sol_status)
+        return status
+
+    @staticmethod
+    def _constraints(arrays: MILPArrays) -> typing.Any:
+        """Return the constraint matrix with row bounds of the given *arrays* or None if there is no constraint."""
+        import scipy.optimize
+        import scipy.sparse
+        if not len(arrays.lb_A):
+            return None
+        A = scipy.sparse.csr_array((arrays.vals, (arrays.rows, arrays.cols)),
+                                   shape=(len(arrays.lb_A), len(arrays.names)))
+        return scipy.optimize.LinearConstraint(A, arrays.lb_A, arrays.ub_A)
+
+    def _options(self) -> dict:
+        """Return the HiGHS options of :func:`scipy.optimize.milp` based on the solver parameters."""
+        # Additional solver parameters are passed directly to SciPy
+        options = {k: v for k, v in self.optionsDict.items() if k != 'gapRel'}
+        options['disp'] = bool(self.msg)
+        if self.timeLimit is not None:
+            options['time_limit'] = float(self.timeLimit)
+        if 'gapRel' in self.optionsDict:
+            options['mip_rel_gap'] = float(self.optionsDict['gapRel'])
+        return options
+
+    def solve_arrays(self, arrays: MILPArrays) -> tuple[int, int, np.ndarray | None]:
+        """
+        Solve the MILP given directly in array form, e.g., by :meth:`SparseLpModel.to_arrays`, without a PuLP model.
+
+        :param arrays:  array form of the model
+        :return:        PuLP model and solution statuses and the solution values in column order (or None)
+        """
+        if not self.available():
+            raise lp.PulpSolverError(f"{self.name}: SciPy is not available")
+        import scipy.optimize
+        res = scipy.optimize.milp(arrays.c, integrality=arrays.integrality,
+                                  bounds=scipy.optimize.Bounds(arrays.lb, arrays.ub),
+                                  constraints=self._constraints(arrays), options=self._options())
+        # Map SciPy's status codes to PuLP's model and solution statuses
+        if res.status == 0:
+            status, sol_status = lp.LpStatusOptimal, lp.LpSolutionOptimal
+        elif res.status == 1 and res.x is not None:
+            status, sol_status = lp.LpStatusOptimal, lp.LpSolutionIntegerFeasible
+        elif res.status == 2:
+            status, sol_status = lp.LpStatusInfeasible, lp.LpSolutionInfeasible
+        elif res.status == 3:
+            status, sol_status = lp.LpStatusUnbounded, lp.LpSolutionUnbounded
+        else:
+            status, sol_status = lp.LpStatusNotSolved, lp.LpSolutionNoSolutionFound
+        x = np.where(arrays.integrality, np.rint(res.x), res.x) if res.x is not None else None
+        return status, sol_status, x
+
+    @staticmethod
+    def _solve_relaxation(model: lp.LpProblem, arrays: MILPArrays, constraints: typing.Any, options: dict) -> int:
+        """
+        Solve the LP relaxation of the given *model* in-process and assign the primal and dual solution values.
+
+        :param model:       PuLP model
+        :param arrays:      array form of the model
+        :param constraints: constraint matrix with row bounds (None if the model has no constraints)
+        :param options:     HiGHS options
+        :return:            PuLP status of the solution
+        """
+        import scipy.optimize
+        import scipy.sparse
+        A_ub = b_ub = A_eq = b_eq = None
+        eq = ub = lb = np.empty(0, dtype=np.int64)
+        if constraints is not None:
+            # Split ranged rows into equality and upper-bounded inequality rows as expected by linprog
+            A = constraints.A
+            is_eq = arrays.lb_A == arrays.ub_A
+            eq = np.flatnonzero(is_eq)
+            ub = np.flatnonzero(~is_eq & np.isfinite(arrays.ub_A))
+            lb = np.flatnonzero(~is_eq & np.isfinite(arrays.lb_A))
+            if len(eq):
+                A_eq, b_eq = A[eq], arrays.ub_A[eq]
+            if len(ub) or len(lb):
+                A_ub = scipy.sparse.vstack((A[ub], -A[lb]), format='csr')
+                b_ub = np.concatenate((arrays.ub_A[ub], -arrays.lb_A[lb]))
+        options = {k: v for k, v in options.items() if k != 'mip_rel_gap'}
+        start = time.perf_counter()
+        res = scipy.optimize.linprog(arrays.c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                                     bounds=np.column_stack((arrays.lb, arrays.ub)), method='highs', options=options)
+        model.solutionTime = time.perf_counter() - start
+        if res.status == 0:
+            status, sol_status = lp.LpStatusOptimal, lp.LpSolutionOptimal
+        elif res.status == 2:
+            status, sol_status = lp.LpStatusInfeasible, lp.LpSolutionInfeasible
+        elif res.status == 3:
+            status, sol_status = lp.LpStatusUnbounded, lp.LpSolutionUnbounded
+        else:
+            status, sol_status = lp.LpStatusNotSolved, lp.LpSolutionNoSolutionFound
+        if res.status == 0:
+            model.assignVarsVals(dict(zip(arrays.names, res.x.tolist())))
+            # Dual values of the minimization form are the objective sensitivities wrt. the row bounds
+            pi = np.zeros(len(arrays.lb_A))
+            if len(eq):
+                pi[eq] = res.eqlin.marginals
+            if len(ub) or len(lb):
+                pi[ub] += res.ineqlin.marginals[:len(ub)]
+                pi[lb] -= res.ineqlin.marginals[len(ub):]
+            sign = -1 if model.sense == lp.LpMaximize else 1
+            model.assignConsPi({name: sign * y for name, y in zip(model.constraints, pi.tolist())})
+        model.assignStatus(status, sol_status)
+        return status
+
+
+# PuLP solver interfaces that use the initial values of decision variables as a starting solution
+WARM_START_SOLVERS = ('COIN_CMD', 'PULP_CBC_CMD', 'CPLEX_CMD', 'CPLEX_PY', 'GUROBI', 'GUROBI_CMD')
+
+
+def warm_start_solver(solver: lp.LpSolver) -> lp.LpSolver:
+    """
+    Return a copy of the given *solver* that uses the initial values of decision variables as a warm start.
+
+    The given solver is left intact. Solvers without warm start support, e.g., :class:`SCIPY_MILP` or GLPK, are
+    returned as is, hence the initial values are ignored by them.
+
+    :param solver:  PuLP solver
+    :return:        solver configured for warm start
+    """
+    if solver.name not in WARM_START_SOLVERS:
+        return solver
+    solver = copy.copy(solver)
+    solver.optionsDict = dict(solver.optionsDict, warmStart=True)
+    return solver
+
+########################################################################################################################
+
+
+class SparseLpModel:
+    """
+    Collect the variables, objective and constraint coefficients of a linear model directly in sparse (CSR) form
+    and solve it from in-memory arrays or materialize it as a PuLP model at once.
+
+    Compared to growing :class:`pulp.LpAffineExpression` objects term by term with operator overloading, it avoids
+    the creation of intermediate expression objects while building large models. Variables are referred to by their
+    column indices, while the column index *None* denotes the constant 1, e.g., for trivial decision variables.
+    Coefficients of multiple variables and constraints can be added at once in array form, and PuLP variables are
+    created only on demand, e.g., by :meth:`to_problem` for solvers other than :class:`SCIPY_MILP`.
+    """
+
+    def __init__(self, name: str = "NoName", sense: int = lp.LpMinimize):
+        """
+        Initialize empty model.
+
+        :param name:    name of the model
+        :param sense:   objective sense
+        """
+        self.name, self.sense = name, sense
+        # Variable attributes in column order
+        self.var_names: list[str] = []
+        self.cats: list[str] = []
+        self.lows: list[float | None] = []
+        self.ups: list[float | None] = []
+        self._variables: list[lp.LpVariable] = []
+        # Objective terms in COO format, repeated columns are summed up
+        self.obj_cols: list[int] = []
+        self.obj_vals: list[float] = []
+        self.offset = 0
+        # Constraint coefficients in CSR format as constraints are added at once
+        self.indptr: list[int] = [0]
+        self.cols: list[int] = []
+        self.vals: list[float] = []
+        # Constraint attributes in the form of sum(coeff * x) + const <sense> 0
+        self.senses: list[int] = []
+        self.consts: list[float] = []
+        self.names: list[str | None] = []
+        # Solution of the last solve
+        self.status = lp.LpStatusNotSolved
+        self.values: np.ndarray | None = None
+
+    @property
+    def variables(self) -> list[lp.LpVariable]:
+        """PuLP variables of the model in column order created on demand."""
+        for i in range(len(self._variables), len(self.var_names)):
+            self._variables.append(lp.LpVariable(self.var_names[i], lowBound=self.lows[i], upBound=self.ups[i],
+                                                 cat=self.cats[i]))
+        return self._variables
+
+    @property
+    def objective(self) -> dict[int, float]:
+        """Nonzero objective coefficients with summed up repeated columns."""
+        objective = {}
+        for col, coeff in zip(self.obj_cols, self.obj_vals):
+            objective[col] = objective.get(col, 0) + coeff
+        return {col: coeff for col, coeff in objective.items() if coeff}
+
+    def add_variable(self, name: str, cat: str = lp.LpBinary, low: float = None, up: float = None) -> int:
+        """
+        Add new decision variable to the model.
+
+        :param name:    variable name
+        :param cat:     variable category
+        :param low:     lower bound
+        :param up:      upper bound
+        :return:        column index of the variable
+        """
+        return self.add_variables((name,), cat, low, up)[0]
+
+    def add_variables(self, names: typing.Iterable[str], cat: str = lp.LpBinary, low: float = None,
+                      up: float = None) -> range:
+        """
+        Add new decision variables of the same category and bounds to the model at once.
+
+        :param names:   variable names
+        :param cat:     variable category
+        :param low:     lower bound
+        :param up:      upper bound
+        :return:        column indices of the variables
+        """
+        start = len(self.var_names)
+        self.var_names.extend(names)
+        n = len(self.var_names) - start
+        # Binary variables are integers within [0, 1] as in PuLP
+        if cat == lp.LpBinary:
+            cat, low, up = lp.LpInteger, 0, 1
+        self.cats.extend(itertools.repeat(cat, n))
+        self.lows.extend(itertools.repeat(low, n))
+        self.ups.extend(itertools.repeat(up, n))
+        return range(start, start + n)
+
+    def add_objective(self, col: int | None, coeff: float):
+        """
+        Add the given term to the objective.
+
+        :param col:     column index of the variable or None for a constant term
+        :param coeff:   coefficient (zero terms are omitted)
+        """
+        if col is None:
+            self.offset += coeff
+        elif coeff:
+            self.obj_cols.append(col)
+            self.obj_vals.append(coeff)
+
+    def add_objectives(self, cols: typing.Sequence[int] | np.ndarray, coeffs: typing.Sequence[float] | np.ndarray):
+        """
+        Add the given terms of variables to the objective at once.
+
+        :param cols:    column indices of the variables
+        :param coeffs:  coefficients
+        """
+        self.obj_cols.extend(np.asarray(cols, dtype=np.int64).tolist())
+        self.obj_vals.extend(np.asarray(coeffs).tolist())
+
+    def add_constraint(self, terms: typing.Iterable[tuple[int | None, float]], sense: int, rhs: float = 0,
+                       name: str = None) -> int:
+        """
+        Add the constraint of ``sum(coeff * x) <sense> rhs`` given by the (column, coefficient) pairs of *terms*.
+
+        :param terms:   pairs of column index and coefficient (repeated columns are summed up, zero terms are omitted)
+        :param sense:   constraint sense
+        :param rhs:     right-hand side
+        :param name:    constraint name
+        :return:        row index of the constraint
+        """
+        row, const, coeffs = len(self.senses), -rhs, {}
+        for col, coeff in terms:
+            if col is None:
+                const += coeff
+            elif coeff:
+                coeffs[col] = coeffs.get(col, 0) + coeff
+        self.cols.extend(coeffs)
+        self.vals.extend(coeffs.values())
+        self.indptr.append(len(self.cols))
+        self.senses.append(sense)
+        self.consts.append(const)
+        self.names.append(name)
+        return row
+
+    def add_constraints(self, rows: typing.Sequence[int] | np.ndarray, cols: typing.Sequence[int] | np.ndarray,
+                        vals: typing.Sequence[float] | np.ndarray, sense: int, rhs: typing.Sequence[float] | np.ndarray,
+                        names: typing.Iterable[str] = None) -> range:
+        """
+        Add the constraints of ``sum(coeff * x) <sense> rhs`` with the same *sense* at once given in COO format.
+
+        The local row indices of the coefficients must be in non-decreasing order, while the columns of a row must
+        be unique. Constraints without coefficients are also added.
+
+        :param rows:    local row indices of the coefficients in the range of *rhs*
+        :param cols:    column indices of the coefficients
+        :param vals:    coefficients
+        :param sense:   common constraint sense
+        :param rhs:     right-hand sides of the constraints
+        :param names:   constraint names
+        :return:        row indices of the constraints
+        """
+        start, rhs = len(self.senses), np.asarray(rhs, dtype=float)
+        counts = np.bincount(np.asarray(rows, dtype=np.int64), minlength=len(rhs))
+        self.indptr.extend((np.cumsum(counts) + len(self.cols)).tolist())
+        self.cols.extend(np.asarray(cols, dtype=np.int64).tolist())
+        self.vals.extend(np.asarray(vals).tolist())
+        self.senses.extend(itertools.repeat(sense, len(rhs)))
+        self.consts.extend((-rhs).tolist())
+        self.names.extend(names if names is not None else itertools.repeat(None, len(rhs)))
+        return range(start, len(self.senses))
+
+    def add_sum_constraints(self, groups: typing.Sequence[typing.Sequence[int]], sense: int, rhs: float = 0,
+                            names: typing.Iterable[str] = None) -> range:
+        """
+        Add the constraints of ``sum(x) <sense> rhs`` for each group of unique column indices at once.
+
+        :param groups:  column indices of the summed variables for each constraint
+        :param sense:   common constraint sense
+        :param rhs:     common right-hand side
+        :param names:   constraint names
+        :return:        row indices of the constraints
+        """
+        sizes = np.fromiter(map(len, groups), dtype=np.int64, count=len(groups))
+        cols = np.fromiter(itertools.chain.from_iterable(groups), dtype=np.int64, count=int(sizes.sum()))
+        return self.add_constraints(np.repeat(np.arange(len(groups)), sizes), cols, np.ones(len(cols)), sense,
+                                    np.full(len(groups), rhs, dtype=float), names)
+
+    def add_difference_constraints(self, pos: typing.Sequence[int | None], neg: typing.Sequence[int], sense: int,
+                                   rhs: float = 0, names: typing.Iterable[str] = None) -> range:
+        """
+        Add the constraints of ``x_pos - x_neg <sense> rhs`` for each pair of columns at once, where the column
+        index *None* in *pos* denotes the constant 1.
+
+        :param pos:     column indices of the positive terms
+        :param neg:     column indices of the negative terms
+        :param sense:   common constraint sense
+        :param rhs:     common right-hand side
+        :param names:   constraint names
+        :return:        row indices of the constraints
+        """
+        pos = np.array([c if c is not None else -1 for c in pos], dtype=np.int64)
+        neg, idx = np.asarray(neg, dtype=np.int64), np.arange(len(pos))
+        is_var = pos >= 0
+        # Keep the positive term before the negative term within each row
+        rows = np.concatenate((idx[is_var], idx))
+        order = np.argsort(rows, kind='stable')
+        cols = np.concatenate((pos[is_var], neg))[order]
+        vals = np.concatenate((np.ones(np.count_nonzero(is_var)), -np.ones(len(neg))))[order]
+        # Constant terms are moved to the right-hand side
+        return self.add_constraints(rows[order], cols, vals, sense, rhs - (~is_var), names)
+
+    def csr(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the constraint coefficients in CSR format.
+
+        :return:    tuple of row pointers, column indices and coefficients
+        """
+        return (np.asarray(self.indptr, dtype=np.int64), np.asarray(self.cols, dtype=np.int64),
+                np.asarray(self.vals, dtype=float))
+
+    def to_problem(self) -> lp.LpProblem:
+        """
+        Materialize the collected model as a PuLP model.
+
+        :return:    PuLP model
+        """
+        model = lp.LpProblem(name=self.name, sense=self.sense)
+        variables = self.variables
+        model.setObjective(lp.LpAffineExpression(((variables[c], a) for c, a in self.objective.items()),
+                                                 constant=self.offset))
+        for (start, end), sense, const, name in zip(itertools.pairwise(self.indptr), self.senses, self.consts,
+                                                     self.names):
+            expr = lp.LpAffineExpression(zip(map(variables.__getitem__, self.cols[start:end]), self.vals[start:end]),
+                                         constant=const)
+            model.addConstraint(lp.LpConstraint(expr, sense=sense, name=name))
+        return model
+
+    def to_arrays(self) -> MILPArrays:
+        """
+        Return the collected model in array form of a minimization problem without creating a PuLP model.
+
+        :return:    array form of the model
+        """
+        sign = -1 if self.sense == lp.LpMaximize else 1
+        c = sign * np.bincount(np.asarray(self.obj_cols, dtype=np.int64),
+                               weights=np.asarray(self.obj_vals, dtype=float), minlength=len(self.var_names))
+        indptr, cols, vals = self.csr()
+        rows = np.repeat(np.arange(len(self.senses), dtype=np.int64), np.diff(indptr))
+        consts, senses = -np.asarray(self.consts, dtype=float), np.asarray(self.senses)
+        lb_A = np.where((senses == lp.LpConstraintGE) | (senses == lp.LpConstraintEQ), consts, -math.inf)
+        ub_A = np.where((senses == lp.LpConstraintLE) | (senses == lp.LpConstraintEQ), consts, math.inf)
+        lb = np.array([low if low is not None else -math.inf for low in self.lows], dtype=float)
+        ub = np.array([up if up is not None else math.inf for up in self.ups], dtype=float)
+        integrality = np.array([cat == lp.LpInteger for cat in self.cats], dtype=np.uint8)
+        return MILPArrays(list(self.var_names), c, sign * self.offset, rows, cols, vals, lb_A, ub_A, lb, ub,
+                          integrality)
+
+    def solve(self, solver: lp.LpSolver = None, **kwargs) -> int:
+        """
+        Solve the model and store the solution values of the variables in column order in :attr:`values`.
+
+        MIP models are passed to :class:`SCIPY_MILP` directly in array form, while other solvers get the materialized
+        PuLP model. The initial values of the PuLP variables are used as a warm start by the supporting solvers.
+
+        :param solver:  PuLP solver (default: COIN-OR CBC)
+        :param kwargs:  additional arguments of :meth:`pulp.LpProblem.solve`
+        :return:        PuLP status of the solution
+        """
+        solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
+        if isinstance(solver, SCIPY_MILP) and solver.mip:
+            self.status, _, self.values = solver.solve_arrays(self.to_arrays())
+        else:
+            self.status = self.to_problem().solve(solver, **kwargs)
+            self.values = np.array([v.varValue if v.varValue is not None else math.nan for v in self.variables])
+        return self.status
+
+    def objective_value(self) -> float:
+        """
+        Return the objective value of the last solution.
+
+        :return:    objective value
+        """
+        return float(np.dot(np.asarray(self.obj_vals, dtype=float), self.values[self.obj_cols]) + self.offset)
+
+    def constraint_value(self, name: str) -> float:
+        """
+        Return the value of the expression ``sum(coeff * x) + const`` of the named constraint in the last solution.
+
+        :param name:    constraint name
+        :return:        constraint value
+        """
+        row = self.names.index(name)
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return float(np.dot(self.vals[start:end], self.values[self.cols[start:end]]) + self.consts[row])
+
+
+def decision_matrix(model: SparseLpModel, C: dict[int, dict[int, int | None]]) -> dict[int, dict[int, lp.LpVariable]]:
+    """
+    Convert the matrix of column indices into the matrix of the corresponding decision variables.
+
+    :param model:   sparse model
+    :param C:       dict-of-dict of column indices with None denoting the constant 1
+    :return:        dict-of-dict of decision variables
+    """
+    variables = model.variables
+    return {i: {j: variables[c] if c is not None else 1 for j, c in C_i.items()} for i, C_i in C.items()}
+
+
+def solution_matrix(model: SparseLpModel, C: dict[int, dict[int, int | None]]) -> dict[int, dict[int, int]]:
+    """
+    Convert the matrix of column indices into the matrix of the rounded solution values of the last solve.
+
+    :param model:   solved sparse model
+    :param C:       dict-of-dict of column indices with None denoting the constant 1
+    :return:        dict-of-dict of solution values
+    """
+    values = np.rint(model.values).astype(int).tolist()
+    return {i: {j: values[c] if c is not None else 1 for j, c in C_i.items()} for i, C_i in C.items()}
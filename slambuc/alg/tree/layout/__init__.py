@@ -11,4 +11,5 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from .ilp import tree_gen_hybrid_partitioning, tree_gen_mtx_partitioning, all_gen_tree_mtx_partitioning
+from .ilp import (tree_gen_hybrid_partitioning, tree_gen_mtx_partitioning, all_gen_tree_mtx_partitioning,
+                  tree_gen_colgen_partitioning)
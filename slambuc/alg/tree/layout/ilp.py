@@ -13,6 +13,7 @@
 # limitations under the License.
 import collections
 import itertools
+import typing
 from collections.abc import Generator
 
 import networkx as nx
@@ -20,6 +21,9 @@ import pulp as lp
 
 from slambuc.alg import LP_LAT, INFEASIBLE, T_FRESULTS, T_FPART
 from slambuc.alg.app.common import *
+from slambuc.alg.ext.greedy import min_lat_partition_heuristic, min_weight_greedy_partitioning
+from slambuc.alg.solver import warm_start_solver
+from slambuc.alg.tree.serial.ilp import BlockMetrics, solve_cfg_colgen_model
 from slambuc.alg.util import (ipowerset, ipostorder_dfs, ibacktrack_chain, gen_subtree_memory, gen_subtree_cost,
                               gen_subchain_latency, recreate_subtree_blocks, x_eval)
 
@@ -49,8 +53,9 @@ def ifeasible_gen_subtrees(tree: nx.DiGraph, root: int, M: int, N: int = 1) -> G
 
 def build_gen_tree_cfg_model(tree: nx.DiGraph, root: int = 1, flavors: list[Flavor] = (Flavor(),),
                              exec_calc: collections.abc.Callable[[int, int, int], int] = lambda i, t, n: t,
-                             L: int = math.inf, cp_end: int = None,
-                             delay: int = 1) -> tuple[lp.LpProblem, dict[Flavor, dict[int, list[lp.LpVariable]]]]:
+                             L: int = math.inf, cp_end: int = None, delay: int = 1,
+                             isubtrees: typing.Callable = ifeasible_gen_subtrees) -> tuple[
+    lp.LpProblem, dict[Flavor, dict[int, list[lp.LpVariable]]]]:
     """
     Generate the configuration ILP model with the given *flavors*.
 
@@ -63,7 +68,7 @@ def build_gen_tree_cfg_model(tree: nx.DiGraph, root: int = 1, flavors: list[Flav
     # Decision variables with precalculated coefficients
     c_x, l_x, X = [], [], {f: {v: list() for v in tree if v is not PLATFORM} for f in flavors}
     for fi, f in enumerate(flavors):
-        for i, (b, nodes) in enumerate(ifeasible_gen_subtrees(tree, root, f.mem, f.ncore)):
+        for i, (b, nodes) in enumerate(isubtrees(tree, root, f.mem, f.ncore)):
             # Decision variable for the subtree
             x = lp.LpVariable(f"x_{fi}_{b:02d}_{i}", cat=lp.LpBinary)
             # Add subtree block cost
@@ -118,6 +123,58 @@ def tree_gen_hybrid_partitioning(tree: nx.DiGraph, root: int = 1, flavors: list[
         return INFEASIBLE
 
 
+def tree_gen_colgen_partitioning(tree: nx.DiGraph, root: int = 1, flavors: list[Flavor] = (Flavor(),),
+                                 exec_calc: collections.abc.Callable[[int, int, int], int] = lambda i, t, n: t,
+                                 L: int = math.inf, cp_end: int = None, delay: int = 1, solver: lp.LpSolver = None,
+                                 timeout: int = None, max_iter: int = 100, **lpargs) -> T_FRESULTS:
+    """
+    Calculate minimal-cost partitioning of a tree based on configuration LP formulation, given *flavors* and column
+    generation.
+
+    The restricted master problem is seeded with greedy partitioning blocks for each flavor and extended with subtree
+    columns priced by a tree knapsack DP instead of enumerating all feasible subtrees, then the ILP model is solved with
+    the generated columns and completed by the columns that can still improve the integer solution (see
+    :func:`solve_cfg_colgen_model`). The result is optimal unless the pricing is cut off by *max_iter* or *timeout*.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param flavors:     list of flavors resources given by the tuple of available *(memory, relative CPU cores)*
+    :param exec_calc:   function that calculates the effective runtimes from reference runtime and available CPU cores
+    :param L:           latency limit defined on the critical path (in ms)
+    :param cp_end:      tail node of the critical path in the form of subchain[root -> c_pend]
+    :param delay:       invocation delay between blocks
+    :param solver:      specific solver class (default: COIN-OR CBC)
+    :param timeout:     time limit in sec
+    :param max_iter:    maximum number of pricing iterations
+    :param lpargs:      additional LP solver parameters
+    :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
+    """
+    # Critical path
+    cpath = set(ibacktrack_chain(tree, root, cp_end))
+    metrics = [BlockMetrics(f.mem, lambda b, n, _f=f: gen_subtree_cost(tree, b, n, _f.ncore, exec_calc),
+                            lambda b, n, _f=f: gen_subtree_memory(tree, b, n, _f.ncore),
+                            lambda b, n, _f=f: gen_subchain_latency(tree, b, n, cpath, _f.ncore, exec_calc))
+               for f in flavors]
+    # Memory-bounded and latency-aware greedy partitioning of each flavor as initial columns
+    seeds = [min_weight_greedy_partitioning(tree, root, f.mem, f.ncore, delay, metrics=False)[0] +
+             min_lat_partition_heuristic(tree, root, f.mem, L, f.ncore, cp_end, delay, metrics=False)[0]
+             for f in flavors]
+
+    def build(cols: list[list[tuple[int, set[int]]]]) -> tuple[lp.LpProblem, dict]:
+        """Build the ILP model with the given subtree columns of each flavor."""
+        columns = dict(zip(((f.mem, f.ncore) for f in flavors), cols))
+        return build_gen_tree_cfg_model(tree, root, flavors, exec_calc, L, cp_end, delay,
+                                        isubtrees=lambda _t, _r, m, n: iter(columns[m, n]))
+
+    status, model, X = solve_cfg_colgen_model(tree, root, L, cpath, delay, metrics, seeds, build, solver, timeout,
+                                              max_iter, **lpargs)
+    if status == lp.LpStatusOptimal:
+        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
+        return recreate_st_from_gen_xdict(tree, X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+    else:
+        return INFEASIBLE
+
+
 def recreate_st_from_gen_xdict(tree: nx.DiGraph, X: dict[Flavor, dict[int, list[lp.LpVariable]]]) -> T_FPART:
     """
     Extract barrier nodes from variable names (x_{b}_{w}) and recreate partitioning blocks.
@@ -219,7 +276,8 @@ def build_gen_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int
 def tree_gen_mtx_partitioning(tree: nx.DiGraph, root: int = 1, flavors: list[Flavor] = (Flavor(),),
                               exec_calc: collections.abc.Callable[[int, int, int], int] = lambda i, t, n: t,
                               L: int = math.inf, cp_end: int = None, subchains: bool = False, delay: int = 1,
-                              solver: lp.LpSolver = None, timeout: int = None, **lpargs) -> T_FRESULTS:
+                              solver: lp.LpSolver = None, timeout: int = None, warm_start: T_FPART | bool = None,
+                              **lpargs) -> T_FRESULTS:
     """
     Calculate minimal-cost partitioning of a tree based on matrix LP formulation and given *flavors*.
 
@@ -233,12 +291,24 @@ def tree_gen_mtx_partitioning(tree: nx.DiGraph, root: int = 1, flavors: list[Fla
     :param delay:       invocation delay between blocks
     :param solver:      specific solver class (default: COIN-OR CBC)
     :param timeout:     time limit in sec
+    :param warm_start:  initial partitioning or True to use a greedy heuristic (ignored by, e.g., SCIPY_MILP)
     :param lpargs:      additional LP solver parameters
     :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
     model, X = build_gen_tree_mtx_model(tree, root, flavors, exec_calc, L, cp_end, subchains, delay)
     solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
     solver.timeLimit = timeout
+    if warm_start:
+        if warm_start is True:
+            # Greedy partitioning bounded by the largest flavor with the cheapest memory-feasible flavor of blocks
+            part, *_ = min_lat_partition_heuristic(tree, root, max(f.mem for f in flavors), L,
+                                                   max(f.ncore for f in flavors), cp_end, delay, metrics=False)
+            warm_start = [(blk, min(filter(lambda f: gen_subtree_memory(tree, blk[0], set(blk), f.ncore) <= f.mem,
+                                           flavors),
+                                    key=lambda f: gen_subtree_cost(tree, blk[0], set(blk), f.ncore, exec_calc),
+                                    default=flavors[-1])) for blk in part]
+        if init_gen_xmatrix_from_partition(X, warm_start):
+            solver = warm_start_solver(solver)
     status = model.solve(solver=solver, **lpargs)
     if status == lp.LpStatusOptimal:
         opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
@@ -258,6 +328,27 @@ def extract_st_from_gen_xmatrix(X: dict[Flavor, dict[int, dict[int, lp.LpVariabl
                   for f in X for j in sorted(X[f]) if x_eval(X[f][j][j]))
 
 
+def init_gen_xmatrix_from_partition(X: dict[Flavor, dict[int, dict[int, lp.LpVariable]]], partition: T_FPART) -> bool:
+    """
+    Set the initial values of decision variables based on the given *partition* to be used as a warm start.
+
+    :param X:           internal structure of decision variables
+    :param partition:   initial partitioning with assigned flavors
+    :return:            whether all nodes are covered by the given partitioning
+    """
+    for x in itertools.chain.from_iterable(x_v.values() for x_f in X.values() for x_v in x_f.values()):
+        x.setInitialValue(0)
+    covered = set()
+    for blk, f in partition:
+        if f not in X or (j := next((b for b in blk if all(b in X[f].get(v, ()) for v in blk)), None)) is None:
+            # Block cannot be represented in the model
+            return False
+        for v in blk:
+            X[f][v][j].setInitialValue(1)
+        covered.update(blk)
+    return covered == X[next(iter(X))].keys()
+
+
 ########################################################################################################################
 
 
@@ -13,6 +13,6 @@
 # limitations under the License.
 from .greedy import greedy_par_tree_partitioning
 from .ilp import (tree_par_cfg_partitioning, tree_par_hybrid_partitioning, tree_par_mtx_partitioning,
-                  all_par_tree_mtx_partitioning)
+                  all_par_tree_mtx_partitioning, tree_par_colgen_partitioning)
 from .pseudo import pseudo_par_ltree_partitioning
 from .pseudo_mp import pseudo_par_mp_ltree_partitioning
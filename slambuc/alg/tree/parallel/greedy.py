@@ -15,7 +15,8 @@ import math
 
 import networkx as nx
 
-from slambuc.alg import INFEASIBLE, T_RESULTS, T_BARRS_GEN
+from slambuc.alg import T_RESULTS, T_BARRS_GEN
+from slambuc.alg.tree.serial.greedy import bnb_tree_partitioning
 from slambuc.alg.util import (ipowerset, isubtrees, par_subtree_memory, ibacktrack_chain, par_subtree_cost,
                               par_subchain_latency)
 
@@ -45,6 +46,9 @@ def greedy_par_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     """
     Calculate minimal-cost partitioning of an app graph(tree) by greedily iterating over all possible cuttings.
 
+    Cuttings are enumerated in a depth-first branch-and-bound way, see
+    :func:`slambuc.alg.tree.serial.greedy.bnb_tree_partitioning`.
+
     Block metrics are calculated based on parallelized execution platform model.
 
     :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
@@ -56,24 +60,8 @@ def greedy_par_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     :param delay:   invocation delay between blocks
     :return:        tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
-    best_res, best_cost = [INFEASIBLE], math.inf
     cpath = set(ibacktrack_chain(tree, root, cp_end))
-    # Iterates over all possible cuttings
-    for barrs in isubtrees_exhaustive(tree, root, M, N):
-        partition = []
-        sum_cost = 0
-        for b, nodes in isubtrees(tree, barrs):
-            partition.append(nodes)
-            sum_cost += par_subtree_cost(tree, b, nodes, N)
-        partition.sort()
-        # Calculate blocks of critical path based on the partitioning
-        restricted_blk_lats = [par_subchain_latency(tree, blk[0], set(blk), cpath, N) for blk in partition]
-        sum_lat = sum(restricted_blk_lats) + (sum(map(bool, restricted_blk_lats)) - 1) * delay
-        if sum_lat <= L:
-            # Store partitioning with the same best cost for comparison
-            if sum_cost == best_cost:
-                best_res.append((partition, sum_cost, sum_lat))
-            # Initialize new best cost partitioning
-            elif sum_cost < best_cost:
-                best_res, best_cost = [(partition, sum_cost, sum_lat)], sum_cost
-    return best_res
+    return bnb_tree_partitioning(tree, root, M, L, cpath, delay,
+                                 cost=lambda b, nodes: par_subtree_cost(tree, b, nodes, N),
+                                 memory=lambda b, nodes: par_subtree_memory(tree, b, nodes, N),
+                                 latency=lambda b, nodes: par_subchain_latency(tree, b, nodes, cpath, N))
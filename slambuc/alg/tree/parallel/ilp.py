@@ -20,9 +20,13 @@ from collections.abc import Generator
 import networkx as nx
 import pulp as lp
 
-from slambuc.alg import LP_LAT, INFEASIBLE, T_RESULTS
+from slambuc.alg import LP_LAT, INFEASIBLE, T_RESULTS, T_PART
 from slambuc.alg.app import *
-from slambuc.alg.tree.serial.ilp import recreate_subtrees_from_xdict, extract_subtrees_from_xmatrix
+from slambuc.alg.ext.greedy import min_lat_partition_heuristic, min_weight_greedy_partitioning
+from slambuc.alg.solver import (SparseLpModel, decision_matrix, solution_matrix, WARM_START_SOLVERS,
+                                 warm_start_solver)
+from slambuc.alg.tree.serial.ilp import (recreate_subtrees_from_xdict, extract_subtrees_from_xmatrix,
+                                        init_xmatrix_from_partition, BlockMetrics, solve_cfg_colgen_model)
 from slambuc.alg.util import (ipowerset, par_subtree_memory, ipostorder_dfs, ibacktrack_chain, par_subtree_cost,
                               par_subchain_latency, induced_subtrees, par_inst_count, verify_limits, x_eval)
 
@@ -182,6 +186,55 @@ def tree_par_hybrid_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
         return INFEASIBLE
 
 
+def tree_par_colgen_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
+                                 N: int = 1, cp_end: int = None, delay: int = 1, solver: lp.LpSolver = None,
+                                 timeout: int = None, max_iter: int = 100, **lpargs) -> T_RESULTS:
+    """
+    Calculate minimal-cost partitioning of a tree based on configuration LP formulation and column generation.
+
+    The restricted master problem is seeded with greedy partitioning blocks and extended with subtree columns priced
+    by a tree knapsack DP instead of enumerating all feasible subtrees, then the ILP model is solved with the generated
+    columns and completed by the columns that can still improve the integer solution (see
+    :func:`solve_cfg_colgen_model`). The result is optimal unless the pricing is cut off by *max_iter* or *timeout*.
+
+    Block metrics are calculated based on parallelized execution platform model.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param M:           upper memory bound of the partition blocks (in MB)
+    :param L:           latency limit defined on the critical path (in ms)
+    :param N:           available CPU core count
+    :param cp_end:      tail node of the critical path in the form of subchain[root -> c_pend]
+    :param delay:       invocation delay between blocks
+    :param solver:      specific solver class (default: COIN-OR CBC)
+    :param timeout:     time limit in sec
+    :param max_iter:    maximum number of pricing iterations
+    :param lpargs:      additional LP solver parameters
+    :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
+    """
+    # Critical path
+    cpath = set(ibacktrack_chain(tree, root, cp_end))
+    # Verify the min values of limits for a feasible solution
+    if not all(verify_limits(tree, cpath, M, L)):
+        # No feasible solution due to too strict limits
+        return INFEASIBLE
+    metrics = BlockMetrics(M, lambda b, n: par_subtree_cost(tree, b, n, N),
+                           lambda b, n: par_subtree_memory(tree, b, n, N),
+                           lambda b, n: par_subchain_latency(tree, b, n, cpath, N))
+    # Memory-bounded and latency-aware greedy partitioning as initial columns
+    seeds = [min_weight_greedy_partitioning(tree, root, M, N, delay, metrics=False)[0] +
+             min_lat_partition_heuristic(tree, root, M, L, N, cp_end, delay, metrics=False)[0]]
+    status, model, X = solve_cfg_colgen_model(tree, root, L, cpath, delay, [metrics], seeds,
+                                              lambda cols: build_par_tree_cfg_model(tree, root, M, L, N, cpath, delay,
+                                                                                    isubtrees=lambda *_: iter(cols[0])),
+                                              solver, timeout, max_iter, **lpargs)
+    if status == lp.LpStatusOptimal:
+        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
+        return recreate_subtrees_from_xdict(tree, X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+    else:
+        return INFEASIBLE
+
+
 ########################################################################################################################
 
 def build_greedy_par_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph,
@@ -258,86 +311,109 @@ def build_greedy_par_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[s
     return model, X
 
 
-def build_par_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph,
-                             root: int = 1, M: int = math.inf, L: int = math.inf,
-                             N: int = 1, cpath: set[int] = frozenset(), subchains: bool = False,
-                             delay: int = 1) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+def build_par_tree_mtx_arrays(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph,
+                              root: int = 1, M: int = math.inf, L: int = math.inf,
+                              N: int = 1, cpath: set[int] = frozenset(), subchains: bool = False,
+                              delay: int = 1) -> tuple[SparseLpModel, dict[int, dict[int, int | None]]]:
     """
-    Generate the matrix ILP model based on parallel metric calculations.
+    Generate the matrix ILP model based on parallel metric calculations directly in sparse array form without
+    creating PuLP objects.
 
-    :return: tuple of the created model and list of decision variables
+    The variables, objective terms, and constraint rows of each induced subtree are added at once.
+
+    :return: tuple of the created sparse model and the matrix of column indices
     """
     # Model
-    model = lp.LpProblem(name="Tree_Partitioning", sense=lp.LpMinimize)
-    # Decision variable matrix with trivial variables
-    X = {j: {j: lp.LpVariable(f"x_{j:02d}_{j:02d}", cat=lp.LpBinary) if j != root else 1}
-         for j in tree.nodes if j is not PLATFORM}
-    # Empty objective
-    sum_cost = lp.LpAffineExpression()
+    model = SparseLpModel(name="Tree_Partitioning", sense=lp.LpMinimize)
+    nodes = [j for j in tree.nodes if j is not PLATFORM]
+    # Column matrix of decision variables with trivial variables, the constant 1 is denoted by None
+    cols = iter(model.add_variables(f"x_{j:02d}_{j:02d}" for j in nodes if j != root))
+    C = {j: {j: next(cols) if j != root else None} for j in nodes}
+    # Node-level memory demands and ingress edges
+    mem = {v: tree.nodes[v][MEMORY] for v in C}
+    ingress = {v: next(iter(tree.pred[v].values())) for v in C}
     # Empty latency constraint
-    sum_lat = lp.LpAffineExpression()
+    sum_lat = []
     # Generate decision variables
     for (p, j), st_edges in induced_subtrees(tree, root):
-        blk_mem = tree.nodes[j][MEMORY] * X[j][j]
         # Add coefficients for single node block [j]
         r_j, d_j, t_j = tree[p][j][RATE], tree[p][j][DATA], tree.nodes[j][RUNTIME]
-        sum_cost += (r_j * (d_j + t_j) + sum(par_inst_count(r_j, js[RATE], N) * js[DATA]
-                                             for js in tree.succ[j].values())) * X[j][j]
+        model.add_objective(C[j][j], r_j * (d_j + t_j) + sum(par_inst_count(r_j, js[RATE], N) * js[DATA]
+                                                             for js in tree.succ[j].values()))
         if j in cpath:
             jc = next(filter(lambda c: c in cpath, tree.successors(j)), None)
-            sum_lat += (d_j + t_j + (math.ceil(tree[j][jc][RATE] / (r_j * N)) * tree[j][jc][DATA]
-                                     if jc else 0)) * X[j][j]
+            sum_lat.append((C[j][j], d_j + t_j + (math.ceil(tree[j][jc][RATE] / (r_j * N)) * tree[j][jc][DATA]
+                                                  if jc else 0)))
             if j != root:
-                sum_lat += delay * X[j][j]
+                sum_lat.append((C[j][j], delay))
+        # Candidate nodes for block_j
+        blk = [v for _, v in st_edges]
+        blk_cols = model.add_variables(f"x_{v:02d}_{j:02d}" for v in blk)
+        for v, c in zip(blk, blk_cols):
+            C[v][j] = c
+        # Add coefficients for merging single nodes to block [j,...]
+        model.add_objectives(blk_cols, [par_inst_count(r_j, ingress[v][RATE], N) * (tree.nodes[v][RUNTIME]
+                                                                                     - ingress[v][DATA])
+                                        + sum(par_inst_count(r_j, vs[RATE], N) * vs[DATA]
+                                              for vs in tree.succ[v].values()) for v in blk])
         # Cache instance factor for nodes in cpath
         n_v = 1
-        # Candidate nodes for block_j
-        for u, v in st_edges:
-            X[v][j] = lp.LpVariable(f"x_{v:02d}_{j:02d}", cat=lp.LpBinary)
-            blk_mem += tree.nodes[v][MEMORY] * X[v][j]
-            # Add coefficients for merging single node v to block [j,...]
-            r_v, d_v, t_v = tree[u][v][RATE], tree[u][v][DATA], tree.nodes[v][RUNTIME]
-            # sum_cost += (r_v * (t_v - d_v) + sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values())) * X[v][j]
-            sum_cost += ((par_inst_count(r_j, r_v, N) * (t_v - d_v) +
-                          sum(par_inst_count(r_j, vs[RATE], N) * vs[DATA] for vs in tree.succ[v].values()))) * X[v][j]
-            # u -> v edge on cpath
-            if v in cpath:
-                n_v *= math.ceil(r_v / (tree[next(tree.predecessors(u))][u][RATE] * N))
-                vc = next(filter(lambda c: c in cpath, tree.successors(v)), None)
-                w_v = math.ceil(tree[v][vc][RATE] / (r_v * N)) * tree[v][vc][DATA] if vc else 0
-                sum_lat += n_v * (t_v - d_v + w_v) * X[v][j]
-            # Add knapsack constraint for operative memory demand
-            vj_sat = min(math.ceil(tree[u][v][RATE] / r_j), N)
-            # Add only non-trivial memory constraint
-            if vj_sat > 1 and M < math.inf:
-                model += vj_sat * tree.nodes[v][MEMORY] * X[v][j] <= M, f"Ck2_{j:02d}_{v:02d}"
-            # Connectivity constraint
-            model += X[u][j] - X[v][j] >= 0, f"Cc_{j:02d}_{u:02d}_{v:02d}"
+        # u -> v edges on cpath
+        for u, v in filter(lambda e: e[1] in cpath, st_edges):
+            n_v *= math.ceil(tree[u][v][RATE] / (tree[next(tree.predecessors(u))][u][RATE] * N))
+            vc = next(filter(lambda c: c in cpath, tree.successors(v)), None)
+            w_v = math.ceil(tree[v][vc][RATE] / (tree[u][v][RATE] * N)) * tree[v][vc][DATA] if vc else 0
+            sum_lat.append((C[v][j], n_v * (tree.nodes[v][RUNTIME] - tree[u][v][DATA] + w_v)))
+        # Add only non-trivial knapsack constraints for operative memory demand
+        if M < math.inf:
+            sat = [(v, vj_sat) for v in blk if (vj_sat := min(math.ceil(ingress[v][RATE] / r_j), N)) > 1]
+            model.add_constraints(range(len(sat)), [C[v][j] for v, _ in sat], [n * mem[v] for v, n in sat],
+                                  lp.LpConstraintLE, [M] * len(sat), names=[f"Ck2_{j:02d}_{v:02d}" for v, _ in sat])
+        # Connectivity constraints
+        model.add_difference_constraints([C[u][j] for u, _ in st_edges], blk_cols, lp.LpConstraintGE,
+                                         names=[f"Cc_{j:02d}_{u:02d}_{v:02d}" for u, v in st_edges])
         # Knapsack constraint, X[l][l] <= M for each leaf node l can be omitted
-        if len(blk_mem) > 1 and M < math.inf:
-            model += blk_mem <= M, f"Ck_{j:02d}"
-    # Objective
-    model += sum_cost
+        blk_nodes = blk if j == root else [j, *blk]
+        if len(blk_nodes) > 1 and M < math.inf:
+            model.add_constraints([0] * len(blk_nodes), [C[v][j] for v in blk_nodes], [mem[v] for v in blk_nodes],
+                                  lp.LpConstraintLE, [M - mem[j] if j == root else M], names=[f"Ck_{j:02d}"])
     # Feasibility constraints, X[root][root] = 1 can be omitted else it ensures that X[root][root] must be 1
-    for i in filter(lambda x: x != root, X):
-        model += lp.lpSum(X[i].values()) == 1, f"Cf_{i:02d}"
+    feasible = [i for i in C if i != root]
+    model.add_sum_constraints([list(C[i].values()) for i in feasible], lp.LpConstraintEQ, 1,
+                              names=[f"Cf_{i:02d}" for i in feasible])
     # Path-tree constraints
     if subchains:
-        for pt in ((lp.lpSum(X[i][j] for i in tree.successors(v)) <= 1, f"Cp_{j:02d}_{v:02d}")
-                   for v in X for j in X[v] if tree.succ[v]):
-            model += pt
+        paths = [(v, j) for v in C if tree.succ[v] for j in C[v]]
+        model.add_sum_constraints([[C[i][j] for i in tree.successors(v)] for v, j in paths], lp.LpConstraintLE, 1,
+                                  names=[f"Cp_{j:02d}_{v:02d}" for v, j in paths])
     # Latency constraint
     if L < math.inf:
-        model += sum_lat <= L, LP_LAT
+        model.add_constraint(sum_lat, lp.LpConstraintLE, L, name=LP_LAT)
     else:
         # Add redundant constraint to implicitly calculate the latency value
-        model += sum_lat >= 0, LP_LAT
-    return model, X
+        model.add_constraint(sum_lat, lp.LpConstraintGE, 0, name=LP_LAT)
+    return model, C
+
+
+def build_par_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph,
+                             root: int = 1, M: int = math.inf, L: int = math.inf,
+                             N: int = 1, cpath: set[int] = frozenset(), subchains: bool = False,
+                             delay: int = 1) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+    """
+    Generate the matrix ILP model based on parallel metric calculations.
+
+    The PuLP model is materialized at once from the sparse model of :func:`build_par_tree_mtx_arrays`.
+
+    :return: tuple of the created model and list of decision variables
+    """
+    model, C = build_par_tree_mtx_arrays(tree, root, M, L, N, cpath, subchains, delay)
+    return model.to_problem(), decision_matrix(model, C)
 
 
 def tree_par_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                               N: int = 1, cp_end: int = None, delay: int = 1, subchains: bool = False,
-                              solver: lp.LpSolver = None, timeout: int = None, **lpargs) -> T_RESULTS:
+                              solver: lp.LpSolver = None, timeout: int = None, warm_start: T_PART | bool = None,
+                              **lpargs) -> T_RESULTS:
     """
     Calculate minimal-cost partitioning of a tree based on matrix LP formulation.
 
@@ -353,6 +429,7 @@ def tree_par_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf
     :param delay:       invocation delay between blocks
     :param solver:      specific solver class (default: COIN-OR CBC)
     :param timeout:     time limit in sec
+    :param warm_start:  initial partitioning or True to use a greedy heuristic (ignored by, e.g., SCIPY_MILP)
     :param lpargs:      additional LP solver parameters
     :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
@@ -362,13 +439,21 @@ def tree_par_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    model, X = build_par_tree_mtx_model(tree, root, M, L, N, cpath, subchains, delay)
+    model, C = build_par_tree_mtx_arrays(tree, root, M, L, N, cpath, subchains, delay)
     solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
     solver.timeLimit = timeout
+    # Initial values are set only for the solvers supporting warm start
+    if warm_start and solver.name in WARM_START_SOLVERS:
+        # Greedy partitioning respecting the memory limit and the latency limit whenever it is possible
+        if warm_start is True:
+            warm_start, *_ = min_lat_partition_heuristic(tree, root, M, L, N, cp_end, delay, metrics=False)
+        if init_xmatrix_from_partition(decision_matrix(model, C), warm_start):
+            solver = warm_start_solver(solver)
     status = model.solve(solver=solver, **lpargs)
     if status == lp.LpStatusOptimal:
-        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
-        return extract_subtrees_from_xmatrix(X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+        opt_cost, opt_lat = round(model.objective_value(), 0), round(model.constraint_value(LP_LAT), 0)
+        partition = extract_subtrees_from_xmatrix(solution_matrix(model, C))
+        return partition, opt_cost, L + opt_lat if L < math.inf else opt_lat
     else:
         return INFEASIBLE
 
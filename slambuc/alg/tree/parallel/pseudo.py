@@ -23,8 +23,9 @@ import networkx as nx
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
 from slambuc.alg.tree.serial.pseudo import SubLTreePart, OPT
+from slambuc.alg.tree.skyline import ParetoSkyline
 from slambuc.alg.util import (ipostorder_dfs, ileft_right_dfs, ibacktrack_chain, recreate_subtree_blocks,
-                              par_inst_count, verify_limits)
+                              par_inst_count, verify_limits, ipareto_frontier, BarrierLink)
 
 
 class SubParBTreePart(typing.NamedTuple):
@@ -32,7 +33,7 @@ class SubParBTreePart(typing.NamedTuple):
     cost: int = math.inf  # Optimal sum cost of the subtree partitioning (OPT)
     top_cost: int = math.inf  # Cost of the topmost subtree block
     top_blk: set[int] = set()  # Nodes of the topmost block
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning except its root
 
     def __repr__(self):
         return repr(tuple(self))
@@ -40,7 +41,7 @@ class SubParBTreePart(typing.NamedTuple):
 
 def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
                                   M: int = math.inf, L: int = math.inf, N: int = 1, cp_end: int = None, delay: int = 1,
-                                  bidirectional: bool = True) -> T_RESULTS:
+                                  bidirectional: bool = True, pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -59,7 +60,9 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
-    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
+    :param pareto:          return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path or the
+                            list of such tuples in increasing order of latency if *pareto* is set
     """
     if N > 1:
         warnings.warn(f"Suboptimal for {N=} due to violated monotonicity of cost function in upward merging!")
@@ -68,7 +71,7 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
     # Verify the min values of limits for a feasible solution
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
-        return INFEASIBLE
+        return [] if pareto else INFEASIBLE
     # Init empty data structure for optimal results of subtrees T_v
     DP = {n: collections.defaultdict(dict) for n in tree if n is not PLATFORM}
     # Iterate nodes in a bottom-up traversal order
@@ -78,12 +81,12 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
         cost = r_v * (d_v + t_v) + sum(par_inst_count(r_v, vs[RATE], N) * vs[DATA] for vs in tree.succ[v].values())
         # Only add fetching overhead for root node and omit caching to ensure lat monotonicity of merging
         lat = d_v + t_v if v == root else t_v if v in cpath else 0
-        DP[v][lat, lat][m_v, m_v] = SubParBTreePart(cost, cost, {v}, {v})
+        DP[v][lat, lat][m_v, m_v] = SubParBTreePart(cost, cost, {v})
         # Bottom-up propagation for considering v's descendant subcases in sequential order (v is not leaf)
         # -->   p   ---->   v   ----[i.]---->   b
         for b in tree.successors(v):
             # Init empty data structure of subcase T[v,b]
-            _cache = collections.defaultdict(dict)
+            _cache = ParetoSkyline()
             r_b, d_b, t_b = tree[v][b][RATE], tree[v][b][DATA], tree.nodes[b][RUNTIME]
             # Calculate possible latency/memory combinations
             for lats_v, lats_b in itertools.product(DP[v], DP[b]):
@@ -117,7 +120,8 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
                         # Top block's attributes remain the same
                         mem, top_blk = mem_v, sub_v.top_blk
                         # Sub-partitions are just concatenated
-                        barr, cost, top_blk_cost = sub_v.barr | sub_b.barr, sub_v.cost + sub_b.cost, sub_v.top_cost
+                        barr = BarrierLink(b, sub_v.barr, sub_b.barr)
+                        cost, top_blk_cost = sub_v.cost + sub_b.cost, sub_v.top_cost
                     # MERGE: v -> b edge is marked as a merge
                     elif (mem_ld := mem_v[0] + mem_b[0]) > M:
                         # Infeasible subcase due to exceeded memory constraint
@@ -134,25 +138,13 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
                                                  for s, fs in tree.succ[f].items() if s not in sub_b.top_blk))
                         # Top blocks of the two sub-partitions are merged together with root node v
                         mem = mem_ld, mem_op
-                        barr, top_blk = sub_v.barr | sub_b.barr - {b}, sub_v.top_blk | sub_b.top_blk
+                        barr, top_blk = BarrierLink(None, sub_v.barr, sub_b.barr), sub_v.top_blk | sub_b.top_blk
                         cost = sub_v.cost - sub_v.top_cost + sub_b.cost - sub_b.top_cost + top_blk_cost
                     # Store the min cost subcase
                     sub_lats = lat, top_blk_lat
-                    if mem not in _cache[sub_lats] or cost < _cache[sub_lats][mem].cost:
-                        _cache[sub_lats][mem] = SubParBTreePart(cost, top_blk_cost, top_blk, barr)
-                    # Check whether the current subcase is a better sub-solution for state (v, sub_lats, mem)
-                    if mem not in _cache[sub_lats] or cost < _cache[sub_lats][mem].cost:
-                        if bidirectional:
-                            # Eliminate prior subcases that are dominated by the new subcase
-                            for l, m in tuple((_l, _m) for _l in _cache if _l[0] >= lat and _l[1] >= top_blk_lat
-                                              for _m in _cache[_l] if (_m[0] >= mem[0] and _m[1] >= mem[1]
-                                                                       and _cache[_l][_m].cost >= cost)):
-                                if len(_cache[l]) > 1:
-                                    del _cache[l][m]
-                                else:
-                                    del _cache[l]
-                        # Add superior subcase
-                        _cache[sub_lats][mem] = SubParBTreePart(cost, top_blk_cost, top_blk, barr)
+                    # Add subcase if it is a better sub-solution for state (v, sub_lats, mem), but omit the
+                    # elimination of dominated subcases as the cost of later merges depends on the top block
+                    _cache.add(sub_lats, mem, SubParBTreePart(cost, top_blk_cost, top_blk, barr), bidirectional=False)
             # Store min subcases as C(v,i-1) for the next iteration of the propagation process
             DP[v] = _cache
             # Drop unnecessary subcases
@@ -160,10 +152,14 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
         # Store the cost-opt subcases wrt. latency for node v encoded with memory value 0,0
         for lats in DP[v]:
             DP[v][lats][OPT, OPT] = min(DP[v][lats].values(), key=operator.itemgetter(OPT))
+    if pareto:
+        # Cost-opt subcases of the root node's latency states form the cost-latency trade-off of feasible partitionings
+        return [(recreate_subtree_blocks(tree, BarrierLink(root, sub.barr)), cost, lat) for cost, lat, sub in
+                ipareto_frontier((dp[OPT, OPT].cost, lats[OPT], dp[OPT, OPT]) for lats, dp in DP[root].items())]
     # Subcases under the root node contain the feasible partitioning
     if opt_lats := min(DP[root], key=lambda _l: DP[root][_l][OPT, OPT].cost, default=None):
         opt = DP[root][opt_lats][OPT, OPT]
-        return recreate_subtree_blocks(tree, opt.barr), opt.cost, opt_lats[OPT]
+        return recreate_subtree_blocks(tree, BarrierLink(root, opt.barr)), opt.cost, opt_lats[OPT]
     else:
         # No feasible solution
         return INFEASIBLE
@@ -174,7 +170,7 @@ def pseudo_par_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str
 
 def pseudo_par_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
                                   M: int = math.inf, L: int = math.inf, N: int = 1, cp_end: int = None, delay: int = 1,
-                                  bidirectional: bool = True) -> T_RESULTS:
+                                  bidirectional: bool = True, pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -190,20 +186,22 @@ def pseudo_par_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
-    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
+    :param pareto:          return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path or the
+                            list of such tuples in increasing order of latency if *pareto* is set
     """
     # Set of critical path's nodes
     cpath = set(ibacktrack_chain(tree, root, cp_end))
     # Verify the min values of limits for a feasible solution
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
-        return INFEASIBLE
+        return [] if pareto else INFEASIBLE
     # Init empty data structure for optimal results of subtrees
     TDP = {n: {} for n in tree if n is not PLATFORM}
     # Process subtrees of T in a bottom-up traversal order
     for p, n in ipostorder_dfs(tree, root):
         # Init empty data structure for optimal subcases T_n[v,b]
-        DP = collections.defaultdict(lambda: collections.defaultdict(dict))
+        DP = collections.defaultdict(ParetoSkyline)
         r_n, d_n, t_n, m_n = tree[p][n][RATE], tree[p][n][DATA], tree.nodes[n][RUNTIME], tree.nodes[n][MEMORY]
         # Traverse subtree T_n in a left-right traversal
         #       |--(j-1.)--> [v_p]   |--(i-1.)--> [b_p]                                 | left side
@@ -222,7 +220,7 @@ def pseudo_par_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str
                         lat = d_n + t_n + (math.ceil(tree[n][nc][RATE] / (r_n * N)) * tree[n][nc][DATA] if nc else 0)
                     else:
                         lat = 0
-                    DP[e_vb][lat][m_n, m_n] = SubLTreePart(cost, 1, {n})
+                    DP[e_vb].insert(lat, (m_n, m_n), SubLTreePart(cost, 1, BarrierLink(n)))
                 # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
                 else:
                     u, v_p = e_uvp
@@ -253,9 +251,9 @@ def pseudo_par_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str
                             cost = (sub_u.cost + par_inst_count(r_n, r_v, N) * (t_v - d_v) +
                                     sum(par_inst_count(r_n, vs[RATE], N) * vs[DATA] for vs in tree.succ[v].values()))
                             # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem].cost:
+                            if (dpl := DP[e_vb].get(lat)) is None or mem not in dpl or cost < dpl[mem].cost:
                                 # Add superior subcase
-                                DP[e_vb][lat][mem] = SubLTreePart(cost, n_v, sub_u.barr)
+                                DP[e_vb].insert(lat, mem, SubLTreePart(cost, n_v, sub_u.barr))
             # CUT: C[v,b]
             else:
                 # b_k <- C[v_i, d(v_i)]
@@ -272,25 +270,19 @@ def pseudo_par_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str
                                 continue
                             sub_v = DP[v, b_p][lat_v][mem_v]
                             # Only concatenate blocks
-                            cost, barr = sub_v.cost + opt_b.cost, sub_v.barr | opt_b.barr
-                            # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem_v not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem_v].cost:
-                                if bidirectional:
-                                    # Eliminate prior subcases that are dominated by the new subcase
-                                    for l, m in tuple((_l, _m) for _l in DP[e_vb] if _l >= lat
-                                                      for _m in DP[e_vb][_l] if (_m[0] >= mem_v[0] and _m[0] >= mem_v[0]
-                                                                                 and DP[e_vb][_l][_m].cost >= cost)):
-                                        if len(DP[e_vb][l]) > 1:
-                                            del DP[e_vb][l][m]
-                                        else:
-                                            del DP[e_vb][l]
-                                # Add superior subcase
-                                DP[e_vb][lat][mem_v] = SubLTreePart(cost, sub_v.mul, barr)
+                            cost, barr = sub_v.cost + opt_b.cost, BarrierLink(None, sub_v.barr, opt_b.barr)
+                            # Add subcase if it is a better sub-solution for state (e_vb, lat, mem) while
+                            # eliminating prior subcases that are dominated by the new subcase
+                            DP[e_vb].add(lat, mem_v, SubLTreePart(cost, sub_v.mul, barr), bidirectional)
         # Cache the best subcase for subtree T_n
         n_w = collections.deque(tree.successors(n), 1).pop() if len(tree.succ[n]) else 0
         # Store the best subcases of subtree T_n
         for lat_n, dp in DP[n, n_w].items():
             TDP[n][lat_n] = min(dp.values(), key=operator.itemgetter(OPT))
+    if pareto:
+        # Best subcases of the root node's latency states form the cost-latency trade-off of feasible partitionings
+        return [(recreate_subtree_blocks(tree, sub.barr), cost, lat) for cost, lat, sub in
+                ipareto_frontier((opt.cost, lat, opt) for lat, opt in TDP[root].items())]
     # Subcases under the root node contain the feasible partitioning
     if (opt_lat := min(TDP[root], key=lambda _l: TDP[root][_l].cost, default=None)) is not None:
         opt = TDP[root][opt_lat]
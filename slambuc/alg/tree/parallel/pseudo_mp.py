@@ -22,14 +22,18 @@ import networkx as nx
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
 from slambuc.alg.tree.serial.pseudo import SubBTreePart, SubLTreePart, OPT
-from slambuc.alg.tree.serial.pseudo_mp import isubtree_splits
-from slambuc.alg.util import (ipostorder_dfs, ibacktrack_chain, recreate_subtree_blocks, ileft_right_dfs,
-                              par_inst_count, verify_limits)
+from slambuc.alg.tree.serial.pseudo_mp import isubtree_splits, isubtree_balanced_splits
+from slambuc.alg.tree.pool import WorkerPool, PROCESS, partition_subtrees
+from slambuc.alg.tree.shared import SharedTree, SharedSubcases, attach_tree, pack_subcases, recv_subcases
+from slambuc.alg.tree.skyline import ParetoSkyline
+from slambuc.alg.util import (ipostorder_tabu_dfs, ibacktrack_chain, recreate_subtree_blocks, ileft_right_dfs,
+                              par_inst_count, verify_limits, BarrierLink)
 
 
 def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
-                            sync: dict[int, multiprocessing.SimpleQueue],
-                            tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                            sync: dict[int, typing.Union[multiprocessing.SimpleQueue, SharedSubcases, dict]],
+                            tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph | SharedTree,
+                            root: int = 1,
                             M: int = math.inf, L: int = math.inf, N: int = 1, cpath: set[int] = frozenset(),
                             delay: int = 1, bidirectional: bool = True) -> None | dict[int, SubBTreePart]:
     """
@@ -37,10 +41,11 @@ def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, Non
     while waits for subcases at *sync* edges.
 
     This function is designed for running in a separate detached subprocess and synchronizing subresults via
-    *SimpleQueue* objects as an IPC method.
+    *SimpleQueue* objects as an IPC method. If the *tree* is given as a shared tree handle, subresults are exchanged
+    as array-encoded tables in shared memory instead of pickled dicts.
 
     :param ready:           object for signaling the end of partitioning
-    :param sync:            object regarding subtrees which results need to be waited for
+    :param sync:            object regarding subtrees which results need to be waited for or the received results
     :param tree:            app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
     :param root:            root node of the graph
     :param M:               upper memory bound of the partition blocks in MB
@@ -51,12 +56,14 @@ def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, Non
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
+    # Attach to the shared tree in case of shared memory transport
+    shared, tree = isinstance(tree, SharedTree), attach_tree(tree)
     # Allocate empty dict for local subcases combined with prior subcase results
     TDP = {}
-    # Process subtrees of T in a bottom-up traversal order
-    for p, n in ipostorder_dfs(tree, root):
+    # Process subtrees of T in a bottom-up traversal order except the subtrees of the sync points
+    for p, n in ipostorder_tabu_dfs(tree, root, tabu=sync):
         # Init empty data structure for optimal subcases T_n[v,b]
-        DP = collections.defaultdict(lambda: collections.defaultdict(dict))
+        DP = collections.defaultdict(ParetoSkyline)
         # Store sync point of the overlapped subtree
         sentinel = None
         r_n, d_n, t_n, m_n = tree[p][n][RATE], tree[p][n][DATA], tree.nodes[n][RUNTIME], tree.nodes[n][MEMORY]
@@ -80,7 +87,7 @@ def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, Non
                         lat = d_n + t_n + (math.ceil(tree[n][nc][RATE] / (r_n * N)) * tree[n][nc][DATA] if nc else 0)
                     else:
                         lat = 0
-                    DP[e_vb][lat][m_n, m_n] = SubLTreePart(cost, 1, {n})
+                    DP[e_vb].insert(lat, (m_n, m_n), SubLTreePart(cost, 1, BarrierLink(n)))
                 # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
                 else:
                     u, v_p = e_uvp
@@ -110,31 +117,21 @@ def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, Non
                             # Calculate sum cost by adding merged node runtime and caching
                             cost = (sub_u.cost + par_inst_count(r_n, r_v, N) * (t_v - d_v) +
                                     sum(par_inst_count(r_n, vs[RATE], N) * vs[DATA] for vs in tree.succ[v].values()))
-                            # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem].cost:
-                                # Eliminate prior subcases that are dominated by the new subcase
-                                for l, m in tuple((_l, _m) for _l in DP[e_vb] if _l >= lat
-                                                  for _m in DP[e_vb][_l] if (_m[0] >= mem[0] and _m[0] >= mem[0]
-                                                                             and DP[e_vb][_l][_m].cost >= cost)):
-                                    if len(DP[e_vb][l]) > 1:
-                                        del DP[e_vb][l][m]
-                                    else:
-                                        del DP[e_vb][l]
-                                # Add superior subcase
-                                DP[e_vb][lat][mem] = SubLTreePart(cost, n_v, sub_u.barr)
+                            # Add subcase if it is a better sub-solution for state (e_vb, lat, mem) while
+                            # eliminating prior subcases that are dominated by the new subcase
+                            DP[e_vb].add(lat, mem, SubLTreePart(cost, n_v, sub_u.barr))
             # CUT: C[v,b]
             else:
                 # b_k <- C[v_i, d(v_i)]
                 b_k = collections.deque(tree.successors(b), 1).pop() if len(tree.succ[b]) else 0
                 # Previously merged edge: v -> b  =>  [root ... -> u -> v -> b ...]   |   [b]  --(max_k.)--> [b_w]
                 DP[e_vb] = DP[b, b_k]
+                # Waiting for dependent subprocess to be finished and pull optimal subcases
+                if b not in TDP:
+                    TDP.update(recv_subcases(sentinel))
                 # Cut edge: v -> b  |  [root ... -> u -> v] - [b ...]   |   v --(i-1.)--> b_p
                 for lat_v in DP[v, b_p]:
                     for mem_v in DP[v, b_p][lat_v]:
-                        # Waiting for dependent subprocess to be finished and pull optimal subcases
-                        if b not in TDP:
-                            TDP.update(sentinel.get())
-                            sentinel.close()
                         for lat_b, opt_b in TDP[b].items():
                             # b in cpath => v in cpath
                             if (lat := lat_v + delay + lat_b if b in cpath else lat_v) > L:
@@ -142,31 +139,23 @@ def _par_ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, Non
                                 continue
                             sub_v = DP[v, b_p][lat_v][mem_v]
                             # Only concatenate blocks
-                            cost, barr = sub_v.cost + opt_b.cost, sub_v.barr | opt_b.barr
-                            # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem_v not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem_v].cost:
-                                if bidirectional:
-                                    # Eliminate prior subcases that are dominated by the new subcase
-                                    for l, m in tuple((_l, _m) for _l in DP[e_vb] if _l >= lat
-                                                      for _m in DP[e_vb][_l] if (_m[0] >= mem_v[0] and _m[0] >= mem_v[0]
-                                                                                 and DP[e_vb][_l][_m].cost >= cost)):
-                                        if len(DP[e_vb][l]) > 1:
-                                            del DP[e_vb][l][m]
-                                        else:
-                                            del DP[e_vb][l]
-                                # Add superior subcase
-                                DP[e_vb][lat][mem_v] = SubLTreePart(cost, sub_v.mul, barr)
+                            cost, barr = sub_v.cost + opt_b.cost, BarrierLink(None, sub_v.barr, opt_b.barr)
+                            # Add subcase if it is a better sub-solution for state (e_vb, lat, mem) while
+                            # eliminating prior subcases that are dominated by the new subcase
+                            DP[e_vb].add(lat, mem_v, SubLTreePart(cost, sub_v.mul, barr), bidirectional)
         # Cache the best subcase for subtree T_n
         n_w = collections.deque(tree.successors(n), 1).pop() if len(tree.succ[n]) else 0
         # Store the best subcases of subtree T_n
         TDP[n] = {lat_n: min(dp.values(), key=operator.itemgetter(OPT)) for lat_n, dp in DP[n, n_w].items()}
-    # Notify waiting process and push optimal subcases or return TDP locally for the main thread
-    return ready.put(TDP) if ready else TDP
+    # Notify waiting process and push optimal subcases in a transferable form or return TDP locally for the main thread
+    return ready.put(pack_subcases(TDP, shared)) if ready else TDP
 
 
 def pseudo_par_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                                      N: int = 1, cp_end: int = None, delay: int = 1,
-                                     bidirectional: bool = True) -> T_RESULTS:
+                                     bidirectional: bool = True, shared: bool = True,
+                                     pool: WorkerPool = None, workers: int = None,
+                                     backend: str = PROCESS) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes.
@@ -185,6 +174,10 @@ def pseudo_par_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = m
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
+    :param shared:          exchange the tree and subcases via shared memory instead of pickling
+    :param pool:            persistent worker pool used instead of starting new subprocesses
+    :param workers:         balance the estimated work of subtrees over workers instead of using sqrt(n)-sized splits
+    :param backend:         run subtrees in processes or threads (threads are used only if the GIL is disabled)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
     # Critical path
@@ -193,35 +186,10 @@ def pseudo_par_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = m
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    workers, events, sync = [], {}, None
-    try:
-        # Split tree and initiate subprocesses to calculate subcases
-        for (p, v), sync in isubtree_splits(tree, root):
-            # Collect event of sync points
-            sync = {s: events[s] for s in sync}
-            if p is not PLATFORM:
-                # Add own event for signaling readiness
-                ready = events.setdefault(v, multiprocessing.SimpleQueue())
-                # Create and start worker process
-                workers.append(multiprocessing.Process(target=_par_ltree_partitioning, name=f"subtree_{v}",
-                                                       args=(ready, sync, tree, v, M, L, N, cpath, delay,
-                                                             bidirectional), daemon=False))
-                workers[-1].start()
-        # Process last/topmost subtree in the main process and get subresults locally
-        TDP = _par_ltree_partitioning(None, sync, tree, root, M, L, N, cpath, delay, bidirectional)
-    except BaseException:
-        # Terminate all initiated subprocesses in case of interruption
-        for w in workers:
-            w.terminate()
-        # Reraise exception for further handling
-        raise
-    finally:
-        # Wait for all subprocesses to terminate for closing all used resources
-        for w in workers:
-            w.join(timeout=0)
-            if w.is_alive():
-                w.kill()
-                w.join()
+    # Split tree based on estimated subtree work or the subtree size heuristic
+    splits = isubtree_balanced_splits(tree, root, workers, M, cpath) if workers else isubtree_splits(tree, root)
+    TDP = partition_subtrees(_par_ltree_partitioning, tree, root, splits, (M, L, N, cpath, delay, bidirectional),
+                             shared, pool, workers=workers, backend=backend)
     # Subcases under the root node contain the feasible partitioning
     if (opt_lat := min(TDP[root], key=lambda _l: TDP[root][_l].cost, default=None)) is not None:
         opt = TDP[root][opt_lat]
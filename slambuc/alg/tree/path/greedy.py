@@ -19,6 +19,7 @@ import networkx as nx
 
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
+from slambuc.alg.app.compact import as_digraph
 from slambuc.alg.util import (isubtrees, ibacktrack_chain, ipowerset, path_blocks, chain_cost, chain_latency,
                               chain_cpu, chain_memory_opt)
 
@@ -97,6 +98,8 @@ def greedy_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf,
     :param only_cuts:   return the number of cuts instead of the calculated latency
     :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
+    # Chain generators rely on graph views
+    tree = as_digraph(tree)
     best_res, best_cost = [INFEASIBLE], math.inf
     # Iterates over all possible cuttings
     for barr in ichains(tree, root, M, N):
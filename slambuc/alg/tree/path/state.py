@@ -17,6 +17,7 @@ import networkx as nx
 
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import RUNTIME, DATA
+from slambuc.alg.app.compact import CompactTree
 from slambuc.alg.tree import seq_tree_partitioning
 from slambuc.alg.util import recalculate_partitioning, ipostorder_dfs
 
@@ -53,7 +54,8 @@ def transform_autonomous_caching(tree: dict[str | int, dict[str | int, dict[str,
     :param copy:    use a deep copy of the input instead of modifying the original
     :return:        transformed tree
     """
-    tf_tree = tree.copy() if copy else tree
+    # Compact trees are read-only, hence their converted form is modified instead
+    tf_tree = tree.to_digraph() if isinstance(tree, CompactTree) else tree.copy() if copy else tree
     for p, n in ipostorder_dfs(tree, root):
         # Add data fetching and state caching overheads to the function execution time
         tf_tree.nodes[n][RUNTIME] += tree[p][n][DATA] + sum(tree[n][s][DATA] for s in tree.successors(n))
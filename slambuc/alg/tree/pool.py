@@ -0,0 +1,299 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import contextlib
+import multiprocessing.context
+import os
+import sys
+import typing
+
+import networkx as nx
+
+from slambuc.alg.app import PLATFORM
+from slambuc.alg.tree.shared import (SharedTree, SharedSubcases, shared_tree, pack_subcases, unpack_subcases,
+                                      release_subcases, release_channel)
+
+# Worker backends
+PROCESS, THREAD = "process", "thread"
+
+
+def gil_enabled() -> bool:
+    """
+    Check whether the Global Interpreter Lock is enabled in the running interpreter.
+
+    :return:    GIL is enabled
+    """
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def get_backend(backend: str = PROCESS) -> str:
+    """
+    Return the given worker *backend* if its workers can run in parallel, otherwise fall back to processes.
+
+    Threads are only used in free-threaded interpreter builds where the GIL is disabled.
+
+    :param backend: requested backend (``process`` or ``thread``)
+    :return:        applicable backend
+    """
+    if backend not in (PROCESS, THREAD):
+        raise ValueError(f"Unknown worker backend: {backend}")
+    return THREAD if backend == THREAD and not gil_enabled() else PROCESS
+
+
+def _warmup() -> int:
+    """Dummy task to start a worker process."""
+    return os.getpid()
+
+
+def _invoke_subtree(func: typing.Callable, select: bool, sync: dict[int, SharedSubcases | dict],
+                    tree: SharedTree | nx.DiGraph, root: int, args: tuple) -> SharedSubcases | dict:
+    """
+    Calculate the subcases of the subtree with *root* in a pool worker and return them in a transferable form.
+
+    :param func:    partitioning function designed for subprocesses
+    :param select:  return only the subcases of the subtree root instead of all calculated subcases
+    :param sync:    received subcases of the sync points
+    :param tree:    shared tree handle or app tree
+    :param root:    root node of the subtree
+    :param args:    additional arguments of the partitioning function
+    :return:        calculated subcases
+    """
+    subcases = func(None, sync, tree, root, *args)
+    return pack_subcases(subcases[root] if select else subcases, isinstance(tree, SharedTree))
+
+
+def _run_subtree(func: typing.Callable, select: bool, sync: dict[int, dict], tree: nx.DiGraph, root: int,
+                 args: tuple) -> dict:
+    """
+    Calculate the subcases of the subtree with *root* in a worker thread and return them by reference.
+
+    :param func:    partitioning function designed for subprocesses
+    :param select:  return only the subcases of the subtree root instead of all calculated subcases
+    :param sync:    received subcases of the sync points
+    :param tree:    app tree
+    :param root:    root node of the subtree
+    :param args:    additional arguments of the partitioning function
+    :return:        calculated subcases
+    """
+    subcases = func(None, sync, tree, root, *args)
+    return subcases[root] if select else subcases
+
+
+class WorkerPool:
+    """
+    Persistent pool of worker processes for the multiprocess tree partitioning algorithms.
+
+    Worker processes are started once and reused across partitioning calls, hence the process startup and module
+    import costs are paid only at the pool creation. Subtrees are submitted to the pool as soon as the results of
+    their sync points are available, therefore tasks never block in workers waiting for other tasks.
+
+    In case of an exception (or interruption) during a partitioning call, the pending tasks of the call are cancelled
+    and the workers running its remaining tasks are terminated. Terminated workers are restarted lazily at the next
+    submission.
+
+    With the ``thread`` backend, subtrees are calculated in worker threads and subcases are passed by reference
+    without any serialization. Threads run in parallel only in free-threaded interpreter builds, while running
+    threads cannot be terminated in case of an exception.
+
+    Can be used as a context manager that shuts down the pool at exit.
+    """
+
+    def __init__(self, workers: int = None, mp_context: multiprocessing.context.BaseContext = None,
+                 warmup: bool = True, backend: str = PROCESS):
+        """
+        Initialize the pool.
+
+        :param workers:     number of workers (default: CPU count)
+        :param mp_context:  multiprocessing context used for starting worker processes
+        :param warmup:      start all workers in advance
+        :param backend:     run workers as processes or threads
+        """
+        if backend not in (PROCESS, THREAD):
+            raise ValueError(f"Unknown worker backend: {backend}")
+        self.workers = workers if workers else os.cpu_count()
+        self.mp_context = mp_context
+        self.backend = backend
+        self._executor = None
+        if warmup:
+            self.warmup()
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(workers={self.workers}, backend={self.backend}, "
+                f"running={self._executor is not None})")
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """Underlying executor of the pool (restarted if it is not running)."""
+        if self._executor is None:
+            if self.backend == THREAD:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.workers)
+            else:
+                self._executor = concurrent.futures.ProcessPoolExecutor(self.workers, mp_context=self.mp_context)
+        return self._executor
+
+    def warmup(self):
+        """Start all the workers of the pool."""
+        concurrent.futures.wait([self.executor.submit(_warmup) for _ in range(self.workers)])
+
+    def submit(self, func: typing.Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Submit a task to the pool.
+
+        :param func:    callable
+        :param args:    positional arguments
+        :param kwargs:  keyword arguments
+        :return:        future of the task
+        """
+        return self.executor.submit(func, *args, **kwargs)
+
+    def cancel(self, futures: typing.Iterable[concurrent.futures.Future]):
+        """
+        Cancel the given tasks and terminate the workers if any of them is already running.
+
+        :param futures: futures of the tasks
+        """
+        # Running threads cannot be stopped, hence their results are simply dropped
+        if not all([f.cancel() or f.done() for f in futures]) and self._executor and self.backend == PROCESS:
+            if hasattr(self._executor, 'terminate_workers'):
+                self._executor.terminate_workers()
+            else:
+                for p in list(getattr(self._executor, '_processes', {}).values()):
+                    p.terminate()
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the workers of the pool.
+
+        :param wait:    wait for the running tasks to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def run_subtrees(self, func: typing.Callable, splits: typing.Iterable[tuple[tuple[int | str, int], set[int]]],
+                     tree: SharedTree | nx.DiGraph, args: tuple, select: bool = False) -> dict:
+        """
+        Calculate the subcases of the given subtree splits in the pool with respect to their sync points.
+
+        Raises :class:`ValueError` if a sync point is not calculated by any of the given splits.
+
+        :param func:    partitioning function designed for subprocesses
+        :param splits:  cut edges and sync points of subtrees in a bottom-up order
+        :param tree:    shared tree handle or app tree (only app tree for the thread backend)
+        :param args:    additional arguments of the partitioning function
+        :param select:  return only the subcases of the subtree root instead of all calculated subcases
+        :return:        subcases of the topmost subtree
+        """
+        invoke = _run_subtree if self.backend == THREAD else _invoke_subtree
+        pending, futures, results = [(v, sync) for (_, v), sync in splits], {}, {}
+        try:
+            while pending or futures:
+                # Submit subtrees whose sync points are already calculated
+                for v, sync in [(v, sync) for v, sync in pending if sync.issubset(results)]:
+                    futures[self.submit(invoke, func, select, {s: results.pop(s) for s in sync}, tree, v, args)] = v
+                    pending.remove((v, sync))
+                if not futures:
+                    # Remaining subtrees wait for sync points that are never calculated
+                    raise ValueError(f"Unsatisfiable sync points of subtrees: {[v for v, _ in pending]}")
+                done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for f in done:
+                    results[futures.pop(f)] = f.result()
+        except BaseException:
+            # Cancel remaining tasks in case of interruption
+            self.cancel(futures)
+            for data in results.values():
+                release_subcases(data)
+            raise
+        # Only the topmost subtree's results remain
+        return unpack_subcases(results.popitem()[1])
+
+
+########################################################################################################################
+
+
+def partition_subtrees(func: typing.Callable, tree: nx.DiGraph, root: int,
+                       splits: typing.Iterable[tuple[tuple[int | str, int], set[int]]], args: tuple,
+                       shared: bool = True, pool: WorkerPool = None, select: bool = False, workers: int = None,
+                       backend: str = PROCESS) -> dict:
+    """
+    Calculate the subcases of the split subtrees of *tree* in separate subprocesses, worker threads or in the given
+    worker *pool* and return the subcases of the topmost subtree.
+
+    Without a worker pool, a detached subprocess is started for each subtree except the topmost one, which is
+    calculated in the current process, and subcases are exchanged via *SimpleQueue* objects. In case of an exception
+    (or interruption), the subprocesses are terminated and the shared subcases that are sent but not received yet
+    are released.
+
+    :param func:    partitioning function designed for subprocesses
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param splits:  cut edges and sync points of subtrees in a bottom-up order
+    :param args:    additional arguments of the partitioning function
+    :param shared:  exchange the tree and subcases via shared memory instead of pickling
+    :param pool:    persistent worker pool used instead of starting new subprocesses
+    :param select:  return only the subcases of the *root* node
+    :param workers: number of worker threads
+    :param backend: run subtrees in processes or threads (threads are used only if the GIL is disabled)
+    :return:        calculated subcases
+    """
+    # Run subtrees in worker threads sharing subcases by reference if threads can run in parallel
+    if pool is None and get_backend(backend) == THREAD:
+        with WorkerPool(workers, backend=THREAD) as pool:
+            return partition_subtrees(func, tree, root, splits, args, False, pool, select)
+    # Share the tree with subprocesses via shared memory if required while threads access the tree directly
+    shared &= pool is None or pool.backend == PROCESS
+    with shared_tree(tree) if shared else contextlib.nullcontext(tree) as _tree:
+        if pool is not None:
+            # Calculate subtrees in the persistent worker pool
+            return pool.run_subtrees(func, splits, _tree, args, select)
+        procs, events, sync = [], {}, None
+        try:
+            # Split tree and initiate subprocesses to calculate subcases
+            for (p, v), sync in splits:
+                # Collect event of sync points
+                sync = {s: events[s] for s in sync}
+                if p is not PLATFORM:
+                    # Add own event for signaling readiness
+                    ready = events.setdefault(v, multiprocessing.SimpleQueue())
+                    # Create and start worker process
+                    procs.append(multiprocessing.Process(target=func, name=f"subtree_{v}",
+                                                         args=(ready, sync, _tree, v, *args), daemon=True))
+                    procs[-1].start()
+            # Process last/topmost subtree in the main process and get subresults locally
+            subcases = func(None, sync, tree, root, *args)
+        except BaseException:
+            # Terminate all initiated subprocesses in case of interruption
+            for w in procs:
+                w.terminate()
+            # Reraise exception for further handling
+            raise
+        finally:
+            # Wait for all subprocesses to terminate for closing all used resources
+            for w in procs:
+                w.join(timeout=0)
+                if w.is_alive():
+                    w.kill()
+                    w.join()
+            # Release the subcases of terminated subprocesses that are not received
+            for ready in events.values():
+                release_channel(ready)
+    return subcases[root] if select else subcases
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from .bicriteria import bifptas_tree_partitioning, biheuristic_tree_partitioning, bifptas_dual_tree_partitioning
+from .bicriteria_mp import (bifptas_mp_tree_partitioning, biheuristic_mp_tree_partitioning,
+                            bifptas_dual_mp_tree_partitioning)
 from .greedy import greedy_ser_tree_partitioning
-from .ilp import tree_cfg_partitioning, tree_hybrid_partitioning, tree_mtx_partitioning, all_tree_mtx_partitioning
-from .pseudo import pseudo_btree_partitioning, pseudo_ltree_partitioning
+from .ilp import (tree_cfg_partitioning, tree_hybrid_partitioning, tree_mtx_partitioning, all_tree_mtx_partitioning,
+                  tree_colgen_partitioning)
+from .pseudo import pseudo_btree_partitioning, pseudo_ltree_partitioning, IncrementalTreePartitioner
 from .pseudo_mp import pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning
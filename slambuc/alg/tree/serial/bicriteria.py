@@ -23,7 +23,8 @@ from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
 from slambuc.alg.app.common import WEIGHT
 from slambuc.alg.util import (ipostorder_dfs, ileft_right_dfs, ibacktrack_chain, recreate_subtree_blocks,
-                              recalculate_ser_partitioning, ipostorder_edges, verify_limits)
+                              recalculate_ser_partitioning, ipostorder_edges, verify_limits, isomorphic_subtrees,
+                              relabel_subcases, BarrierLink)
 
 # Constants for attribute index
 OPT = 0
@@ -32,7 +33,7 @@ OPT = 0
 class WeightedSubBTreePart(typing.NamedTuple):
     """Store subtree partitioning attributes for a given edge-weighted subcase."""
     weight: int = 0  # Cumulative weights of covered edges in the subtree partitioning
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning except its root
 
     def __repr__(self):
         return repr(tuple(self))
@@ -84,7 +85,7 @@ def biheuristic_btree_partitioning(tree: dict[str | int, dict[str | int, dict[st
         # Only add fetching overhead for root node and omit caching to ensure lat monotonicity of upward merging
         lat = d_v + t_v if v == root else t_v if v in cpath else 0
         # For singleton blocks weight is 0 by default
-        DP[v][lat, lat][m_v] = WeightedSubBTreePart(0, {v})
+        DP[v][lat, lat][m_v] = WeightedSubBTreePart(0)
         w_max = 0
         # Bottom-up propagation for considering v's descendant subcases in sequential order (v is not leaf)
         # -->   p   ---->   v   ----[i.]---->   b
@@ -120,14 +121,15 @@ def biheuristic_btree_partitioning(tree: dict[str | int, dict[str | int, dict[st
                     # CUT: v -> b edge is marked as a cut
                     if mem_b == OPT:
                         # Sub-partitions are just concatenated
-                        mem, weight, barr = mem_v, sub_v.weight + sub_b.weight, sub_v.barr | sub_b.barr
+                        mem, weight, barr = mem_v, sub_v.weight + sub_b.weight, BarrierLink(b, sub_v.barr, sub_b.barr)
                     # MERGE: v -> b edge is marked as a merge
                     elif (mem := mem_v + mem_b) > M:
                         # Infeasible subcase due to exceeded memory constraint
                         continue
                     else:
                         # Top blocks of the two sub-partitions are merged together with root node v
-                        weight, barr = sub_v.weight + sub_b.weight + r_b * d_b, sub_v.barr | sub_b.barr - {b}
+                        weight = sub_v.weight + sub_b.weight + r_b * d_b
+                        barr = BarrierLink(None, sub_v.barr, sub_b.barr)
                     # Store the max-weight subcase
                     sub_lats = lat, top_blk_lat
                     # Check whether the current subcase is a better sub-solution for state (v, sub_lats, mem)
@@ -177,7 +179,7 @@ def biheuristic_btree_partitioning(tree: dict[str | int, dict[str | int, dict[st
     # Subcases under the root node contain the feasible partitioning
     if opt_lats := max(DP[root], key=lambda _l: DP[root][_l][OPT].weight, default=None):
         opt = DP[root][opt_lats][OPT]
-        return recreate_subtree_blocks(tree, opt.barr), opt.weight, opt_lats[0]
+        return recreate_subtree_blocks(tree, BarrierLink(root, opt.barr)), opt.weight, opt_lats[0]
     else:
         # No feasible solution
         return INFEASIBLE
@@ -223,7 +225,7 @@ class WeightedSubLTreePart(typing.NamedTuple):
     weight: int = 0  # Cumulative weights of covered edges in the subtree partitioning
     top_lat: int = 0  # Calculated latency for the topmost partition block
     mul: int = 1  # Last serialization multiplier of the top/first block of the subtree partitioning
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning
 
     def __repr__(self):
         return repr(tuple(self))
@@ -231,7 +233,8 @@ class WeightedSubLTreePart(typing.NamedTuple):
 
 def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
                                M: int = math.inf, L: int = math.inf, cp_end: int = None, delay: int = 1,
-                               Epsilon: float = 0.0, Lambda: float = 0.0, bidirectional: bool = True) -> T_RESULTS:
+                               Epsilon: float = 0.0, Lambda: float = 0.0, bidirectional: bool = True,
+                               dedup: bool = False) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -254,6 +257,7 @@ def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, i
     :param Epsilon:         weight factor for state space trimming (0 <= Eps < 1, Eps = 0 falls back to exact calc.)
     :param Lambda:          latency factor for state space trimming (0 <= Lambda, Lambda = 0 falls back to exact calc.)
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
+    :param dedup:           reuse the subcases of isomorphic subtrees, e.g., duplicated subgraphs of a DAG
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
     # Set of critical path's nodes
@@ -271,8 +275,20 @@ def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, i
         L_hat = math.floor(L / l_scale) + t_size
     else:
         l_scale, L_hat = 1.0, L
+    # Subtrees that are isomorphic to an already calculated subtree and the nodes covered by them
+    iso = isomorphic_subtrees(tree, root, cpath) if dedup else {}
+    covered = {w for n, (_, mapping) in iso.items() for w in mapping.values() if w != n}
     # Process subtrees of T in a bottom-up traversal order
     for p, n in ipostorder_dfs(tree, root):
+        if n in covered:
+            # Subcases are already relabeled with the whole isomorphic subtree
+            continue
+        elif n in iso:
+            # Relabel the subcases of all the subtrees of the already calculated isomorphic subtree
+            (_, mapping), memo = iso[n], {}
+            for u, w in mapping.items():
+                TDP[w] = relabel_subcases(TDP[u], mapping, memo)
+            continue
         # Init empty data structure for optimal subcases T_n[v,b]
         DP = collections.defaultdict(lambda: collections.defaultdict(dict))
         # Traverse subtree T_n in a left-right traversal
@@ -294,7 +310,7 @@ def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, i
                     # Rounding latency value for singleton block
                     lat = math.ceil(lat_n / l_scale)
                     # For singleton blocks weight is 0 by default
-                    DP[e_vb][lat][tree.nodes[n][MEMORY]] = WeightedSubLTreePart(0, lat_n, 1, {n})
+                    DP[e_vb][lat][tree.nodes[n][MEMORY]] = WeightedSubLTreePart(0, lat_n, 1, BarrierLink(n))
                 # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
                 else:
                     u, v_p = e_uvp
@@ -341,7 +357,8 @@ def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, i
                                 continue
                             sub_v = DP[v, b_p][lat_v][mem_v]
                             # Sub-partitions are just concatenated
-                            top_lat, weight, barr = sub_v.top_lat, sub_v.weight + opt_b.weight, sub_v.barr | opt_b.barr
+                            top_lat, weight = sub_v.top_lat, sub_v.weight + opt_b.weight
+                            barr = BarrierLink(None, sub_v.barr, opt_b.barr)
                             # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
                             if (lat not in DP[e_vb] or mem_v not in DP[e_vb][lat]
                                     or weight > DP[e_vb][lat][mem_v].weight):
@@ -395,7 +412,7 @@ def bifptas_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, i
 
 def bifptas_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                               cp_end: int = None, delay: int = 1, Epsilon: float = 0.0, Lambda: float = 0.0,
-                              bidirectional: bool = True) -> T_RESULTS:
+                              bidirectional: bool = True, dedup: bool = False) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -412,9 +429,11 @@ def bifptas_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf
     :param Epsilon:         weight factor for state space trimming (0 <= Eps < 1, Eps = 0 falls back to exact calc.)
     :param Lambda:          latency factor for state space trimming (0 <= Lambda, Lambda = 0 falls back to exact calc.)
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
+    :param dedup:           reuse the subcases of isomorphic subtrees, e.g., duplicated subgraphs of a DAG
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
-    partition, *_ = bifptas_ltree_partitioning(tree, root, M, L, cp_end, delay, Epsilon, Lambda, bidirectional)
+    partition, *_ = bifptas_ltree_partitioning(tree, root, M, L, cp_end, delay, Epsilon, Lambda, bidirectional,
+                                               dedup)
     if partition:
         # noinspection PyTypeChecker
         return partition, *recalculate_ser_partitioning(tree, partition, root, cp_end, delay)
@@ -431,7 +450,7 @@ class WeightedDualSubLTreePart(typing.NamedTuple):
     mem: int = 0  # Memory demand of the topmost block in the subtree partitioning
     top_lat: int = 0  # Calculated latency for the topmost partition block
     mul: int = 1  # Last serialization multiplier of the top/first block of the subtree partitioning
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning
 
     def __repr__(self):
         return repr(tuple(self))
@@ -508,7 +527,7 @@ def bifptas_dual_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[s
                     # Rounding latency value for singleton block
                     lat = math.ceil(lat_n / l_scale)
                     # For singleton blocks weight is 0 by default
-                    DP[e_vb][lat][0] = WeightedDualSubLTreePart(m_n, lat_n, 1, {n})
+                    DP[e_vb][lat][0] = WeightedDualSubLTreePart(m_n, lat_n, 1, BarrierLink(n))
                 # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
                 else:
                     u, _ = e_uvp
@@ -556,7 +575,7 @@ def bifptas_dual_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[s
                                 continue
                             # Sub-partitions are just concatenated
                             top_lat, mem = sub_v.top_lat, sub_v.mem
-                            weight, barr = weight_v + weight_b, sub_v.barr | opt_b.barr
+                            weight, barr = weight_v + weight_b, BarrierLink(None, sub_v.barr, opt_b.barr)
                             # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
                             if lat not in DP[e_vb] or weight not in DP[e_vb][lat] or mem < DP[e_vb][lat][weight].mem:
                                 if bidirectional:
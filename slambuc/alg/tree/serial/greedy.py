@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import math
+import typing
 
 import networkx as nx
 
 from slambuc.alg import INFEASIBLE, T_BARRS_GEN, T_RESULTS
-from slambuc.alg.app import PLATFORM
+from slambuc.alg.app import PLATFORM, MEMORY
 from slambuc.alg.util import (isubtrees, ipowerset, ibacktrack_chain, ser_subtree_memory, ser_subtree_cost,
                               ser_subchain_latency)
 
@@ -40,11 +41,133 @@ def isubtrees_exhaustive(tree: nx.DiGraph, root: int, M: int) -> T_BARRS_GEN:
             yield feasible_subtrees
 
 
+def bnb_tree_partitioning(tree: nx.DiGraph, root: int, M: int, L: int, cpath: set[int], delay: int,
+                          cost: typing.Callable[[int, set[int]], int],
+                          memory: typing.Callable[[int, set[int]], int],
+                          latency: typing.Callable[[int, set[int]], int]) -> list[T_RESULTS]:
+    """
+    Calculate all minimal-cost partitionings of a tree by enumerating edge cuts in a depth-first branch-and-bound way.
+
+    Nodes are assigned in top-down (BFS) order either to the block of their parent or to a new block (cut) while
+    block cost, memory and critical path latency are accumulated incrementally. A branch is pruned as soon as a block
+    exceeds the memory limit *M*, the lower bound of the critical path latency exceeds *L* or the lower bound of the
+    partition cost exceeds the cost of the best partitioning found so far. Co-optimal partitionings are returned in
+    the order of the exhaustive cut enumeration of :func:`isubtrees_exhaustive`.
+
+    The block metric functions are called as ``func(barr, nodes)``, where the block cost must be additive over the
+    nodes given the block's barrier node and the block memory is the maximum of the cumulative node memory and the
+    memory of the individual nodes, which holds for both serialized and parallelized execution models.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param M:       upper memory bound of the partition blocks (in MB)
+    :param L:       latency limit defined on the critical path (in ms)
+    :param cpath:   critical path nodes
+    :param delay:   invocation delay between blocks
+    :param cost:    block cost function
+    :param memory:  block memory function
+    :param latency: block latency function on the critical path
+    :return:        list of best partitions, sum cost of the partitioning, and resulted latency
+    """
+    # Nodes in top-down order with the ancestors of each node
+    order, parent, anc = [root], {root: None}, {root: []}
+    for v in order:
+        for c in tree.successors(v):
+            parent[c], anc[c] = v, [v, *anc[v]]
+            order.append(c)
+    # Marginal cost and memory of nodes as block barriers (cut) and merged into an ancestor's block
+    cut_cost = {v: cost(v, {v}) for v in order}
+    merge_cost = {v: {b: cost(b, {parent[v], v}) - cost(b, {parent[v]}) for b in anc[v]} for v in order}
+    cut_mem, node_mem = {v: memory(v, {v}) for v in order}, {v: tree.nodes[v][MEMORY] for v in order}
+    merge_mem = {v: {b: memory(b, {v}) for b in anc[v]} for v in order}
+    if any(min((cut_mem[v], *merge_mem[v].values())) > M for v in order):
+        return [INFEASIBLE]
+    # Cost lower bounds of the not yet assigned nodes
+    rest_cost = [0] * (len(order) + 1)
+    for i in reversed(range(len(order))):
+        v = order[i]
+        rest_cost[i] = rest_cost[i + 1] + min((cut_cost[v], *merge_cost[v].values()))
+    # Weighted latency of critical path segments and minimal latencies of the remaining segmentations
+    chain = [v for v in order if v in cpath]
+    chain_idx = {v: j for j, v in enumerate(chain)}
+    k = len(chain)
+    seg = [[0] * k for _ in range(k)]
+    for s in range(k):
+        for e in range(s, k):
+            lat = latency(chain[s], set(chain[s:e + 1]))
+            seg[s][e] = lat + delay if lat else 0
+    rest_lat = [0] * (k + 1)
+    for j in reversed(range(k)):
+        rest_lat[j] = min(seg[j][e] + rest_lat[e + 1] for e in range(j, k))
+    open_lat = [[0] * k for _ in range(k)]
+    for s in range(k):
+        best = math.inf
+        for e in reversed(range(s, k)):
+            best = min(best, seg[s][e] + rest_lat[e + 1])
+            open_lat[s][e] = best
+    barr, blk_mem = {}, {}
+    best_res, best_cost = [], math.inf
+
+    def dfs(i: int, sum_cost: int, closed_lat: int, seg_start: int, seg_end: int):
+        nonlocal best_res, best_cost
+        # Prune on the lower bound of the partition cost
+        if sum_cost + rest_cost[i] > best_cost:
+            return
+        # Prune on the lower bound of the critical path latency
+        if k and closed_lat + open_lat[seg_start][seg_end] - delay > L:
+            return
+        if i == len(order):
+            sum_lat = closed_lat + seg[seg_start][seg_end] - delay if k else -delay
+            if sum_lat > L:
+                return
+            partition = {}
+            for v in order:
+                partition.setdefault(barr[v], []).append(v)
+            partition = sorted(sorted(blk) for blk in partition.values())
+            if sum_cost < best_cost:
+                best_res, best_cost = [(partition, sum_cost, sum_lat)], sum_cost
+            else:
+                best_res.append((partition, sum_cost, sum_lat))
+            return
+        v = order[i]
+        j = chain_idx.get(v)
+        if parent[v] is not None:
+            # Merge node into the block of its parent
+            b = barr[parent[v]]
+            m_sum, m_max = blk_mem[b]
+            if max(m_sum + node_mem[v], m_max, merge_mem[v][b]) <= M:
+                barr[v], blk_mem[b] = b, (m_sum + node_mem[v], max(m_max, merge_mem[v][b]))
+                dfs(i + 1, sum_cost + merge_cost[v][b], closed_lat, seg_start, j if j is not None else seg_end)
+                blk_mem[b] = m_sum, m_max
+        # Cut the ingress edge of the node
+        if cut_mem[v] <= M:
+            barr[v], blk_mem[v] = v, (node_mem[v], cut_mem[v])
+            if j is None:
+                dfs(i + 1, sum_cost + cut_cost[v], closed_lat, seg_start, seg_end)
+            elif parent[v] is None:
+                dfs(i + 1, sum_cost + cut_cost[v], closed_lat, j, j)
+            else:
+                dfs(i + 1, sum_cost + cut_cost[v], closed_lat + seg[seg_start][seg_end], j, j)
+            del blk_mem[v]
+        barr.pop(v, None)
+
+    dfs(0, 0, 0, 0, 0)
+    if not best_res:
+        return [INFEASIBLE]
+    # Restore the order of co-optimal partitionings wrt. the exhaustive enumeration of cut edges
+    edge_idx = {v: i for i, (_, v) in enumerate(tree.edges(range(1, len(tree))))}
+    best_res.sort(key=lambda res: (len(res[0]), sorted(edge_idx.get(blk[0], math.inf) for blk in res[0]
+                                                       if blk[0] != root)))
+    return best_res
+
+
 def greedy_ser_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                                  cp_end: int = None, delay: int = 1) -> list[T_RESULTS]:
     """
     Calculates minimal-cost partitioning of an app graph(tree) by iterating over all possible cuttings.
 
+    Cuttings are enumerated in a depth-first branch-and-bound way, see :func:`bnb_tree_partitioning`.
+
     Block metrics are calculated based on serialized execution platform model.
 
     :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
@@ -56,24 +179,8 @@ def greedy_ser_tree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     :return:        tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
     cp_end = cp_end if cp_end is not None else max(n for n in tree if n != PLATFORM)
-    best_res, best_cost = [INFEASIBLE], math.inf
     cpath = set(ibacktrack_chain(tree, root, cp_end))
-    # Iterates over all possible cuttings
-    for barrs in isubtrees_exhaustive(tree, root, M):
-        partition = []
-        sum_cost = 0
-        for b, nodes in isubtrees(tree, barrs):
-            partition.append(nodes)
-            sum_cost += ser_subtree_cost(tree, b, nodes)
-        partition.sort()
-        # Calculate blocks of critical path based on the partitioning
-        restricted_blk_lats = [ser_subchain_latency(tree, blk[0], set(blk), cpath) for blk in partition]
-        sum_lat = sum(restricted_blk_lats) + (sum(map(bool, restricted_blk_lats)) - 1) * delay
-        if sum_lat <= L:
-            # Store partitioning with the same best cost for comparison
-            if sum_cost == best_cost:
-                best_res.append((partition, sum_cost, sum_lat))
-            # Initialize new best cost partitioning
-            elif sum_cost < best_cost:
-                best_res, best_cost = [(partition, sum_cost, sum_lat)], sum_cost
-    return best_res
+    return bnb_tree_partitioning(tree, root, M, L, cpath, delay,
+                                 cost=lambda b, nodes: ser_subtree_cost(tree, b, nodes),
+                                 memory=lambda b, nodes: ser_subtree_memory(tree, nodes),
+                                 latency=lambda b, nodes: ser_subchain_latency(tree, b, nodes, cpath))
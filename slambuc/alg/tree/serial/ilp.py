@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
+import copy
 import itertools
 import math
+import time
 import typing
 from collections.abc import Generator
 
@@ -22,6 +24,9 @@ import pulp as lp
 
 from slambuc.alg import LP_LAT, INFEASIBLE, T_RESULTS, T_PART
 from slambuc.alg.app import *
+from slambuc.alg.ext.greedy import min_lat_partition_heuristic, min_weight_greedy_partitioning
+from slambuc.alg.solver import (SparseLpModel, decision_matrix, solution_matrix, SCIPY_MILP, WARM_START_SOLVERS,
+                                 warm_start_solver)
 from slambuc.alg.util import (ipowerset, ipostorder_dfs, ibacktrack_chain, recreate_subtree_blocks, induced_subtrees,
                               ser_subtree_cost, ser_subchain_latency, ser_subtree_memory, verify_limits, x_eval)
 
@@ -47,6 +52,42 @@ def ifeasible_greedy_subtrees(tree: nx.DiGraph, root: int | None, M: int | float
                 yield min(st), st
 
 
+def ifeasible_connected_subtrees(tree: nx.DiGraph, root: int | None,
+                                 M: int | float) -> Generator[tuple[int, set[int]]]:
+    """
+    Generate feasible subtrees by growing connected node sets from each subtree root, which meet the memory
+    constraint *M*.
+
+    Each connected subtree is generated exactly once by extending the current block only with the not yet considered
+    nodes of its frontier, while an extension is discarded as soon as the cumulative memory exceeds *M*. Thus, the
+    enumeration cost is proportional to the number of feasible subtrees instead of the size of the node powerset.
+
+    Block metrics are calculated based on serialized execution platform model.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph (None: consider all nodes of the graph)
+    :param M:       upper memory bound of the partition blocks (in MB)
+    :return:        generator of subtree root and regarding subtree nodes
+    """
+    if root is None:
+        nodes = [v for v in tree if v is not PLATFORM]
+    else:
+        nodes = [v for _, v in ipostorder_dfs(tree, root)]
+    memory = {v: tree.nodes[v][MEMORY] for v in nodes}
+    for b in nodes:
+        if memory[b] > M:
+            continue
+        # Stack of partial blocks in the form of (block nodes, frontier nodes, cumulative memory)
+        stack = [([b], tuple(tree.successors(b)), memory[b])]
+        while stack:
+            blk, frontier, mem = stack.pop()
+            yield b, set(blk)
+            for i, c in enumerate(frontier):
+                # Prune extensions exceeding the memory limit
+                if mem + memory[c] <= M:
+                    stack.append((blk + [c], frontier[i + 1:] + tuple(tree.successors(c)), mem + memory[c]))
+
+
 def ifeasible_subtrees(tree: nx.DiGraph, root: int, M: int | float,
                        filtered: bool = True) -> Generator[tuple[int, set[int]]]:
     """
@@ -113,7 +154,7 @@ def tree_cfg_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L:
                           cp_end: int = None, delay: int = 1, solver: lp.LpSolver = None,
                           timeout: int = None, **lpargs) -> T_RESULTS:
     """
-    Calculates minimal-cost partitioning of a tree based on configuration LP formulation and greedy subcase
+    Calculates minimal-cost partitioning of a tree based on configuration LP formulation and connected subtree
     generation.
     
     Block metrics are calculated based on serialized execution platform model.
@@ -135,7 +176,7 @@ def tree_cfg_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L:
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    model, X = build_tree_cfg_model(tree, root, M, L, cpath, delay, isubtrees=ifeasible_greedy_subtrees)
+    model, X = build_tree_cfg_model(tree, root, M, L, cpath, delay, isubtrees=ifeasible_connected_subtrees)
     solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
     solver.timeLimit = timeout
     status = model.solve(solver=solver, **lpargs)
@@ -205,6 +246,343 @@ def recreate_subtrees_from_xdict(tree: nx.DiGraph, Xn: dict[int, list[lp.LpVaria
     return recreate_subtree_blocks(tree=tree, barr=barr)
 
 
+class BlockMetrics(typing.NamedTuple):
+    """Store the memory limit and metric functions of a class of subtree blocks used for column generation."""
+    M: int | float  # Upper memory bound of the blocks
+    cost: collections.abc.Callable[[int, set[int]], int]  # Block cost calculator for a barrier node and block nodes
+    memory: collections.abc.Callable[[int, set[int]], int]  # Block memory calculator for a barrier and block nodes
+    latency: collections.abc.Callable[[int, set[int]], int]  # Block subchain latency calculator
+
+
+def calc_block_margins(tree: nx.DiGraph, root: int, metrics: BlockMetrics, cpath: set[int],
+                       delay: int) -> dict[int, tuple[list[int], dict[int, int], dict[int, int]]]:
+    """
+    Calculate the marginal cost and latency of nodes wrt. each possible subtree root.
+
+    For a given subtree root, the block cost and latency are additive over the block nodes, hence the metrics of any
+    connected block can be calculated as the sum of the marginal values of its nodes. Nodes violating the memory limit
+    on their own (due to parallel instances) along with their descendants are excluded.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param metrics: memory limit and block metric functions
+    :param cpath:   critical path nodes
+    :param delay:   invocation delay between blocks
+    :return:        subtree nodes in DFS preorder, marginal costs and marginal latencies of nodes for each subtree root
+    """
+    cost, memory, latency, M = metrics.cost, metrics.memory, metrics.latency, metrics.M
+    margins = {}
+    for b in filter(lambda n: n is not PLATFORM, tree):
+        nodes, c_b, l_b = [], {}, {}
+        for v in nx.dfs_preorder_nodes(tree, source=b):
+            if memory(b, {v}) > M:
+                continue
+            elif v == b:
+                c_b[v] = cost(b, {b})
+            elif (u := next(tree.predecessors(v))) in c_b:
+                c_b[v] = cost(b, {u, v}) - cost(b, {u})
+            else:
+                continue
+            nodes.append(v)
+        if b not in c_b:
+            continue
+        if b in cpath:
+            # Latency depends only on the subchain of cpath nodes in the block
+            chain, lat_pre = set(), 0 if b == root else -delay
+            for v in filter(lambda _v: _v in cpath, nodes):
+                chain.add(v)
+                l_b[v] = (lat_v := latency(b, chain)) - lat_pre
+                lat_pre = lat_v
+        margins[b] = nodes, c_b, l_b
+    return margins
+
+
+def iprice_subtrees(tree: nx.DiGraph, M: int | float,
+                    margins: dict[int, tuple[list[int], dict[int, int], dict[int, int]]], duals: dict[int, float],
+                    lat_dual: float = 0.0, tol: float = 1e-6) -> Generator[tuple[int, set[int], float]]:
+    """
+    Generate the connected, memory-feasible subtree with the lowest negative reduced cost for each subtree root using
+    a tree knapsack DP over the marginal node weights.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param M:           upper memory bound of the partition blocks (in MB)
+    :param margins:     marginal node metrics calculated by :func:`calc_block_margins`
+    :param duals:       dual values of the node feasibility constraints
+    :param lat_dual:    dual value of the latency constraint
+    :param tol:         tolerance of negative reduced costs
+    :return:            generator of subtree root, subtree nodes and reduced cost
+    """
+    for b, (nodes, c_b, l_b) in margins.items():
+        # Node weights reduced by the dual values
+        weight = {v: c_b[v] - duals[v] - lat_dual * l_b.get(v, 0) for v in nodes}
+        # Pareto-optimal (memory, weight, nodes) subcases of connected subtrees rooted at the given node
+        subcases = {}
+        for v in reversed(nodes):
+            dp_v = [(tree.nodes[v][MEMORY] if M < math.inf else 0, weight[v], (v,))]
+            for c in filter(lambda _c: _c in subcases, tree.successors(v)):
+                # Only subcases of negative weights can improve the block
+                if dp_c := [sc for sc in subcases.pop(c) if sc[1] < 0]:
+                    dp_v.extend([(m_v + m_c, w_v + w_c, n_v + n_c) for m_v, w_v, n_v in dp_v
+                                 for m_c, w_c, n_c in dp_c if m_v + m_c <= M])
+                    # Keep only subcases with lower weights than any subcase of lower memory demand
+                    dp_v, merged = [], sorted(dp_v, key=lambda sc: sc[:2])
+                    for sc in merged:
+                        if not dp_v or sc[1] < dp_v[-1][1]:
+                            dp_v.append(sc)
+            subcases[v] = dp_v
+        _, w_b, blk = min(subcases[b], key=lambda sc: sc[1])
+        if w_b < -tol:
+            yield b, set(blk), w_b
+
+
+def ireduced_subtrees(tree: nx.DiGraph, M: int | float,
+                      margins: dict[int, tuple[list[int], dict[int, int], dict[int, int]]], duals: dict[int, float],
+                      lat_dual: float = 0.0, limit: float = 0.0) -> Generator[tuple[int, set[int], float]]:
+    """
+    Generate all the connected, memory-feasible subtrees whose reduced cost does not exceed the given *limit*.
+
+    Subtrees are enumerated by growing connected node sets from each subtree root, while partial blocks are pruned as
+    soon as their reduced cost cannot drop below *limit* even with the most improving extension of their frontier.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param M:           upper memory bound of the partition blocks (in MB)
+    :param margins:     marginal node metrics calculated by :func:`calc_block_margins`
+    :param duals:       dual values of the node feasibility constraints
+    :param lat_dual:    dual value of the latency constraint
+    :param limit:       upper bound of the reduced costs
+    :return:            generator of subtree root, subtree nodes and reduced cost
+    """
+    for b, (nodes, c_b, l_b) in margins.items():
+        # Node weights reduced by the dual values
+        weight = {v: c_b[v] - duals[v] - lat_dual * l_b.get(v, 0) for v in nodes}
+        memory = {v: tree.nodes[v][MEMORY] if M < math.inf else 0 for v in nodes}
+        # Lowest reduced cost of connected extensions within the subtree of each node
+        bound = {}
+        for v in reversed(nodes):
+            bound[v] = weight[v] + sum(min(bound[c], 0) for c in tree.successors(v) if c in bound)
+        # Stack of partial blocks in the form of (block nodes, frontier nodes, cumulative memory, reduced cost)
+        stack = [([b], tuple(c for c in tree.successors(b) if c in bound), memory[b], weight[b])]
+        while stack:
+            blk, frontier, mem, w = stack.pop()
+            if w + sum(min(bound[c], 0) for c in frontier) > limit:
+                continue
+            elif w <= limit:
+                yield b, set(blk), w
+            for i, c in enumerate(frontier):
+                if mem + memory[c] <= M:
+                    stack.append((blk + [c], frontier[i + 1:] + tuple(n for n in tree.successors(c) if n in bound),
+                                  mem + memory[c], w + weight[c]))
+
+
+class CfgPricing(typing.NamedTuple):
+    """Store the LP bound and the dual values of an exhausted column generation."""
+    bound: float  # Optimal cost of the LP relaxation as a lower bound of the optimal partitioning cost
+    duals: dict[int, float]  # Dual values of the node feasibility constraints
+    lat_dual: float  # Dual value of the latency constraint
+    margins: list[dict[int, tuple[list[int], dict[int, int], dict[int, int]]]]  # Marginal node metrics of classes
+
+
+def generate_cfg_columns(tree: nx.DiGraph, root: int, L: int, cpath: set[int], delay: int,
+                         metrics: list[BlockMetrics], seeds: list[T_PART], max_iter: int = 100, tol: float = 1e-6,
+                         solver: lp.LpSolver = None,
+                         timeout: int = None) -> tuple[list[list[tuple[int, set[int]]]], CfgPricing | None]:
+    """
+    Generate subtree columns for configuration ILP models using column generation.
+
+    The restricted master problem is initialized by the blocks of the given *seeds* and singleton blocks, then its LP
+    relaxation is iteratively extended with the subtrees of negative reduced costs calculated by
+    :func:`iprice_subtrees` for each class of blocks. The latency constraint is made elastic with an increasing penalty
+    to keep the restricted master problem feasible.
+
+    The LP relaxations are solved by a copy of the given *solver* in LP mode, which must provide the dual values of
+    the constraints. By default, the in-process :class:`SCIPY_MILP` solver is used if available.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param L:           latency limit defined on the critical path (in ms)
+    :param cpath:       critical path nodes
+    :param delay:       invocation delay between blocks
+    :param metrics:     memory limit and block metric functions of each class of blocks
+    :param seeds:       initial partitioning for each class of blocks
+    :param max_iter:    maximum number of pricing iterations
+    :param tol:         tolerance of negative reduced costs
+    :param solver:      specific solver class (default: SciPy's HiGHS or COIN-OR CBC)
+    :param timeout:     time limit of the column generation in sec
+    :return:            list of generated subtree roots and subtree nodes for each class of blocks and the final LP
+                        bound with dual values if no improving column is left (None otherwise)
+    """
+    # Restricted master problem with empty node feasibility and latency constraints
+    model = lp.LpProblem(name="Tree_Partitioning_RMP", sense=lp.LpMinimize)
+    model.setObjective(lp.LpAffineExpression())
+    for v in filter(lambda n: n is not PLATFORM, tree):
+        model.addConstraint(lp.LpConstraint(lp.LpAffineExpression(), lp.LpConstraintEQ, f"Cf_{v:03d}", 1))
+    model.addConstraint(lp.LpConstraint(lp.LpAffineExpression(), lp.LpConstraintLE, LP_LAT, L if L < math.inf else 0))
+    columns = [{} for _ in metrics]
+
+    def add_column(k: int, b: int, blk: set[int]):
+        """Add subtree block as a new column of class *k* to the restricted master problem."""
+        columns[k][frozenset(blk)] = b, blk
+        m = metrics[k]
+        x = lp.LpVariable(f"x_{k}_{b:02d}_{len(columns[k])}", lowBound=0)
+        model.objective.addInPlace(m.cost(b, blk) * x)
+        for n in blk:
+            model.constraints[f"Cf_{n:03d}"].addInPlace(x)
+        if b in cpath and L < math.inf:
+            model.constraints[LP_LAT].addInPlace((m.latency(b, blk) + (delay if b != root else 0)) * x)
+        model.addVariable(x)
+
+    for k, (m, part) in enumerate(zip(metrics, seeds)):
+        for blk in itertools.chain(part, ([v] for v in tree if v is not PLATFORM)):
+            if frozenset(blk) not in columns[k] and m.memory(min(blk), set(blk)) <= m.M:
+                add_column(k, min(blk), set(blk))
+    slack = None
+    if L < math.inf:
+        # Elastic latency constraint with a penalty exceeding the cost of any partitioning
+        slack = lp.LpVariable("s_lat", lowBound=0)
+        model.constraints[LP_LAT].addInPlace(-1 * slack)
+        model.objective.addInPlace((1 + sum(model.objective.values())) * slack)
+        model.addVariable(slack)
+    margins = [calc_block_margins(tree, root, m, cpath, delay) for m in metrics]
+    # Solve the LP relaxations with a copy of the configured solver
+    if solver is None:
+        solver = SCIPY_MILP(msg=False) if SCIPY_MILP().available() else lp.PULP_CBC_CMD(msg=False)
+    solver = copy.copy(solver)
+    solver.mip = False
+    deadline = time.perf_counter() + timeout if timeout is not None else math.inf
+    pricing = None
+    for _ in range(max_iter):
+        if (remaining := deadline - time.perf_counter()) <= 0:
+            break
+        elif timeout is not None:
+            solver.timeLimit = remaining
+        # Solve LP relaxation of the restricted master problem
+        if model.solve(solver=solver) != lp.LpStatusOptimal:
+            break
+        if any(c.pi is None for c in model.constraints.values()):
+            raise lp.PulpSolverError(f"{solver.name}: dual values are not available for column generation")
+        duals = {int(n.split('_')[1]): c.pi for n, c in model.constraints.items() if n.startswith('Cf_')}
+        lat_dual = model.constraints[LP_LAT].pi if L < math.inf else 0.0
+        new_cols = [(k, b, blk) for k, m in enumerate(metrics)
+                    for b, blk, _ in iprice_subtrees(tree, m.M, margins[k], duals, lat_dual, tol)
+                    if frozenset(blk) not in columns[k]]
+        if new_cols:
+            for col in new_cols:
+                add_column(*col)
+        elif slack is not None and slack.varValue > tol:
+            if model.objective[slack] >= 1e12:
+                # The LP relaxation, hence the partitioning problem, is infeasible
+                break
+            # Strengthen the penalty of the violated latency limit
+            model.objective[slack] *= 100
+        else:
+            pricing = CfgPricing(lp.value(model.objective), duals, lat_dual, margins)
+            break
+    return [list(cols.values()) for cols in columns], pricing
+
+
+def solve_cfg_colgen_model(tree: nx.DiGraph, root: int, L: int, cpath: set[int], delay: int,
+                           metrics: list[BlockMetrics], seeds: list[T_PART],
+                           build: collections.abc.Callable[[list[list[tuple[int, set[int]]]]], tuple[lp.LpProblem,
+                                                                                                        typing.Any]],
+                           solver: lp.LpSolver = None, timeout: int = None, max_iter: int = 100, tol: float = 1e-6,
+                           **lpargs) -> tuple[int, lp.LpProblem, typing.Any]:
+    """
+    Solve a configuration ILP model over subtree columns generated by :func:`generate_cfg_columns`.
+
+    The ILP model is first solved with the generated columns (price-and-branch). If the LP pricing is exhausted, any
+    column of a cheaper integer solution must have a reduced cost below the gap between the integer solution and the
+    LP bound wrt. the final dual values. Hence, all such columns are enumerated by :func:`ireduced_subtrees` and the
+    extended ILP model is resolved, which proves the optimality of the result. Otherwise, e.g., if *max_iter* or
+    *timeout* is exceeded, the returned solution is feasible but not necessarily optimal. If the ILP model of the
+    generated columns has no optimal solution, e.g., it is infeasible or stopped by the time limit, its status is
+    returned without enumerating further columns.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param L:           latency limit defined on the critical path (in ms)
+    :param cpath:       critical path nodes
+    :param delay:       invocation delay between blocks
+    :param metrics:     memory limit and block metric functions of each class of blocks
+    :param seeds:       initial partitioning for each class of blocks
+    :param build:       ILP model builder of the subtree columns given for each class of blocks
+    :param solver:      specific solver class (default: COIN-OR CBC)
+    :param timeout:     time limit in sec
+    :param max_iter:    maximum number of pricing iterations
+    :param tol:         tolerance of reduced costs
+    :param lpargs:      additional LP solver parameters
+    :return:            solution status, the solved model and its decision variables
+    """
+    deadline = time.perf_counter() + timeout if timeout is not None else math.inf
+    columns, pricing = generate_cfg_columns(tree, root, L, cpath, delay, metrics, seeds, max_iter, tol, solver,
+                                            timeout)
+    solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
+    while True:
+        model, X = build(columns)
+        solver.timeLimit = max(deadline - time.perf_counter(), 1) if timeout is not None else None
+        status = model.solve(solver=solver, **lpargs)
+        # Without an integer solution of the generated columns, the enumeration of improving columns is unbounded
+        if pricing is None or status != lp.LpStatusOptimal or time.perf_counter() >= deadline:
+            break
+        # Only columns with lower reduced costs than the optimality gap can improve the integer solution
+        gap = lp.value(model.objective) - pricing.bound
+        if gap <= tol * max(abs(pricing.bound), 1):
+            break
+        new_cols = [[(b, blk) for b, blk, _ in ireduced_subtrees(tree, m.M, pricing.margins[k], pricing.duals,
+                                                                   pricing.lat_dual, gap + tol)
+                     if frozenset(blk) not in {frozenset(n) for _, n in cols}]
+                    for k, (m, cols) in enumerate(zip(metrics, columns))]
+        if not any(new_cols):
+            break
+        columns, pricing = [cols + new for cols, new in zip(columns, new_cols)], None
+    return status, model, X
+
+
+def tree_colgen_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
+                             cp_end: int = None, delay: int = 1, solver: lp.LpSolver = None, timeout: int = None,
+                             max_iter: int = 100, **lpargs) -> T_RESULTS:
+    """
+    Calculates minimal-cost partitioning of a tree based on configuration LP formulation and column generation.
+
+    The restricted master problem is seeded with greedy partitioning blocks and extended with subtree columns priced
+    by a tree knapsack DP instead of enumerating all feasible subtrees, then the ILP model is solved with the generated
+    columns and completed by the columns that can still improve the integer solution (see
+    :func:`solve_cfg_colgen_model`). The result is optimal unless the pricing is cut off by *max_iter* or *timeout*.
+
+    Block metrics are calculated based on serialized execution platform model.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param M:           upper memory bound of the partition blocks (in MB)
+    :param L:           latency limit defined on the critical path (in ms)
+    :param cp_end:      tail node of the critical path in the form of subchain[root -> c_pend]
+    :param delay:       invocation delay between blocks
+    :param solver:      specific solver class (default: COIN-OR CBC)
+    :param timeout:     time limit in sec
+    :param max_iter:    maximum number of pricing iterations
+    :param lpargs:      additional LP solver parameters
+    :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
+    """
+    # Critical path
+    cpath = set(ibacktrack_chain(tree, root, cp_end))
+    # Verify the min values of limits for a feasible solution
+    if not all(verify_limits(tree, cpath, M, L)):
+        # No feasible solution due to too strict limits
+        return INFEASIBLE
+    metrics = BlockMetrics(M, lambda b, n: ser_subtree_cost(tree, b, n), lambda b, n: ser_subtree_memory(tree, n),
+                           lambda b, n: ser_subchain_latency(tree, b, n, cpath))
+    # Memory-bounded and latency-aware greedy partitioning as initial columns
+    seeds = [min_weight_greedy_partitioning(tree, root, M, 1, delay, metrics=False)[0] +
+             min_lat_partition_heuristic(tree, root, M, L, 1, cp_end, delay, metrics=False)[0]]
+    status, model, X = solve_cfg_colgen_model(tree, root, L, cpath, delay, [metrics], seeds,
+                                              lambda cols: build_tree_cfg_model(tree, root, M, L, cpath, delay,
+                                                                                isubtrees=lambda *_: iter(cols[0])),
+                                              solver, timeout, max_iter, **lpargs)
+    if status == lp.LpStatusOptimal:
+        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
+        return recreate_subtrees_from_xdict(tree, X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+    else:
+        return INFEASIBLE
+
 ########################################################################################################################
 
 
@@ -275,78 +653,104 @@ def build_greedy_tree_mtx_model(tree: nx.DiGraph, root: int = 1, M: int = math.i
     return model, X
 
 
-def build_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
-                         M: int = math.inf, L: int = math.inf, cpath: set[int] = frozenset(), subchains: bool = False,
-                         delay: int = 1) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+def build_tree_mtx_arrays(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                          M: int = math.inf, L: int = math.inf, cpath: set[int] = frozenset(), subchains: bool = False,
+                          delay: int = 1) -> tuple[SparseLpModel, dict[int, dict[int, int | None]]]:
     """
-    Generate the matrix ILP model directly from formulas.
-    
+    Generate the matrix ILP model directly in sparse array form without creating PuLP objects.
+
+    Node-level coefficients are calculated in advance and the variables, objective terms, and constraint rows of each
+    induced subtree are added at once.
+
     Block metrics are calculated based on serialized execution platform model.
 
-    :return: tuple of the created model and list of decision variables
+    :return: tuple of the created sparse model and the matrix of column indices
     """
     # Model
-    model = lp.LpProblem(name="Tree_Partitioning", sense=lp.LpMinimize)
-    # Decision variable matrix with trivial variables
-    X = {j: {j: lp.LpVariable(f"x_{j:02d}_{j:02d}", cat=lp.LpBinary) if j != root else 1}
-         for j in tree.nodes if j is not PLATFORM}
-    # Empty objective
-    sum_cost = lp.LpAffineExpression()
+    model = SparseLpModel(name="Tree_Partitioning", sense=lp.LpMinimize)
+    nodes = [j for j in tree.nodes if j is not PLATFORM]
+    # Column matrix of decision variables with trivial variables, the constant 1 is denoted by None
+    cols = iter(model.add_variables(f"x_{j:02d}_{j:02d}" for j in nodes if j != root))
+    C = {j: {j: next(cols) if j != root else None} for j in nodes}
+    # Node-level memory demands, ingress edges, egress data overheads and costs of merging into a preceding block
+    mem = {v: tree.nodes[v][MEMORY] for v in C}
+    ingress = {v: next(iter(tree.pred[v].values())) for v in C}
+    egress = {v: sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values()) for v in C}
+    merge = {v: ingress[v][RATE] * (tree.nodes[v][RUNTIME] - ingress[v][DATA]) + egress[v] for v in C}
     # Empty latency constraint
-    sum_lat = lp.LpAffineExpression()
+    sum_lat = []
     # Generate decision variables
     for (p, j), st_edges in induced_subtrees(tree, root):
-        blk_mem = tree.nodes[j][MEMORY] * X[j][j]
         # Add coefficients for single node block [j]
         r_j, d_j, t_j = tree[p][j][RATE], tree[p][j][DATA], tree.nodes[j][RUNTIME]
-        sum_cost += (r_j * (d_j + t_j) + sum(js[RATE] * js[DATA] for js in tree.succ[j].values())) * X[j][j]
+        model.add_objective(C[j][j], r_j * (d_j + t_j) + egress[j])
         if j in cpath:
             jc = next(filter(lambda c: c in cpath, tree.successors(j)), None)
-            sum_lat += (d_j + t_j + (math.ceil(tree[j][jc][RATE] / r_j) * tree[j][jc][DATA] if jc else 0)) * X[j][j]
+            sum_lat.append((C[j][j], d_j + t_j + (math.ceil(tree[j][jc][RATE] / r_j) * tree[j][jc][DATA]
+                                                  if jc else 0)))
             if j != root:
-                sum_lat += delay * X[j][j]
+                sum_lat.append((C[j][j], delay))
+        # Candidate nodes for block_j
+        blk = [v for _, v in st_edges]
+        blk_cols = model.add_variables(f"x_{v:02d}_{j:02d}" for v in blk)
+        for v, c in zip(blk, blk_cols):
+            C[v][j] = c
+        # Add coefficients for merging single nodes to block [j,...]
+        model.add_objectives(blk_cols, [merge[v] for v in blk])
         # Cache instance factor for nodes in cpath
         n_v = 1
-        # Candidate nodes for block_j
-        for u, v in st_edges:
-            X[v][j] = lp.LpVariable(f"x_{v:02d}_{j:02d}", cat=lp.LpBinary)
-            blk_mem += tree.nodes[v][MEMORY] * X[v][j]
-            # Add coefficients for merging single node v to block [j,...]
-            r_v, d_v, t_v = tree[u][v][RATE], tree[u][v][DATA], tree.nodes[v][RUNTIME]
-            sum_cost += (r_v * (t_v - d_v) + sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values())) * X[v][j]
-            # u -> v edge on cpath
-            if v in cpath:
-                n_v *= math.ceil(r_v / tree[next(tree.predecessors(u))][u][RATE])
-                vc = next(filter(lambda c: c in cpath, tree.successors(v)), None)
-                w_v = math.ceil(tree[v][vc][RATE] / r_v) * tree[v][vc][DATA] if vc else 0
-                sum_lat += n_v * (t_v - d_v + w_v) * X[v][j]
-            # Connectivity constraint
-            model += X[u][j] - X[v][j] >= 0, f"Cc_{j:02d}_{u:02d}_{v:02d}"
+        # u -> v edges on cpath
+        for u, v in filter(lambda e: e[1] in cpath, st_edges):
+            n_v *= math.ceil(tree[u][v][RATE] / tree[next(tree.predecessors(u))][u][RATE])
+            vc = next(filter(lambda c: c in cpath, tree.successors(v)), None)
+            w_v = math.ceil(tree[v][vc][RATE] / tree[u][v][RATE]) * tree[v][vc][DATA] if vc else 0
+            sum_lat.append((C[v][j], n_v * (tree.nodes[v][RUNTIME] - tree[u][v][DATA] + w_v)))
+        # Connectivity constraints
+        model.add_difference_constraints([C[u][j] for u, _ in st_edges], blk_cols, lp.LpConstraintGE,
+                                         names=[f"Cc_{j:02d}_{u:02d}_{v:02d}" for u, v in st_edges])
         # Knapsack constraint, X[l][l] <= M for each leaf node l can be omitted
-        if len(blk_mem) > 1 and M < math.inf:
-            model += blk_mem <= M, f"Ck_{j:02d}"
-    # Objective
-    model += sum_cost
+        blk_nodes = blk if j == root else [j, *blk]
+        if len(blk_nodes) > 1 and M < math.inf:
+            model.add_constraints([0] * len(blk_nodes), [C[v][j] for v in blk_nodes], [mem[v] for v in blk_nodes],
+                                  lp.LpConstraintLE, [M - mem[j] if j == root else M], names=[f"Ck_{j:02d}"])
     # Feasibility constraints, X[root][root] = 1 can be omitted else it ensures that X[root][root] must be 1
-    for i in filter(lambda x: x != root, X):
-        model += lp.lpSum(X[i].values()) == 1, f"Cf_{i:02d}"
+    feasible = [i for i in C if i != root]
+    model.add_sum_constraints([list(C[i].values()) for i in feasible], lp.LpConstraintEQ, 1,
+                              names=[f"Cf_{i:02d}" for i in feasible])
     # Path-tree constraints
     if subchains:
-        for pt in ((lp.lpSum(X[i][j] for i in tree.successors(v)) <= 1, f"Cp_{j:02d}_{v:02d}")
-                   for v in X for j in X[v] if tree.succ[v]):
-            model += pt
+        paths = [(v, j) for v in C if tree.succ[v] for j in C[v]]
+        model.add_sum_constraints([[C[i][j] for i in tree.successors(v)] for v, j in paths], lp.LpConstraintLE, 1,
+                                  names=[f"Cp_{j:02d}_{v:02d}" for v, j in paths])
     # Latency constraint
     if L < math.inf:
-        model += sum_lat <= L, LP_LAT
+        model.add_constraint(sum_lat, lp.LpConstraintLE, L, name=LP_LAT)
     else:
         # Add redundant constraint to implicitly calculate the latency value
-        model += sum_lat >= 0, LP_LAT
-    return model, X
+        model.add_constraint(sum_lat, lp.LpConstraintGE, 0, name=LP_LAT)
+    return model, C
+
+
+def build_tree_mtx_model(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                         M: int = math.inf, L: int = math.inf, cpath: set[int] = frozenset(), subchains: bool = False,
+                         delay: int = 1) -> tuple[lp.LpProblem, dict[int, dict[int, lp.LpVariable]]]:
+    """
+    Generate the matrix ILP model directly from formulas.
+
+    The PuLP model is materialized at once from the sparse model of :func:`build_tree_mtx_arrays`.
+
+    Block metrics are calculated based on serialized execution platform model.
+
+    :return: tuple of the created model and list of decision variables
+    """
+    model, C = build_tree_mtx_arrays(tree, root, M, L, cpath, subchains, delay)
+    return model.to_problem(), decision_matrix(model, C)
 
 
 def tree_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L: int = math.inf,
                           cp_end: int = None, delay: int = 1, subchains: bool = False,
-                          solver: lp.LpSolver = None, timeout: int = None, **lpargs) -> T_RESULTS:
+                          solver: lp.LpSolver = None, timeout: int = None, warm_start: T_PART | bool = None,
+                          **lpargs) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of a tree based on the matrix ILP formulation.
 
@@ -361,6 +765,7 @@ def tree_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L:
     :param subchains:   only subchain blocks are considered (path-tree)
     :param solver:      specific solver class (default: COIN-OR CBC)
     :param timeout:     time limit in sec
+    :param warm_start:  initial partitioning or True to use a greedy heuristic (ignored by, e.g., SCIPY_MILP)
     :param lpargs:      additional LP solver parameters
     :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
     """
@@ -370,13 +775,21 @@ def tree_mtx_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf, L:
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    model, X = build_tree_mtx_model(tree, root, M, L, cpath, subchains, delay)
+    model, C = build_tree_mtx_arrays(tree, root, M, L, cpath, subchains, delay)
     solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
     solver.timeLimit = timeout
+    # Initial values are set only for the solvers supporting warm start
+    if warm_start and solver.name in WARM_START_SOLVERS:
+        # Greedy partitioning respecting the memory limit and the latency limit whenever it is possible
+        if warm_start is True:
+            warm_start, *_ = min_lat_partition_heuristic(tree, root, M, L, 1, cp_end, delay, metrics=False)
+        if init_xmatrix_from_partition(decision_matrix(model, C), warm_start):
+            solver = warm_start_solver(solver)
     status = model.solve(solver=solver, **lpargs)
     if status == lp.LpStatusOptimal:
-        opt_cost, opt_lat = round(lp.value(model.objective), 0), round(lp.value(model.constraints[LP_LAT]), 0)
-        return extract_subtrees_from_xmatrix(X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+        opt_cost, opt_lat = round(model.objective_value(), 0), round(model.constraint_value(LP_LAT), 0)
+        partition = extract_subtrees_from_xmatrix(solution_matrix(model, C))
+        return partition, opt_cost, L + opt_lat if L < math.inf else opt_lat
     else:
         return INFEASIBLE
 
@@ -402,6 +815,115 @@ def extract_subtrees_from_xmatrix(X: dict[int, dict[int, lp.LpVariable]]) -> T_P
     return [[i for i in sorted(X) if j in X[i] and x_eval(X[i][j])] for j in sorted(X) if x_eval(X[j][j])]
 
 
+def init_xmatrix_from_partition(X: dict[int, dict[int, lp.LpVariable]], partition: T_PART) -> bool:
+    """
+    Set the initial values of decision variables based on the given *partition* to be used as a warm start.
+
+    The top node *j* of each block is identified as the only block node for which X[v][j] exists for all block nodes.
+
+    :param X:           specific structure of decision variables
+    :param partition:   initial partitioning
+    :return:            whether all nodes are covered by the given partitioning
+    """
+    for x in itertools.chain.from_iterable(x_v.values() for x_v in X.values()):
+        if isinstance(x, lp.LpVariable):
+            x.setInitialValue(0)
+    covered = set()
+    for blk in partition:
+        if (j := next((b for b in blk if all(b in X.get(v, ()) for v in blk)), None)) is None:
+            # Block cannot be represented in the model
+            return False
+        for v in blk:
+            if isinstance(X[v][j], lp.LpVariable):
+                X[v][j].setInitialValue(1)
+        covered.update(blk)
+    return covered == X.keys()
+
+
+class MtxModelTemplate:
+    """
+    Reusable matrix ILP model of a tree that is built only once and re-solved for different memory and latency limits.
+
+    The model is generated with all knapsack constraints, which are toggled on and off, and their right-hand sides
+    along with the latency constraint are updated in place according to the given limits before each solve.
+    Any of the matrix model builders with the common parameters (*root*, *M*, *L*, *cpath*, *subchains*, *delay*) can
+    be used as *builder* while additional builder parameters, e.g., *N*, can be given in *kwargs*.
+    """
+
+    def __init__(self, tree: nx.DiGraph, root: int = 1, cp_end: int = None, delay: int = 1, subchains: bool = False,
+                 builder: typing.Callable[..., tuple[lp.LpProblem, dict]] = build_tree_mtx_model, **kwargs):
+        """
+        Build the matrix ILP model of the given *tree*.
+
+        :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+        :param root:        root node of the graph
+        :param cp_end:      tail node of the critical path in the form of subchain[root -> c_pend]
+        :param delay:       invocation delay between blocks
+        :param subchains:   only subchain blocks are considered (path-tree)
+        :param builder:     matrix model builder function
+        :param kwargs:      additional builder parameters
+        """
+        self.tree, self.root = tree, root
+        self.cpath = set(ibacktrack_chain(tree, root, cp_end))
+        # Finite memory limit to generate all knapsack constraints and infinite latency limit for a GE latency row
+        self.model, self.X = builder(tree, root=root, M=0, L=math.inf, cpath=self.cpath, subchains=subchains,
+                                     delay=delay, **kwargs)
+        # Knapsack constraints (Ck_*, Ck2_*) with their constant terms independent of the memory limit
+        self._knapsacks = {name: (c, c.constant) for name, c in self.model.constraints.items() if name.startswith('Ck')}
+        self._lat_const = self.model.constraints[LP_LAT].constant
+        self.M, self.L = 0, math.inf
+
+    def set_limits(self, M: int = math.inf, L: int = math.inf):
+        """
+        Update the knapsack and latency constraints in place according to the given limits.
+
+        :param M:   upper memory bound of the partition blocks (in MB)
+        :param L:   latency limit defined on the critical path (in ms)
+        """
+        if M != self.M:
+            for name, (c, const) in self._knapsacks.items():
+                if M < math.inf:
+                    c.constant = const - M
+                    self.model.constraints.setdefault(name, c)
+                else:
+                    # Knapsack constraints are redundant without memory limit
+                    self.model.constraints.pop(name, None)
+        lat = self.model.constraints[LP_LAT]
+        if L < math.inf:
+            lat.sense, lat.constant = lp.LpConstraintLE, self._lat_const - L
+        else:
+            # Redundant constraint to implicitly calculate the latency value
+            lat.sense, lat.constant = lp.LpConstraintGE, self._lat_const
+        self.M, self.L = M, L
+
+    def solve(self, M: int = math.inf, L: int = math.inf, solver: lp.LpSolver = None, timeout: int = None,
+              **lpargs) -> T_RESULTS:
+        """
+        Calculate minimal-cost partitioning of the tree for the given memory and latency limits.
+
+        :param M:           upper memory bound of the partition blocks (in MB)
+        :param L:           latency limit defined on the critical path (in ms)
+        :param solver:      specific solver class (default: COIN-OR CBC)
+        :param timeout:     time limit in sec
+        :param lpargs:      additional LP solver parameters
+        :return:            tuple of list of best partitions, sum cost of the partitioning, and resulted latency
+        """
+        # Verify the min values of limits for a feasible solution
+        if not all(verify_limits(self.tree, self.cpath, M, L)):
+            # No feasible solution due to too strict limits
+            return INFEASIBLE
+        self.set_limits(M, L)
+        solver = solver if solver else lp.PULP_CBC_CMD(mip=True, msg=False)
+        solver.timeLimit = timeout
+        status = self.model.solve(solver=solver, **lpargs)
+        if status == lp.LpStatusOptimal:
+            opt_cost = round(lp.value(self.model.objective), 0)
+            opt_lat = round(lp.value(self.model.constraints[LP_LAT]), 0)
+            return extract_subtrees_from_xmatrix(self.X), opt_cost, L + opt_lat if L < math.inf else opt_lat
+        else:
+            return INFEASIBLE
+
+
 ########################################################################################################################
 
 
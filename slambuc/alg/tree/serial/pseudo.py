@@ -18,10 +18,14 @@ import operator
 import typing
 
 import networkx as nx
+import numpy as np
 
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
-from slambuc.alg.util import ipostorder_dfs, ileft_right_dfs, ibacktrack_chain, recreate_subtree_blocks, verify_limits
+from slambuc.alg.app.compact import CompactTree, compact_tree_indexed, restore_partition
+from slambuc.alg.tree.skyline import ParetoSkyline
+from slambuc.alg.util import (ipostorder_dfs, ileft_right_dfs, ibacktrack_chain, recreate_subtree_blocks, verify_limits,
+                              ipareto_frontier, isomorphic_subtrees, relabel_subcases, BarrierLink)
 
 # Constants for attribute index
 OPT = 0
@@ -30,15 +34,138 @@ OPT = 0
 class SubBTreePart(typing.NamedTuple):
     """Store subtree partitioning attributes for a given subcase."""
     cost: int = math.inf  # Sum cost of the subtree partitioning
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning except its root
 
     def __repr__(self):
         return repr(tuple(self))
 
 
-def pseudo_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+def _btree_subcases(tree: CompactTree, root: int, v: int, DP: dict[int, dict], cpath: set[int], M: int, L: int,
+                    delay: int, bidirectional: bool, keep: bool = False):
+    """
+    Calculate the subcases of subtree T_v into *DP[v]* based on the already calculated subcases of v's children.
+
+    :param tree:            compact app tree
+    :param root:            root node of the graph
+    :param v:               root node of the subtree
+    :param DP:              subcases of subtrees
+    :param cpath:           nodes of the critical path
+    :param M:               upper memory bound of the partition blocks in MB
+    :param L:               latency limit defined on the critical path in ms
+    :param delay:           invocation delay between blocks
+    :param bidirectional:   use bidirectional subcase elimination
+    :param keep:            keep the subcases of v's children instead of dropping them from *DP*
+    """
+    _, runtime, memory, rate, data, _, ptr, children = tree.attr
+    # Init empty data structure for optimal results of subtree T_v
+    DP[v] = collections.defaultdict(dict)
+    r_v, d_v, t_v, m_v = rate[v], data[v], runtime[v], memory[v]
+    # SINGLETON: calculate the default subcase of singleton partition of node v
+    cost = r_v * (d_v + t_v) + sum(rate[s] * data[s] for s in children[ptr[v]:ptr[v + 1]])
+    # Only add fetching overhead for root node and omit caching to ensure lat monotonicity of upward merging
+    lat = d_v + t_v if v == root else t_v if v in cpath else 0
+    DP[v][lat, lat][m_v] = SubBTreePart(cost)
+    # Bottom-up propagation for considering v's descendant subcases in sequential order (v is not leaf)
+    # -->   p   ---->   v   ----[i.]---->   b
+    for b in children[ptr[v]:ptr[v + 1]]:
+        # Init empty data structure of subcase T[v,b]
+        _cache = ParetoSkyline()
+        r_b, d_b = rate[b], data[b]
+        # Drop the subcases of b from DP unless they are kept for later reuse
+        DP_b = DP[b] if keep else DP.pop(b)
+        # Calculate possible latency/memory combinations of subcases of v and b
+        for ((lat_v, blk_lat_v), DPv), ((lat_b, blk_lat_b), DPb) in itertools.product(DP[v].items(), DP_b.items()):
+            for (mem_v, sub_v), (mem_b, sub_b) in itertools.product(DPv.items(), DPb.items()):
+                # Latency calculation in case v -> b edge is in cpath
+                if b in cpath:
+                    # CUT: v -> b edge is marked as a cut (opt subcases of b have the dedicated memory value 0)
+                    if mem_b == OPT:
+                        # Add caching overhead of inter-block call
+                        top_blk_lat = blk_lat_v + math.ceil(r_b / r_v) * d_b
+                        # Add invocation delay and fetch overhead of inter-block call
+                        if (lat := top_blk_lat + delay + d_b + lat_b) > L:
+                            # Infeasible subcase due to exceeded latency constraint
+                            continue
+                    # MERGE: v -> b edge is marked as a merge
+                    else:
+                        # Top block's latency comes for only the single cp node v, hence n_v = 1
+                        top_blk_lat = blk_lat_v + math.ceil(r_b / r_v) * blk_lat_b
+                        # Calculate new latency based on the recalculated top block's latency
+                        if (lat := lat_b - blk_lat_b + top_blk_lat) > L:
+                            # Infeasible subcase due to exceeded latency constraint
+                            continue
+                else:
+                    # Top block's attributes remain the same, either v in cpath or not
+                    top_blk_lat, lat = blk_lat_v, lat_v
+                # CUT: v -> b edge is marked as a cut
+                if mem_b == OPT:
+                    # Sub-partitions are just concatenated
+                    mem, barr, cost = mem_v, BarrierLink(b, sub_v.barr, sub_b.barr), sub_v.cost + sub_b.cost
+                # MERGE: v -> b edge is marked as a merge
+                elif (mem := mem_v + mem_b) > M:
+                    # Infeasible subcase due to exceeded memory constraint
+                    continue
+                else:
+                    # Top blocks of the two sub-partitions are merged together with root node v
+                    barr, cost = BarrierLink(None, sub_v.barr, sub_b.barr), sub_v.cost + sub_b.cost - 2 * r_b * d_b
+                # Store the min cost subcase
+                sub_lats = lat, top_blk_lat
+                # Add subcase if it is a better sub-solution for state (v, sub_lats, mem) while eliminating
+                # prior subcases that are dominated by the new subcase
+                _cache.add(sub_lats, mem, SubBTreePart(cost, barr), bidirectional)
+        # Store min subcases as C(v,i-1) for the next iteration of the propagation process
+        DP[v] = _cache
+    # Store the cost-opt subcases wrt. latency for node v encoded with memory value 0
+    for sub_v in DP[v].values():
+        sub_v[OPT] = min(sub_v.values(), key=operator.itemgetter(0))
+
+
+def _btree_results(tree: CompactTree, root: int, subcases: dict, pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
+    """
+    Return the optimal partitioning or the cost-latency Pareto frontier based on the subcases of the *root* node.
+
+    :param tree:        compact app tree
+    :param root:        root node of the graph
+    :param subcases:    subcases of the root node
+    :param pareto:      return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :return:            tuple of optimal partitioning, reached sum cost and latency or the list of such tuples
+    """
+    if pareto:
+        # Cost-opt subcases of the root node's latency states form the cost-latency trade-off of feasible partitionings
+        return [(recreate_subtree_blocks(tree, BarrierLink(root, sub.barr)), cost, lat) for cost, lat, sub in
+                ipareto_frontier((dp[OPT].cost, lats[0], dp[OPT]) for lats, dp in subcases.items())]
+    # Subcases under the root node contain the feasible partitioning
+    if opt_lats := min(subcases, key=lambda _l: subcases[_l][OPT].cost, default=None):
+        opt = subcases[opt_lats][OPT]
+        return recreate_subtree_blocks(tree, BarrierLink(root, opt.barr)), opt.cost, opt_lats[0]
+    else:
+        # No feasible solution
+        return INFEASIBLE
+
+
+def _restore_results(results: T_RESULTS | list[T_RESULTS], mapping: dict | None,
+                     pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
+    """
+    Replace the node indices of the partitioning results with the original node IDs.
+
+    :param results:     partitioning result(s) calculated on the relabeled tree
+    :param mapping:     node ID -> index mapping of the relabeled tree (None if the tree was not relabeled)
+    :param pareto:      results are given as a list of partitionings
+    :return:            partitioning result(s) with the original node IDs
+    """
+    if mapping is None:
+        return results
+    elif pareto:
+        return [(restore_partition(part, mapping), cost, lat) for part, cost, lat in results]
+    else:
+        return restore_partition(results[0], mapping), *results[1:]
+
+
+def pseudo_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph | CompactTree,
+                              root: int = 1,
                               M: int = math.inf, L: int = math.inf, cp_end: int = None, delay: int = 1,
-                              bidirectional: bool = True) -> T_RESULTS:
+                              bidirectional: bool = True, pareto: bool = False,
+                              dedup: bool = False) -> T_RESULTS | list[T_RESULTS]:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -53,92 +180,44 @@ def pseudo_btree_partitioning(tree: dict[str | int, dict[str | int, dict[str, in
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
-    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
+    :param pareto:          return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :param dedup:           reuse the subcases of isomorphic subtrees, e.g., duplicated subgraphs of a DAG
+    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path or the
+                            list of such tuples in increasing order of latency if *pareto* is set
     """
+    # Convert input tree into the array-based form while relabeling node IDs to indices if necessary
+    tree, indices = compact_tree_indexed(tree)
+    if indices is not None:
+        root, cp_end = indices[root], indices.get(cp_end, cp_end)
     # Set of critical path's nodes
     cpath = set(ibacktrack_chain(tree, root, cp_end))
     # Verify the min values of limits for a feasible solution
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
-        return INFEASIBLE
+        return [] if pareto else INFEASIBLE
     # Init empty data structure for optimal results of subtrees T_v
-    DP = {n: collections.defaultdict(dict) for n in tree if n is not PLATFORM}
+    DP = {}
+    # Subtrees that are isomorphic to an already calculated subtree and the nodes covered by them
+    iso = isomorphic_subtrees(tree, root, cpath) if dedup else {}
+    covered = {w for v, (_, mapping) in iso.items() for w in mapping.values() if w != v}
+    # Keep the subcases of subtrees that are reused later
+    reused, kept = {u for u, _ in iso.values()}, {}
     # Iterate nodes in a bottom-up traversal order
     for p, v in ipostorder_dfs(tree, root):
-        r_v, d_v, t_v, m_v = tree[p][v][RATE], tree[p][v][DATA], tree.nodes[v][RUNTIME], tree.nodes[v][MEMORY]
-        # SINGLETON: calculate the default subcase of singleton partition of node v
-        cost = r_v * (d_v + t_v) + sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values())
-        # Only add fetching overhead for root node and omit caching to ensure lat monotonicity of upward merging
-        lat = d_v + t_v if v == root else t_v if v in cpath else 0
-        DP[v][lat, lat][m_v] = SubBTreePart(cost, {v})
-        # Bottom-up propagation for considering v's descendant subcases in sequential order (v is not leaf)
-        # -->   p   ---->   v   ----[i.]---->   b
-        for b in tree.successors(v):
-            # Init empty data structure of subcase T[v,b]
-            _cache = collections.defaultdict(dict)
-            r_b, d_b, t_b = tree[v][b][RATE], tree[v][b][DATA], tree.nodes[b][RUNTIME]
-            # Calculate possible latency/memory combinations while dropping subcases of v and b from DP
-            for ((lat_v, blk_lat_v), DPv), ((lat_b, blk_lat_b), DPb) in itertools.product(DP[v].items(),
-                                                                                          DP.pop(b).items()):
-                for (mem_v, sub_v), (mem_b, sub_b) in itertools.product(DPv.items(), DPb.items()):
-                    # Latency calculation in case v -> b edge is in cpath
-                    if b in cpath:
-                        # CUT: v -> b edge is marked as a cut (opt subcases of b have the dedicated memory value 0)
-                        if mem_b == OPT:
-                            # Add caching overhead of inter-block call
-                            top_blk_lat = blk_lat_v + math.ceil(r_b / r_v) * d_b
-                            # Add invocation delay and fetch overhead of inter-block call
-                            if (lat := top_blk_lat + delay + d_b + lat_b) > L:
-                                # Infeasible subcase due to exceeded latency constraint
-                                continue
-                        # MERGE: v -> b edge is marked as a merge
-                        else:
-                            # Top block's latency comes for only the single cp node v, hence n_v = 1
-                            top_blk_lat = blk_lat_v + math.ceil(r_b / r_v) * blk_lat_b
-                            # Calculate new latency based on the recalculated top block's latency
-                            if (lat := lat_b - blk_lat_b + top_blk_lat) > L:
-                                # Infeasible subcase due to exceeded latency constraint
-                                continue
-                    else:
-                        # Top block's attributes remain the same, either v in cpath or not
-                        top_blk_lat, lat = blk_lat_v, lat_v
-                    # CUT: v -> b edge is marked as a cut
-                    if mem_b == OPT:
-                        # Sub-partitions are just concatenated
-                        mem, barr, cost = mem_v, sub_v.barr | sub_b.barr, sub_v.cost + sub_b.cost
-                    # MERGE: v -> b edge is marked as a merge
-                    elif (mem := mem_v + mem_b) > M:
-                        # Infeasible subcase due to exceeded memory constraint
-                        continue
-                    else:
-                        # Top blocks of the two sub-partitions are merged together with root node v
-                        barr, cost = sub_v.barr | sub_b.barr - {b}, sub_v.cost + sub_b.cost - 2 * r_b * d_b
-                    # Store the min cost subcase
-                    sub_lats = lat, top_blk_lat
-                    # Check whether the current subcase is a better sub-solution for state (v, sub_lats, mem)
-                    if mem not in _cache[sub_lats] or cost < _cache[sub_lats][mem].cost:
-                        if bidirectional:
-                            # Eliminate prior subcases that are dominated by the new subcase
-                            for l, m in tuple((_l, _m) for _l in _cache if _l[0] >= lat and _l[1] >= top_blk_lat
-                                              for _m in _cache[_l] if _m >= mem and _cache[_l][_m].cost >= cost):
-                                if len(_cache[l]) > 1:
-                                    del _cache[l][m]
-                                else:
-                                    del _cache[l]
-                        # Add superior subcase
-                        _cache[sub_lats][mem] = SubBTreePart(cost, barr)
-            # Store min subcases as C(v,i-1) for the next iteration of the propagation process
-            DP[v] = _cache
-        # Store the cost-opt subcases wrt. latency for node v encoded with memory value 0
-        for sub_v in DP[v].values():
-            sub_v[OPT] = min(sub_v.values(), key=operator.itemgetter(0))
+        if v in covered:
+            # Subcases of nodes in reused subtrees are not needed
+            continue
+        elif v in iso:
+            # Relabel the subcases of the already calculated isomorphic subtree
+            u, mapping = iso[v]
+            DP[v] = relabel_subcases(kept[u], mapping)
+        else:
+            # Calculate subcases of subtree T_v while dropping the subcases of v's children
+            _btree_subcases(tree, root, v, DP, cpath, M, L, delay, bidirectional)
+            if v in reused:
+                kept[v] = DP[v]
     # Subcases under the root node contain the feasible partitioning
-    if opt_lats := min(DP[root], key=lambda _l: DP[root][_l][OPT].cost, default=None):
-        opt = DP[root][opt_lats][OPT]
-        return recreate_subtree_blocks(tree, opt.barr), opt.cost, opt_lats[0]
-    else:
-        # No feasible solution
-        return INFEASIBLE
+    return _restore_results(_btree_results(tree, root, DP[root], pareto), indices, pareto)
 
 
 ########################################################################################################################
@@ -148,15 +227,124 @@ class SubLTreePart(typing.NamedTuple):
     """Store subtree partitioning attributes for a given subcase."""
     cost: int = math.inf  # Sum cost of the subtree partitioning
     mul: int = 1  # Last serialization multiplier of the top/first block of the subtree partitioning
-    barr: set[int] = set()  # Barrier/heading nodes of the given subtree partitioning
+    barr: BarrierLink | None = None  # Barrier/heading nodes of the given subtree partitioning
 
     def __repr__(self):
         return repr(tuple(self))
 
 
-def pseudo_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+def _ltree_subcases(tree: CompactTree, n: int, TDP: dict[int, dict], cpath: set[int], M: int, L: int, delay: int,
+                    bidirectional: bool):
+    """
+    Calculate the best subcases of subtree T_n into *TDP[n]* based on the already calculated subcases of its subtrees.
+
+    :param tree:            compact app tree
+    :param n:               root node of the subtree
+    :param TDP:             best subcases of subtrees
+    :param cpath:           nodes of the critical path
+    :param M:               upper memory bound of the partition blocks in MB
+    :param L:               latency limit defined on the critical path in ms
+    :param delay:           invocation delay between blocks
+    :param bidirectional:   use bidirectional subcase elimination
+    """
+    _, runtime, memory, rate, data, _, ptr, children = tree.attr
+    # Init empty data structure for optimal subcases T_n[v,b]
+    DP = collections.defaultdict(ParetoSkyline)
+    # Traverse subtree T_n in a left-right traversal
+    #       |--(j-1.)--> [v_p]   |--(i-1.)--> [b_p]                                 | left side
+    # -->  [u]  ----(j.)---->  [v]  ----(i.)---->  [b]  ----(max_k.)----> [b_k]     | right side
+    for e_uvp, b_p, e_vb in ileft_right_dfs(tree, n):
+        v, b = e_vb
+        # Merge edge u -> v
+        if b == 0:
+            # SINGLETON: C[n,0] - calculate the default subcase of singleton partition of root node n
+            if v == n:
+                r_n, d_n, t_n = rate[n], data[n], runtime[n]
+                cost = r_n * (d_n + t_n) + sum(rate[s] * data[s] for s in children[ptr[n]:ptr[n + 1]])
+                if n in cpath:
+                    nc = next(filter(lambda c: c in cpath, children[ptr[n]:ptr[n + 1]]), None)
+                    lat = d_n + t_n + (math.ceil(rate[nc] / r_n) * data[nc] if nc else 0)
+                else:
+                    lat = 0
+                DP[e_vb].insert(lat, memory[n], SubLTreePart(cost, 1, BarrierLink(n)))
+            # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
+            else:
+                u, v_p = e_uvp
+                r_v, d_v, t_v = rate[v], data[v], runtime[v]
+                # v_p = 0 => no prior sibling node, C[v,0] = C[u,j-1] + delta(u,v)
+                for lat_u in DP[e_uvp]:
+                    for mem_u in DP[e_uvp][lat_u]:
+                        if (mem := mem_u + memory[v]) > M:
+                            # Infeasible subcase due to exceeded memory constraint
+                            continue
+                        sub_u = DP[e_uvp][lat_u][mem_u]
+                        # v in cpath => u in cpath
+                        if v in cpath:
+                            rel_r_v = math.ceil(r_v / rate[u])
+                            n_v = rel_r_v * sub_u.mul
+                            vc = next(filter(lambda c: c in cpath, children[ptr[v]:ptr[v + 1]]), None)
+                            w_v = math.ceil(rate[vc] / r_v) * data[vc] if vc else 0
+                            if (lat := lat_u + n_v * (t_v - d_v + w_v)) > L:
+                                # Infeasible subcase due to exceeded latency constraint
+                                continue
+                        else:
+                            lat, n_v = lat_u, sub_u.mul
+                        cost = sub_u.cost + r_v * (t_v - d_v) + sum(rate[s] * data[s]
+                                                                    for s in children[ptr[v]:ptr[v + 1]])
+                        DP[e_vb].insert(lat, mem, SubLTreePart(cost, n_v, sub_u.barr))
+        # CUT: C[v,b]
+        else:
+            # b_k <- C[v_i, d(v_i)]
+            b_k = children[ptr[b + 1] - 1] if ptr[b + 1] > ptr[b] else 0
+            # Previously merged edge: v -> b  =>  [root ... -> u -> v -> b ...]   |   [b]  --(max_k.)--> [b_w]
+            DP[e_vb] = DP[b, b_k]
+            # Cut edge: v -> b  |  [root ... -> u -> v] - [b ...]   |   v --(i-1.)--> b_p
+            for lat_v in DP[v, b_p]:
+                for mem_v in DP[v, b_p][lat_v]:
+                    for lat_b, opt_b in TDP[b].items():
+                        # b in cpath => v in cpath
+                        if (lat := lat_v + delay + lat_b if b in cpath else lat_v) > L:
+                            # Infeasible subcase due to exceeded latency constraint
+                            continue
+                        sub_v = DP[v, b_p][lat_v][mem_v]
+                        # Sub-partitions are just concatenated
+                        cost, barr = sub_v.cost + opt_b.cost, BarrierLink(None, sub_v.barr, opt_b.barr)
+                        # Add subcase if it is a better sub-solution for state (e_vb, lat, mem) while
+                        # eliminating prior subcases that are dominated by the new subcase
+                        DP[e_vb].add(lat, mem_v, SubLTreePart(cost, sub_v.mul, barr), bidirectional)
+    # Cache the best subcase for subtree T_n
+    n_w = children[ptr[n + 1] - 1] if ptr[n + 1] > ptr[n] else 0
+    # Store the best subcases of subtree T_n
+    TDP[n] = {lat_n: min(dp.values(), key=operator.itemgetter(0)) for lat_n, dp in DP[n, n_w].items()}
+
+
+def _ltree_results(tree: CompactTree, subcases: dict, pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
+    """
+    Return the optimal partitioning or the cost-latency Pareto frontier based on the best subcases of the root node.
+
+    :param tree:        compact app tree
+    :param subcases:    best subcases of the root node
+    :param pareto:      return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :return:            tuple of optimal partitioning, reached sum cost and latency or the list of such tuples
+    """
+    if pareto:
+        # Best subcases of the root node's latency states form the cost-latency trade-off of feasible partitionings
+        return [(recreate_subtree_blocks(tree, sub.barr), cost, lat) for cost, lat, sub in
+                ipareto_frontier((opt.cost, lat, opt) for lat, opt in subcases.items())]
+    # Subcases under the root node contain the feasible partitioning
+    if (opt_lat := min(subcases, key=lambda _l: subcases[_l].cost, default=None)) is not None:
+        opt = subcases[opt_lat]
+        return recreate_subtree_blocks(tree, opt.barr), opt.cost, opt_lat
+    else:
+        # No feasible solution
+        return INFEASIBLE
+
+
+def pseudo_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph | CompactTree,
+                              root: int = 1,
                               M: int = math.inf, L: int = math.inf, cp_end: int = None, delay: int = 1,
-                              bidirectional: bool = True) -> T_RESULTS:
+                              bidirectional: bool = True, pareto: bool = False,
+                              dedup: bool = False) -> T_RESULTS | list[T_RESULTS]:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes, while
@@ -171,100 +359,174 @@ def pseudo_ltree_partitioning(tree: dict[str | int, dict[str | int, dict[str, in
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
-    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
+    :param pareto:          return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+    :param dedup:           reuse the subcases of isomorphic subtrees, e.g., duplicated subgraphs of a DAG
+    :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path or the
+                            list of such tuples in increasing order of latency if *pareto* is set
     """
+    # Convert input tree into the array-based form while relabeling node IDs to indices if necessary
+    tree, indices = compact_tree_indexed(tree)
+    if indices is not None:
+        root, cp_end = indices[root], indices.get(cp_end, cp_end)
     # Set of critical path's nodes
     cpath = set(ibacktrack_chain(tree, root, cp_end))
     # Verify the min values of limits for a feasible solution
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
-        return INFEASIBLE
+        return [] if pareto else INFEASIBLE
     # Init empty data structure for optimal results of subtrees
-    TDP = {n: {} for n in tree if n is not PLATFORM}
+    TDP = {}
+    # Subtrees that are isomorphic to an already calculated subtree and the nodes covered by them
+    iso = isomorphic_subtrees(tree, root, cpath) if dedup else {}
+    covered = {w for n, (_, mapping) in iso.items() for w in mapping.values() if w != n}
     # Process subtrees of T in a bottom-up traversal order
     for p, n in ipostorder_dfs(tree, root):
-        # Init empty data structure for optimal subcases T_n[v,b]
-        DP = collections.defaultdict(lambda: collections.defaultdict(dict))
-        # Traverse subtree T_n in a left-right traversal
-        #       |--(j-1.)--> [v_p]   |--(i-1.)--> [b_p]                                 | left side
-        # -->  [u]  ----(j.)---->  [v]  ----(i.)---->  [b]  ----(max_k.)----> [b_k]     | right side
-        for e_uvp, b_p, e_vb in ileft_right_dfs(tree, n):
-            v, b = e_vb
-            # Merge edge u -> v
-            if b == 0:
-                # SINGLETON: C[n,0] - calculate the default subcase of singleton partition of root node n
-                if v == n:
-                    r_n, d_n, t_n = tree[p][n][RATE], tree[p][n][DATA], tree.nodes[n][RUNTIME]
-                    cost = r_n * (d_n + t_n) + sum(ns[RATE] * ns[DATA] for ns in tree.succ[n].values())
-                    if n in cpath:
-                        nc = next(filter(lambda c: c in cpath, tree.successors(n)), None)
-                        lat = d_n + t_n + (math.ceil(tree[n][nc][RATE] / r_n) * tree[n][nc][DATA] if nc else 0)
-                    else:
-                        lat = 0
-                    DP[e_vb][lat][tree.nodes[n][MEMORY]] = SubLTreePart(cost, 1, {n})
-                # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
-                else:
-                    u, v_p = e_uvp
-                    r_v, d_v, t_v = tree[u][v][RATE], tree[u][v][DATA], tree.nodes[v][RUNTIME]
-                    # v_p = 0 => no prior sibling node, C[v,0] = C[u,j-1] + delta(u,v)
-                    for lat_u in DP[e_uvp]:
-                        for mem_u in DP[e_uvp][lat_u]:
-                            if (mem := mem_u + tree.nodes[v][MEMORY]) > M:
-                                # Infeasible subcase due to exceeded memory constraint
-                                continue
-                            sub_u = DP[e_uvp][lat_u][mem_u]
-                            # v in cpath => u in cpath
-                            if v in cpath:
-                                rel_r_v = math.ceil(r_v / tree[next(tree.predecessors(u))][u][RATE])
-                                n_v = rel_r_v * sub_u.mul
-                                vc = next(filter(lambda c: c in cpath, tree.successors(v)), None)
-                                w_v = math.ceil(tree[v][vc][RATE] / r_v) * tree[v][vc][DATA] if vc else 0
-                                if (lat := lat_u + n_v * (t_v - d_v + w_v)) > L:
-                                    # Infeasible subcase due to exceeded latency constraint
-                                    continue
-                            else:
-                                lat, n_v = lat_u, sub_u.mul
-                            cost = sub_u.cost + r_v * (t_v - d_v) + sum(vs[RATE] * vs[DATA]
-                                                                        for vs in tree.succ[v].values())
-                            DP[e_vb][lat][mem] = SubLTreePart(cost, n_v, sub_u.barr)
-            # CUT: C[v,b]
-            else:
-                # b_k <- C[v_i, d(v_i)]
-                b_k = collections.deque(tree.successors(b), 1).pop() if len(tree.succ[b]) else 0
-                # Previously merged edge: v -> b  =>  [root ... -> u -> v -> b ...]   |   [b]  --(max_k.)--> [b_w]
-                DP[e_vb] = DP[b, b_k]
-                # Cut edge: v -> b  |  [root ... -> u -> v] - [b ...]   |   v --(i-1.)--> b_p
-                for lat_v in DP[v, b_p]:
-                    for mem_v in DP[v, b_p][lat_v]:
-                        for lat_b, opt_b in TDP[b].items():
-                            # b in cpath => v in cpath
-                            if (lat := lat_v + delay + lat_b if b in cpath else lat_v) > L:
-                                # Infeasible subcase due to exceeded latency constraint
-                                continue
-                            sub_v = DP[v, b_p][lat_v][mem_v]
-                            # Sub-partitions are just concatenated
-                            cost, barr = sub_v.cost + opt_b.cost, sub_v.barr | opt_b.barr
-                            # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem_v not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem_v].cost:
-                                if bidirectional:
-                                    # Eliminate prior subcases that are dominated by the new subcase
-                                    for l, m in tuple((_l, _m) for _l in DP[e_vb] if _l >= lat for _m in DP[e_vb][_l]
-                                                      if _m >= mem_v and DP[e_vb][_l][_m].cost >= cost):
-                                        if len(DP[e_vb][l]) > 1:
-                                            del DP[e_vb][l][m]
-                                        else:
-                                            del DP[e_vb][l]
-                                # Add superior subcase
-                                DP[e_vb][lat][mem_v] = SubLTreePart(cost, sub_v.mul, barr)
-        # Cache the best subcase for subtree T_n
-        n_w = collections.deque(tree.successors(n), 1).pop() if len(tree.succ[n]) else 0
-        # Store the best subcases of subtree T_n
-        for lat_n, dp in DP[n, n_w].items():
-            TDP[n][lat_n] = min(dp.values(), key=operator.itemgetter(0))
+        if n in covered:
+            # Subcases are already relabeled with the whole isomorphic subtree
+            continue
+        elif n in iso:
+            # Relabel the subcases of all the subtrees of the already calculated isomorphic subtree
+            (_, mapping), memo = iso[n], {}
+            for u, w in mapping.items():
+                TDP[w] = relabel_subcases(TDP[u], mapping, memo)
+        else:
+            # Calculate the best subcases of subtree T_n
+            _ltree_subcases(tree, n, TDP, cpath, M, L, delay, bidirectional)
     # Subcases under the root node contain the feasible partitioning
-    if (opt_lat := min(TDP[root], key=lambda _l: TDP[root][_l].cost, default=None)) is not None:
-        opt = TDP[root][opt_lat]
-        return recreate_subtree_blocks(tree, opt.barr), opt.cost, opt_lat
-    else:
-        # No feasible solution
-        return INFEASIBLE
+    return _restore_results(_ltree_results(tree, TDP[root], pareto), indices, pareto)
+
+
+########################################################################################################################
+
+# Tree traversal approaches of the incremental partitioning
+BTREE, LTREE = "btree", "ltree"
+
+
+class IncrementalTreePartitioner:
+    """
+    Incremental variant of :func:`pseudo_btree_partitioning` and :func:`pseudo_ltree_partitioning` that keeps the
+    DP tables of all subtrees between consecutive partitioning calls.
+
+    After updating the node runtime/memory or edge rate/data attributes of the tree by :meth:`update`, only the
+    tables of the subtrees containing changed nodes, i.e., the tables on the paths from the changed nodes to the root,
+    are recalculated by the next call of :meth:`partition`. Changes in the tree structure invalidate all the tables.
+
+    Keeping all the subtree tables increases the memory footprint compared to the single-shot algorithms.
+    """
+
+    def __init__(self, tree: nx.DiGraph | CompactTree, root: int = 1, M: int = math.inf, L: int = math.inf,
+                 cp_end: int = None, delay: int = 1, bidirectional: bool = True, traversal: str = LTREE):
+        """
+        Initialize the partitioner without calculating the DP tables.
+
+        :param tree:            app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads
+        :param root:            root node of the graph
+        :param M:               upper memory bound of the partition blocks in MB
+        :param L:               latency limit defined on the critical path in ms
+        :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
+        :param delay:           invocation delay between blocks
+        :param bidirectional:   use bidirectional subcase elimination
+        :param traversal:       tree traversal approach of the underlying algorithm (``btree`` or ``ltree``)
+        """
+        if traversal not in (BTREE, LTREE):
+            raise ValueError(f"Unknown tree traversal approach: {traversal}")
+        self.root, self.M, self.L, self.cp_end, self.delay = root, M, L, cp_end, delay
+        self.bidirectional, self.traversal = bidirectional, traversal
+        self.tree = None
+        self.mapping, self._root = None, root
+        self.cpath = set()
+        self.tables = {}
+        self.dirty = set()
+        self._order = {}
+        self._reset(*compact_tree_indexed(tree))
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(traversal={self.traversal}, nodes={len(self._order)}, "
+                f"dirty={len(self.dirty)})")
+
+    def _reset(self, tree: CompactTree, mapping: dict | None = None):
+        """Store the given *tree* with its node relabeling *mapping* and invalidate all the DP tables."""
+        self.tree, self.mapping = tree, mapping
+        self._root, cp_end = ((mapping[self.root], mapping.get(self.cp_end, self.cp_end)) if mapping
+                              else (self.root, self.cp_end))
+        self.cpath = set(ibacktrack_chain(tree, self._root, cp_end))
+        self._order = {v: i for i, (_, v) in enumerate(ipostorder_dfs(tree, self._root))}
+        self.tables.clear()
+        self.dirty = set(self._order)
+
+    def invalidate(self, v: int):
+        """
+        Mark the DP tables of the subtrees containing node *v* for recalculation.
+
+        :param v:   changed node
+        """
+        self._invalidate(self.mapping[v] if self.mapping is not None else v)
+
+    def _invalidate(self, v: int):
+        """Mark the DP tables of the subtrees containing the node of index *v* for recalculation."""
+        parent = self.tree.attr.parent
+        # Ancestors of a dirty node are already marked
+        while v in self._order and v not in self.dirty:
+            self.dirty.add(v)
+            v = parent[v]
+
+    def update(self, tree: nx.DiGraph | CompactTree) -> set[int]:
+        """
+        Load the updated node and edge attributes of the given *tree* and invalidate the affected DP tables.
+
+        Changed RATE/DATA attributes are assigned to the head node of the related edge.
+
+        :param tree:    app tree with updated attributes
+        :return:        set of changed nodes
+        """
+        if self.mapping is not None and set(tree) == set(self.mapping):
+            # Keep the node indices of the relabeled tree for the same set of nodes
+            new, mapping = CompactTree.from_digraph(nx.relabel_nodes(tree, self.mapping, copy=True)), self.mapping
+        else:
+            new, mapping = compact_tree_indexed(tree)
+        old = self.tree
+        if not ((mapping is None) == (self.mapping is None) and np.array_equal(new.parent, old.parent)
+                and np.array_equal(new.child_ptr, old.child_ptr) and np.array_equal(new.child_idx, old.child_idx)):
+            # Structural change invalidates all the tables
+            self._reset(new, mapping)
+            return self._labels(self._order)
+        changed = np.flatnonzero((new.runtime != old.runtime) | (new.memory != old.memory) |
+                                 (new.rate != old.rate) | (new.data != old.data)).tolist()
+        self.tree = new
+        for v in changed:
+            self._invalidate(v)
+        return self._labels(changed)
+
+    def _labels(self, nodes: typing.Iterable[int]) -> set:
+        """Return the original node IDs of the given node indices."""
+        if self.mapping is None:
+            return set(nodes)
+        labels = {i: v for v, i in self.mapping.items()}
+        return {labels[v] for v in nodes}
+
+    def partition(self, pareto: bool = False) -> T_RESULTS | list[T_RESULTS]:
+        """
+        Calculate the minimal-cost partitioning of the current tree while recalculating only the invalidated tables.
+
+        :param pareto:  return all the cost-latency Pareto-optimal partitionings instead of the min-cost one
+        :return:        tuple of optimal partitioning, reached sum cost and latency on the critical path or the list
+                        of such tuples in increasing order of latency if *pareto* is set
+        """
+        # Verify the min values of limits for a feasible solution
+        if not all(verify_limits(self.tree, self.cpath, self.M, self.L)):
+            # No feasible solution due to too strict limits
+            return [] if pareto else INFEASIBLE
+        # Recalculate invalidated tables in a bottom-up order while keeping the tables of all subtrees
+        for v in sorted(self.dirty, key=self._order.__getitem__):
+            if self.traversal == BTREE:
+                _btree_subcases(self.tree, self._root, v, self.tables, self.cpath, self.M, self.L, self.delay,
+                                self.bidirectional, keep=True)
+            else:
+                _ltree_subcases(self.tree, v, self.tables, self.cpath, self.M, self.L, self.delay, self.bidirectional)
+        self.dirty.clear()
+        # Subcases under the root node contain the feasible partitioning
+        if self.traversal == BTREE:
+            results = _btree_results(self.tree, self._root, self.tables[self._root], pareto)
+        else:
+            results = _ltree_results(self.tree, self.tables[self._root], pareto)
+        return _restore_results(results, self.mapping, pareto)
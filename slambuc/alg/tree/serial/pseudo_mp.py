@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
+import functools
 import heapq
 import itertools
 import math
 import multiprocessing
 import operator
+import os
 import typing
 from collections.abc import Generator
 
@@ -25,8 +27,11 @@ import networkx as nx
 from slambuc.alg import INFEASIBLE, T_RESULTS
 from slambuc.alg.app import *
 from slambuc.alg.tree.serial.pseudo import SubBTreePart, SubLTreePart, OPT
+from slambuc.alg.tree.pool import WorkerPool, PROCESS, partition_subtrees
+from slambuc.alg.tree.shared import SharedTree, SharedSubcases, attach_tree, pack_subcases, recv_subcases
+from slambuc.alg.tree.skyline import ParetoSkyline
 from slambuc.alg.util import (ipostorder_dfs, ibacktrack_chain, recreate_subtree_blocks, ipostorder_tabu_dfs,
-                              ileft_right_dfs, verify_limits)
+                              ileft_right_dfs, verify_limits, BarrierLink)
 
 
 def isubtree_cutoffs(tree: nx.DiGraph, root: int = 1, lb: int = 1,
@@ -111,12 +116,144 @@ def isubtree_splits(tree: nx.DiGraph, root: int = 1) -> Generator[tuple[tuple[in
     yield from ((c, sync) for c, _, sync in isubtree_sync_cutoffs(tree, root, math.ceil(math.sqrt(len(tree) - 1))))
 
 
+class SubtreeSplit(typing.NamedTuple):
+    """Store a subtree split of multiprocess partitioning along with its predicted DP load."""
+    edge: tuple[int | str, int]  # Cut edge of the subtree
+    load: float  # Predicted DP work of the subtree without the subtrees of sync points
+    sync: set[int]  # Root nodes of subtrees which results need to be waited for
+
+
+def get_subtree_work(tree: nx.DiGraph, root: int = 1, M: int = math.inf,
+                     cpath: set[int] = frozenset()) -> dict[int, float]:
+    """
+    Estimate the DP work of each node in *tree* as the number of subcase combinations at the node.
+
+    The subcase count of a subtree is approximated by the distinct memory values of its partitions, bounded by the
+    subtree size, the subtree's memory demand and *M*, multiplied by the count of possible latency value pairs, which
+    grows quadratically with the length of the critical path below the subtree root. The work of a node is the sum of
+    subcase combinations with its children.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param M:       upper memory bound of the partition blocks in MB
+    :param cpath:   critical path nodes
+    :return:        dict of estimated work of the nodes
+    """
+    # Granularity of memory values
+    mems = [tree.nodes[v][MEMORY] for v in tree.nodes if v is not PLATFORM]
+    unit = functools.reduce(math.gcd, mems) if all(isinstance(m, int) for m in mems) else min(mems)
+    size, mem, cp_len, states, work = {}, {}, {}, {}, {}
+    for _, v in ipostorder_dfs(tree, root, inclusive=True):
+        succ = list(tree.successors(v))
+        size[v] = sum(map(size.pop, succ), start=1)
+        mem[v] = sum(map(mem.pop, succ), start=tree.nodes[v][MEMORY])
+        # Latency values differ only along the critical path
+        cp_len[v] = sum((cp_len.pop(c) for c in succ if c in cpath), start=1) if v in cpath else 1
+        states[v] = max(1, min(size[v], min(mem[v], M) // max(unit, 1))) * cp_len[v] ** 2
+        # Each subcase of node v is combined with each subcase of its children
+        work[v] = sum((states[v] * states[c] for c in succ), start=1)
+    return work
+
+
+def isubtree_work_cutoffs(tree: nx.DiGraph, root: int, work: dict[int, float],
+                          threshold: float) -> Generator[SubtreeSplit]:
+    """
+    Recursively return edges that cut off non-trivial subtrees from *tree* with predicted work at least *threshold*.
+
+    :param tree:        app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:        root node of the graph
+    :param work:        estimated DP work of nodes
+    :param threshold:   subtree min work
+    :return:            generator of subtree splits
+    """
+    load, sync = {}, collections.defaultdict(set)
+    for p, v in ipostorder_dfs(tree, root, inclusive=True):
+        brs = [(c, load.pop(c)) for c in tree.successors(v)]
+        load[v] = work[v]
+        for br, w in brs:
+            # Only cut branches with siblings to allow overlapping computation
+            if len(brs) > 1 and threshold <= w:
+                yield SubtreeSplit((v, br), w, sync[br])
+                # Cache subcase node required to be waited as a sync point
+                sync[v].add(br)
+            else:
+                # Add free work of branch and propagate sync points
+                load[v] += w
+                sync[v].update(sync.pop(br, ()))
+        if v == root:
+            yield SubtreeSplit((PLATFORM, root), load.pop(root), sync[root])
+
+
+def predict_makespan(splits: typing.Iterable[SubtreeSplit], workers: int) -> float:
+    """
+    Predict the overall completion time of the given subtree *splits* in terms of DP work using list scheduling.
+
+    Splits are assigned to the first available worker in the given order, which is kept busy until both the split's
+    own work and all its sync points are finished.
+
+    :param splits:  subtree splits in bottom-up order
+    :param workers: workers count
+    :return:        predicted makespan
+    """
+    slots, finish = [0.0] * max(workers, 1), {}
+    for (_, v), w, sync in splits:
+        finish[v] = max(heapq.heappop(slots) + w, max((finish[s] for s in sync), default=0))
+        heapq.heappush(slots, finish[v])
+    return max(finish.values(), default=0)
+
+
+def get_balanced_splits(tree: nx.DiGraph, root: int = 1, workers: int = None, M: int = math.inf,
+                        cpath: set[int] = frozenset(), rounds: int = 16) -> list[SubtreeSplit]:
+    """
+    Calculate the subtree splits for parallelization by balancing the estimated DP work over *workers*.
+
+    Work thresholds are decreased geometrically from the ideal per-worker share, and the splits with the lowest
+    predicted makespan (and fewer splits in case of ties) are selected.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param workers: workers count (default: CPU count)
+    :param M:       upper memory bound of the partition blocks in MB
+    :param cpath:   critical path nodes
+    :param rounds:  number of examined work thresholds
+    :return:        list of subtree splits with predicted loads in bottom-up order
+    """
+    workers = workers if workers else os.cpu_count()
+    work = get_subtree_work(tree, root, M, cpath)
+    share = sum(work.values()) / workers
+    best = None
+    for i in range(rounds):
+        splits = list(isubtree_work_cutoffs(tree, root, work, max(share / 2 ** (i / 2), 1)))
+        # Prefer fewer splits in case of equal predicted makespan
+        key = predict_makespan(splits, workers), len(splits)
+        if best is None or key < best[0]:
+            best = key, splits
+    return best[1]
+
+
+def isubtree_balanced_splits(tree: nx.DiGraph, root: int = 1, workers: int = None, M: int = math.inf,
+                             cpath: set[int] = frozenset()) -> Generator[tuple[tuple[int | str, int], set[int]]]:
+    """
+    Return the cutoff edges of given *tree* along with the mandatory synchronization points by balancing the
+    estimated DP work of subtrees over *workers*.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :param root:    root node of the graph
+    :param workers: workers count (default: CPU count)
+    :param M:       upper memory bound of the partition blocks in MB
+    :param cpath:   critical path nodes
+    :return:        generator of cut edge and related sync points
+    """
+    yield from ((s.edge, s.sync) for s in get_balanced_splits(tree, root, workers, M, cpath))
+
+
 ########################################################################################################################
 
 
 def _btree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
-                        sync: dict[int, multiprocessing.SimpleQueue],
-                        tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                        sync: dict[int, typing.Union[multiprocessing.SimpleQueue, SharedSubcases, dict]],
+                        tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph | SharedTree,
+                        root: int = 1,
                         M: int = math.inf, L: int = math.inf, cpath: set[int] = frozenset(), delay: int = 1,
                         bidirectional: bool = True) -> None | dict[int, dict[tuple[int, int], SubBTreePart]]:
     """
@@ -124,10 +261,11 @@ def _btree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
     while waits for subcases at sync edges.
 
     This function is designed for running in a separate detached subprocess and synchronizing subresults via
-    *SimpleQueue* objects as an IPC method.
+    *SimpleQueue* objects as an IPC method. If the *tree* is given as a shared tree handle, subresults are exchanged
+    as array-encoded tables in shared memory instead of pickled dicts.
 
     :param ready:           object for signaling the end of partitioning
-    :param sync:            object regarding subtrees which results need to be waited for
+    :param sync:            object regarding subtrees which results need to be waited for or the received results
     :param tree:            app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
     :param root:            root node of the graph
     :param M:               upper memory bound of the partition blocks in MB
@@ -137,6 +275,8 @@ def _btree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
+    # Attach to the shared tree in case of shared memory transport
+    shared, tree = isinstance(tree, SharedTree), attach_tree(tree)
     # Allocate empty dict for local subcases combined with prior subcase results
     DP = {}
     # Iterate nodes in a bottom-up traversal order except the subtrees of the sync points
@@ -146,17 +286,16 @@ def _btree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
         cost = r_v * (d_v + t_v) + sum(vs[RATE] * vs[DATA] for vs in tree.succ[v].values())
         # Only add fetching overhead for root node and omit caching to ensure lat monotonicity of upward merging
         lat = d_v + t_v if p is PLATFORM else t_v if v in cpath else 0
-        DP[v] = {(lat, lat): {m_v: SubBTreePart(cost, {v})}}
+        DP[v] = {(lat, lat): {m_v: SubBTreePart(cost)}}
         # Bottom-up propagation for considering v's descendant subcases in rearranged order (non-sync points first)
         # -->   p   ---->   v   ----[i.]---->   b
         for b in itertools.chain(filter(lambda x: x not in sync, tree.successors(v)),
                                  filter(sync.__contains__, tree.successors(v))):
             # Waiting for dependent subprocess to be finished
             if b in sync:
-                DP[b] = sync[b].get()
-                sync[b].close()
+                DP[b] = recv_subcases(sync[b])
             # Init empty data structure of subcase T[v,b]
-            _cache = collections.defaultdict(dict)
+            _cache = ParetoSkyline()
             r_b, d_b, t_b = tree[v][b][RATE], tree[v][b][DATA], tree.nodes[b][RUNTIME]
             # Calculate possible latency/memory combinations while dropping subcases of v and b from DP
             for ((lat_v, blk_lat_v), DPv), ((lat_b, blk_lat_b), DPb) in itertools.product(DP[v].items(),
@@ -187,41 +326,34 @@ def _btree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
                     # CUT: v -> b edge is marked as a cut
                     if mem_b == OPT:
                         # Sub-partitions are just concatenated
-                        mem, barr, cost = mem_v, sub_v.barr | sub_b.barr, sub_v.cost + sub_b.cost
+                        mem, barr, cost = mem_v, BarrierLink(b, sub_v.barr, sub_b.barr), sub_v.cost + sub_b.cost
                     # MERGE: v -> b edge is marked as a merge
                     elif (mem := mem_v + mem_b) > M:
                         # Infeasible subcase due to exceeded memory constraint
                         continue
                     else:
                         # Top blocks of the two sub-partitions are merged together with root node v
-                        barr, cost = sub_v.barr | sub_b.barr - {b}, sub_v.cost + sub_b.cost - 2 * r_b * d_b
+                        barr, cost = BarrierLink(None, sub_v.barr, sub_b.barr), sub_v.cost + sub_b.cost - 2 * r_b * d_b
                     # Store the min cost subcase
                     sub_lats = lat, top_blk_lat
-                    # Check whether the current subcase is a better sub-solution for state (v, sub_lats, mem)
-                    if mem not in _cache[sub_lats] or cost < _cache[sub_lats][mem].cost:
-                        if bidirectional:
-                            # Eliminate prior subcases that are dominated by the new subcase
-                            for l, m in [(_l, _m) for _l in _cache if _l[0] >= lat and _l[1] >= top_blk_lat
-                                         for _m in _cache[_l] if _m >= mem and _cache[_l][_m].cost >= cost]:
-                                if len(_cache[l]) > 1:
-                                    del _cache[l][m]
-                                else:
-                                    del _cache[l]
-                        # Add superior subcase
-                        _cache[sub_lats][mem] = SubBTreePart(cost, barr)
+                    # Add subcase if it is a better sub-solution for state (v, sub_lats, mem) while eliminating
+                    # prior subcases that are dominated by the new subcase
+                    _cache.add(sub_lats, mem, SubBTreePart(cost, barr), bidirectional)
             # Store min subcases as C(v,i-1) for the next iteration of the propagation process
             DP[v] = _cache
             # Drop unnecessary subcases
         # Store the cost-opt subcases wrt. latency for node v encoded with memory value 0
         for sub_v in DP[v].values():
             sub_v[OPT] = min(sub_v.values(), key=operator.itemgetter(0))
-    # Notify waiting process and push optimal subcases or return TDP locally for the main thread
-    return ready.put(DP[root]) if ready else DP
+    # Notify waiting process and push optimal subcases in a transferable form or return DP locally for the main thread
+    return ready.put(pack_subcases(DP[root], shared)) if ready else DP
 
 
 def pseudo_mp_btree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf,
                                  L: int = math.inf, cp_end: int = None, delay: int = 1,
-                                 bidirectional: bool = True) -> T_RESULTS:
+                                 bidirectional: bool = True, shared: bool = True,
+                                 pool: WorkerPool = None, workers: int = None,
+                                 backend: str = PROCESS) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes.
@@ -239,6 +371,10 @@ def pseudo_mp_btree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
+    :param shared:          exchange the tree and subcases via shared memory instead of pickling
+    :param pool:            persistent worker pool used instead of starting new subprocesses
+    :param workers:         balance the estimated work of subtrees over workers instead of using sqrt(n)-sized splits
+    :param backend:         run subtrees in processes or threads (threads are used only if the GIL is disabled)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
     # Critical path
@@ -247,39 +383,14 @@ def pseudo_mp_btree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    workers, events, sync = [], {}, None
-    # Split tree and initiate subprocesses to calculate subcases
-    try:
-        for (p, v), sync in isubtree_splits(tree, root):
-            # Collect event of sync points
-            sync = {s: events[s] for s in sync}
-            if p is not PLATFORM:
-                # Add own event for signaling readiness
-                ready = events.setdefault(v, multiprocessing.SimpleQueue())
-                # Create and start worker process
-                workers.append(multiprocessing.Process(target=_btree_partitioning, name=f"subtree_{v}",
-                                                       args=(ready, sync, tree, v, M, L, cpath, delay, bidirectional),
-                                                       daemon=True))
-                workers[-1].start()
-        # Process last/topmost subtree in the main process and get subresults locally
-        DP = _btree_partitioning(None, sync, tree, root, M, L, cpath, delay, bidirectional)
-    except BaseException:
-        # Terminate all initiated subprocesses in case of interruption
-        for w in workers:
-            w.terminate()
-        # Reraise exception for further handling
-        raise
-    finally:
-        # Wait for all subprocesses to terminate for closing all used resources
-        for w in workers:
-            w.join(timeout=0)
-            if w.is_alive():
-                w.kill()
-                w.join()
+    # Split tree based on estimated subtree work or the subtree size heuristic
+    splits = isubtree_balanced_splits(tree, root, workers, M, cpath) if workers else isubtree_splits(tree, root)
+    DP_root = partition_subtrees(_btree_partitioning, tree, root, splits, (M, L, cpath, delay, bidirectional), shared,
+                                 pool, True, workers, backend)
     # Subcases under the root node contain the feasible partitioning
-    if opt_lats := min(DP[root], key=lambda _l: DP[root][_l][OPT].cost, default=None):
-        opt = DP[root][opt_lats][OPT]
-        return recreate_subtree_blocks(tree, opt.barr), opt.cost, opt_lats[0]
+    if opt_lats := min(DP_root, key=lambda _l: DP_root[_l][OPT].cost, default=None):
+        opt = DP_root[opt_lats][OPT]
+        return recreate_subtree_blocks(tree, BarrierLink(root, opt.barr)), opt.cost, opt_lats[0]
     else:
         # No feasible solution
         return INFEASIBLE
@@ -289,8 +400,9 @@ def pseudo_mp_btree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
 
 
 def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
-                        sync: dict[int, multiprocessing.SimpleQueue],
-                        tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph, root: int = 1,
+                        sync: dict[int, typing.Union[multiprocessing.SimpleQueue, SharedSubcases, dict]],
+                        tree: dict[str | int, dict[str | int, dict[str, int]]] | nx.DiGraph | SharedTree,
+                        root: int = 1,
                         M: int = math.inf, L: int = math.inf, cpath: set[int] = frozenset(), delay: int = 1,
                         bidirectional: bool = True) -> None | dict[int, dict[int, SubBTreePart]]:
     """
@@ -298,10 +410,11 @@ def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
     while waits for subcases at sync edges.
 
     This function is designed for running in a separate detached subprocess and synchronizing subresults via
-    *SimpleQueue* objects as an IPC method.
+    *SimpleQueue* objects as an IPC method. If the *tree* is given as a shared tree handle, subresults are exchanged
+    as array-encoded tables in shared memory instead of pickled dicts.
 
     :param ready:           object for signaling the end of partitioning
-    :param sync:            object regarding subtrees which results need to be waited for
+    :param sync:            object regarding subtrees which results need to be waited for or the received results
     :param tree:            app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
     :param root:            root node of the graph
     :param M:               upper memory bound of the partition blocks in MB
@@ -311,12 +424,14 @@ def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
+    # Attach to the shared tree in case of shared memory transport
+    shared, tree = isinstance(tree, SharedTree), attach_tree(tree)
     # Allocate empty dict for local subcases combined with prior subcase results
     TDP = {}
     # Process subtrees of T in a bottom-up traversal order
     for p, n in ipostorder_tabu_dfs(tree, root, tabu=sync):
         # Init empty data structure for optimal subcases T_n[v,b]
-        DP = collections.defaultdict(lambda: collections.defaultdict(dict))
+        DP = collections.defaultdict(ParetoSkyline)
         # Store sync point of the overlapped subtree
         sentinel = None
         # Traverse subtree T_n in a left-right traversal
@@ -338,7 +453,7 @@ def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
                         lat = d_n + t_n + (math.ceil(tree[n][nc][RATE] / r_n) * tree[n][nc][DATA] if nc else 0)
                     else:
                         lat = 0
-                    DP[e_vb][lat][tree.nodes[n][MEMORY]] = SubLTreePart(cost, 1, {n})
+                    DP[e_vb].insert(lat, tree.nodes[n][MEMORY], SubLTreePart(cost, 1, BarrierLink(n)))
                 # MERGE: C[v,0] - subcase of merging single node v into the n-rooted block containing node u
                 else:
                     u, v_p = e_uvp
@@ -363,20 +478,19 @@ def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
                                 lat, n_v = lat_u, sub_u.mul
                             cost = sub_u.cost + r_v * (t_v - d_v) + sum(vs[RATE] * vs[DATA]
                                                                         for vs in tree.succ[v].values())
-                            DP[e_vb][lat][mem] = SubLTreePart(cost, n_v, sub_u.barr)
+                            DP[e_vb].insert(lat, mem, SubLTreePart(cost, n_v, sub_u.barr))
             # CUT: C[v,b]
             else:
                 # b_k <- C[v_i, d(v_i)]
                 b_k = collections.deque(tree.successors(b), 1).pop() if len(tree.succ[b]) else 0
                 # Previously merged edge: v -> b  =>  [root ... -> u -> v -> b ...]   |   [b]  --(max_k.)--> [b_w]
                 DP[e_vb] = DP[b, b_k]
+                # Waiting for dependent subprocess to be finished and pull optimal subcases
+                if b not in TDP:
+                    TDP.update(recv_subcases(sentinel))
                 # Cut edge: v -> b  |  [root ... -> u -> v] - [b ...]   |   v --(i-1.)--> b_p
                 for lat_v in DP[v, b_p]:
                     for mem_v in DP[v, b_p][lat_v]:
-                        # Waiting for dependent subprocess to be finished and pull optimal subcases
-                        if b not in TDP:
-                            TDP.update(sentinel.get())
-                            sentinel.close()
                         # assert b in TDP, f"proc{root} {b} not in {TDP.keys()}, {e_uvp=}, {b_p=}, {e_vb=}"
                         for lat_b, opt_b in TDP[b].items():
                             # b in cpath => v in cpath
@@ -384,30 +498,23 @@ def _ltree_partitioning(ready: typing.Union[multiprocessing.SimpleQueue, None],
                                 # Infeasible subcase due to exceeded latency constraint
                                 continue
                             sub_v = DP[v, b_p][lat_v][mem_v]
-                            cost, barr = sub_v.cost + opt_b.cost, sub_v.barr | opt_b.barr
-                            # Check whether the current subcase is a better sub-solution for state (e_vb, lat, mem)
-                            if lat not in DP[e_vb] or mem_v not in DP[e_vb][lat] or cost < DP[e_vb][lat][mem_v].cost:
-                                if bidirectional:
-                                    # Eliminate prior subcases that are dominated by the new subcase
-                                    for l, m in [(_l, _m) for _l in DP[e_vb] if _l >= lat for _m in DP[e_vb][_l]
-                                                 if _m >= mem_v and DP[e_vb][_l][_m].cost >= cost]:
-                                        if len(DP[e_vb][l]) > 1:
-                                            del DP[e_vb][l][m]
-                                        else:
-                                            del DP[e_vb][l]
-                                # Add superior subcase
-                                DP[e_vb][lat][mem_v] = SubLTreePart(cost, sub_v.mul, barr)
+                            cost, barr = sub_v.cost + opt_b.cost, BarrierLink(None, sub_v.barr, opt_b.barr)
+                            # Add subcase if it is a better sub-solution for state (e_vb, lat, mem) while
+                            # eliminating prior subcases that are dominated by the new subcase
+                            DP[e_vb].add(lat, mem_v, SubLTreePart(cost, sub_v.mul, barr), bidirectional)
         # Cache the best subcase for subtree T_n
         n_w = collections.deque(tree.successors(n), 1).pop() if len(tree.succ[n]) else 0
         # Store the best subcases of subtree T_n
         TDP[n] = {lat_n: min(dp.values(), key=operator.itemgetter(OPT)) for lat_n, dp in DP[n, n_w].items()}
-    # Notify waiting process and push optimal subcases or return TDP locally for the main thread
-    return ready.put(TDP) if ready else TDP
+    # Notify waiting process and push optimal subcases in a transferable form or return TDP locally for the main thread
+    return ready.put(pack_subcases(TDP, shared)) if ready else TDP
 
 
 def pseudo_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.inf,
                                  L: int = math.inf, cp_end: int = None, delay: int = 1,
-                                 bidirectional: bool = True) -> T_RESULTS:
+                                 bidirectional: bool = True, shared: bool = True,
+                                 pool: WorkerPool = None, workers: int = None,
+                                 backend: str = PROCESS) -> T_RESULTS:
     """
     Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound **M** on the total
     memory of blocks and a latency constraint **L** defined on the subchain between *root* and *cp_end* nodes.
@@ -425,6 +532,10 @@ def pseudo_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     :param cp_end:          tail node of the critical path in the form of subchain[root -> cp_end]
     :param delay:           invocation delay between blocks
     :param bidirectional:   use bidirectional subcase elimination (may introduce quadratic increase in the worst case)
+    :param shared:          exchange the tree and subcases via shared memory instead of pickling
+    :param pool:            persistent worker pool used instead of starting new subprocesses
+    :param workers:         balance the estimated work of subtrees over workers instead of using sqrt(n)-sized splits
+    :param backend:         run subtrees in processes or threads (threads are used only if the GIL is disabled)
     :return:                tuple of optimal partitioning, reached sum cost and latency on the critical path
     """
     # Critical path
@@ -433,35 +544,10 @@ def pseudo_mp_ltree_partitioning(tree: nx.DiGraph, root: int = 1, M: int = math.
     if not all(verify_limits(tree, cpath, M, L)):
         # No feasible solution due to too strict limits
         return INFEASIBLE
-    workers, events, sync = [], {}, None
-    try:
-        # Split tree and initiate subprocesses to calculate subcases
-        for (p, v), sync in isubtree_splits(tree, root):
-            # Collect event of sync points
-            sync = {s: events[s] for s in sync}
-            if p is not PLATFORM:
-                # Add own event for signaling readiness
-                ready = events.setdefault(v, multiprocessing.SimpleQueue())
-                # Create and start worker process
-                workers.append(multiprocessing.Process(target=_ltree_partitioning, name=f"subtree_{v}",
-                                                       args=(ready, sync, tree, v, M, L, cpath, delay, bidirectional),
-                                                       daemon=True))
-                workers[-1].start()
-        # Process last/topmost subtree in the main process and get subresults locally
-        TDP = _ltree_partitioning(None, sync, tree, root, M, L, cpath, delay, bidirectional)
-    except BaseException:
-        # Terminate all initiated subprocesses in case of interruption
-        for w in workers:
-            w.terminate()
-        # Reraise exception for further handling
-        raise
-    finally:
-        # Wait for all subprocesses to terminate for closing all used resources
-        for w in workers:
-            w.join(timeout=0)
-            if w.is_alive():
-                w.kill()
-                w.join()
+    # Split tree based on estimated subtree work or the subtree size heuristic
+    splits = isubtree_balanced_splits(tree, root, workers, M, cpath) if workers else isubtree_splits(tree, root)
+    TDP = partition_subtrees(_ltree_partitioning, tree, root, splits, (M, L, cpath, delay, bidirectional), shared, pool,
+                             workers=workers, backend=backend)
     # Subcases under the root node contain the feasible partitioning
     if (opt_lat := min(TDP[root], key=lambda _l: TDP[root][_l].cost, default=None)) is not None:
         opt = TDP[root][opt_lat]
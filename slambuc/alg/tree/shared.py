@@ -0,0 +1,351 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import multiprocessing
+import os
+import sys
+import typing
+from collections.abc import Generator
+from multiprocessing import resource_tracker, shared_memory
+
+import networkx as nx
+import numpy as np
+
+from slambuc.alg.app.compact import CompactTree, compact_tree
+from slambuc.alg.util import BarrierLink, freeze_barriers
+
+# Index of missing barrier links and nodes in the encoded link arrays
+NO_LINK = -1
+# Alignment of arrays in a shared memory block
+_ALIGN = 8
+# Shared memory blocks are registered to the resource tracker only on POSIX systems
+_TRACKED = os.name == 'posix'
+
+
+class SharedArrays(typing.NamedTuple):
+    """Picklable handle of named arrays stored consecutively in a single shared memory block."""
+    name: str  # Name of the shared memory block
+    layout: tuple[tuple[str, str, tuple[int, ...], int], ...]  # Name, dtype, shape and offset of each array
+
+
+def open_shared_memory(name: str = None, size: int = 0, track: bool = False) -> shared_memory.SharedMemory:
+    """
+    Create a new shared memory block if *name* is not given or attach to an existing one.
+
+    Untracked blocks are not registered to the resource tracker of the current process. Otherwise, the resource
+    tracker of a worker process, which is not necessarily shared with the creator and receiver processes, would try
+    to release the block at its exit again with warnings about leaked or missing blocks. Blocks attached by forked
+    workers sharing the creator's tracker must also be created untracked, as detaching a worker unregisters the
+    block from the shared tracker.
+
+    :param name:    name of an existing block
+    :param size:    size of the created block in bytes
+    :param track:   register the block to the resource tracker
+    :return:        shared memory block
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create=name is None, size=size, track=track)
+    shm = shared_memory.SharedMemory(name, create=name is None, size=size)
+    if _TRACKED and not track:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def unlink_shared_memory(shm: shared_memory.SharedMemory):
+    """
+    Release the given untracked shared memory block.
+
+    :param shm: shared memory block opened by :func:`open_shared_memory`
+    """
+    if sys.version_info < (3, 13) and _TRACKED:
+        # Unlinking always unregisters the block before Python 3.13, hence it is registered to keep the tracker clean
+        resource_tracker.register(shm._name, 'shared_memory')
+    shm.unlink()
+
+
+def share_arrays(track: bool = True, **arrays: np.ndarray) -> tuple[shared_memory.SharedMemory, SharedArrays]:
+    """
+    Copy the given arrays into a newly created shared memory block.
+
+    The caller is responsible for releasing the returned shared memory block, e.g., by :meth:`unlink` or, if it is
+    not tracked, by :func:`load_arrays` in the receiver process.
+
+    :param track:   register the block to the resource tracker of the creator process
+    :param arrays:  named arrays
+    :return:        created shared memory block and the picklable handle of the stored arrays
+    """
+    layout, offset = [], 0
+    for name, arr in arrays.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout.append((name, arr.dtype.str, arr.shape, offset))
+        offset += arr.nbytes
+    shm = open_shared_memory(size=max(offset, 1), track=track)
+    for (_, dtype, shape, off), arr in zip(layout, arrays.values()):
+        np.ndarray(shape, dtype, buffer=shm.buf, offset=off)[...] = arr
+    return shm, SharedArrays(shm.name, tuple(layout))
+
+
+def load_arrays(handle: SharedArrays, unlink: bool = False) -> dict[str, np.ndarray]:
+    """
+    Copy the arrays of the given shared memory *handle* into process-local arrays.
+
+    The shared memory block is attached without registering it to the resource tracker of the current process.
+
+    :param handle:  handle of the stored arrays
+    :param unlink:  release the untracked shared memory block after loading
+    :return:        dict of loaded arrays
+    """
+    shm = open_shared_memory(handle.name)
+    try:
+        return {name: np.ndarray(shape, dtype, buffer=shm.buf, offset=off).copy()
+                for name, dtype, shape, off in handle.layout}
+    finally:
+        shm.close()
+        if unlink:
+            unlink_shared_memory(shm)
+
+
+########################################################################################################################
+
+
+class SharedTree(typing.NamedTuple):
+    """Picklable handle of an app tree stored in shared memory in compact form."""
+    arrays: SharedArrays  # Handle of the compact tree arrays
+    graph: dict  # Graph attributes
+
+
+@contextlib.contextmanager
+def shared_tree(tree: nx.DiGraph | CompactTree) -> Generator[SharedTree | nx.DiGraph]:
+    """
+    Store the compact form of the given *tree* in shared memory for the lifetime of the context.
+
+    Yields the tree itself if it cannot be represented in compact form, e.g., due to non-integer node IDs. The
+    shared memory block is not tracked, since it is attached by subprocesses that may share the resource tracker of
+    the current process, hence it is released explicitly at the end of the context.
+
+    :param tree:    app graph annotated with node runtime(ms), memory(MB) and edge rates and data overheads(ms)
+    :return:        context of the shared tree handle
+    """
+    try:
+        ctree = compact_tree(tree)
+    except ValueError:
+        yield tree
+        return
+    shm, arrays = share_arrays(track=False, parent=ctree.parent, child_ptr=ctree.child_ptr,
+                               child_idx=ctree.child_idx, runtime=ctree.runtime, memory=ctree.memory, rate=ctree.rate,
+                               data=ctree.data, cpu=ctree.cpu)
+    try:
+        yield SharedTree(arrays, ctree.graph)
+    finally:
+        shm.close()
+        unlink_shared_memory(shm)
+
+
+def attach_tree(tree: SharedTree | nx.DiGraph) -> CompactTree | nx.DiGraph:
+    """
+    Return the compact tree of the given shared tree handle or the *tree* itself if it is not shared.
+
+    :param tree:    shared tree handle or app tree
+    :return:        app tree
+    """
+    return CompactTree(**load_arrays(tree.arrays), graph=tree.graph) if isinstance(tree, SharedTree) else tree
+
+
+########################################################################################################################
+
+
+class SharedSubcases(typing.NamedTuple):
+    """Picklable handle of a two-level subcase table ``{key: {key: subcase}}`` stored in array-encoded form."""
+    arrays: SharedArrays  # Handle of the encoded table arrays
+    factory: type | None  # Subcase type with the barrier links as the last field
+    tuple_keys: tuple[bool, bool]  # Whether the outer/inner keys are tuples
+
+
+def encode_barriers(barrs: typing.Iterable[BarrierLink | typing.Collection[int] | None]) -> tuple[
+    list[int], tuple[list[int], list[int], list[int]]]:
+    """
+    Encode the given barrier link structures as arrays of unique links in topological order.
+
+    Links shared between subcases are encoded only once, while plain collections of barrier nodes are converted to
+    chains of links.
+
+    :param barrs:   barrier link structures
+    :return:        link indices of the given barriers and the node, prev and sub arrays of encoded links
+    """
+    index, alias, keep = {}, {}, []
+    node, prev, sub = [], [], []
+    idx = []
+    for barr in barrs:
+        stack = [barr]
+        while stack:
+            b = stack[-1]
+            if b is None or id(b) in index:
+                stack.pop()
+            elif not isinstance(b, BarrierLink):
+                # Plain collection of barrier nodes
+                if id(b) not in alias:
+                    lnk = None
+                    for v in b:
+                        lnk = BarrierLink(v, lnk)
+                    alias[id(b)] = lnk
+                    keep.append(b)
+                if (lnk := alias[id(b)]) is None or id(lnk) in index:
+                    index[id(b)] = index[id(lnk)] if lnk is not None else NO_LINK
+                    stack.pop()
+                else:
+                    stack.append(lnk)
+            elif pending := [c for c in (b.prev, b.sub) if c is not None and id(c) not in index]:
+                stack.extend(pending)
+            else:
+                stack.pop()
+                index[id(b)] = len(node)
+                keep.append(b)
+                node.append(b.node if b.node is not None else NO_LINK)
+                prev.append(index[id(b.prev)] if b.prev is not None else NO_LINK)
+                sub.append(index[id(b.sub)] if b.sub is not None else NO_LINK)
+        idx.append(index[id(barr)] if barr is not None else NO_LINK)
+    return idx, (node, prev, sub)
+
+
+def decode_barriers(node: list[int], prev: list[int], sub: list[int]) -> list[BarrierLink]:
+    """
+    Decode barrier links from the arrays created by :func:`encode_barriers`.
+
+    :param node:    barrier nodes of links
+    :param prev:    indices of preceding links
+    :param sub:     indices of joined links
+    :return:        list of decoded links
+    """
+    links = []
+    for v, p, s in zip(node, prev, sub):
+        links.append(BarrierLink(v if v != NO_LINK else None, links[p] if p != NO_LINK else None,
+                                 links[s] if s != NO_LINK else None))
+    return links
+
+
+def _key_array(keys: list, is_tuple: bool) -> np.ndarray:
+    """Convert the list of scalar/tuple keys into a 2D array."""
+    return np.array([k if is_tuple else (k,) for k in keys]) if keys else np.empty((0, 0), dtype=np.int64)
+
+
+def _key_list(arr: np.ndarray, is_tuple: bool) -> list:
+    """Convert the 2D array of keys into a list of scalar/tuple keys."""
+    return list(map(tuple, arr.tolist())) if is_tuple else arr[:, 0].tolist() if arr.shape[1] else [None] * len(arr)
+
+
+def share_subcases(subcases: dict[typing.Any, dict[typing.Any, tuple]]) -> SharedSubcases:
+    """
+    Store the given two-level table of DP subcases in shared memory in an array-encoded form.
+
+    Subcase keys and numeric fields are stored as columns while barrier links are encoded by
+    :func:`encode_barriers`. The untracked shared memory block is released by the loader of the table.
+
+    :param subcases:    dict of subcases with the barrier links as the last subcase field
+    :return:            picklable handle of the stored table
+    """
+    outer = list(subcases)
+    inner = [k for dp in subcases.values() for k in dp]
+    rows = [s for dp in subcases.values() for s in dp.values()]
+    factory = type(rows[0]) if rows else None
+    tuple_keys = (bool(outer) and isinstance(outer[0], tuple), bool(inner) and isinstance(inner[0], tuple))
+    idx, (node, prev, sub) = encode_barriers(s[-1] for s in rows)
+    columns = {f"f_{i}": np.array(col) for i, col in enumerate(zip(*(s[:-1] for s in rows)))}
+    shm, arrays = share_arrays(track=False, outer=_key_array(outer, tuple_keys[0]),
+                               ptr=np.cumsum([0, *map(len, subcases.values())], dtype=np.int64),
+                               inner=_key_array(inner, tuple_keys[1]), barr=np.array(idx, dtype=np.int64),
+                               node=np.array(node, dtype=np.int64), prev=np.array(prev, dtype=np.int64),
+                               sub=np.array(sub, dtype=np.int64), **columns)
+    shm.close()
+    return SharedSubcases(arrays, factory, tuple_keys)
+
+
+def load_subcases(handle: SharedSubcases) -> dict[typing.Any, dict[typing.Any, tuple]]:
+    """
+    Load the table of DP subcases stored by :func:`share_subcases` and release its shared memory block.
+
+    :param handle:  handle of the stored table
+    :return:        dict of subcases
+    """
+    arrs = load_arrays(handle.arrays, unlink=True)
+    outer, inner = _key_list(arrs['outer'], handle.tuple_keys[0]), _key_list(arrs['inner'], handle.tuple_keys[1])
+    links = decode_barriers(arrs['node'].tolist(), arrs['prev'].tolist(), arrs['sub'].tolist())
+    barrs = [links[i] if i != NO_LINK else None for i in arrs['barr'].tolist()]
+    columns = [arrs[f"f_{i}"].tolist() for i in range(len(arrs) - 7)]
+    rows = list(map(handle.factory._make, zip(*columns, barrs))) if handle.factory else []
+    ptr = arrs['ptr'].tolist()
+    return {k: dict(zip(inner[ptr[i]:ptr[i + 1]], rows[ptr[i]:ptr[i + 1]])) for i, k in enumerate(outer)}
+
+
+def pack_subcases(subcases: dict, shared: bool = True) -> SharedSubcases | dict:
+    """
+    Prepare the given subcases for transferring to another process either via shared memory or pickling.
+
+    :param subcases:    dict of subcases
+    :param shared:      use shared memory
+    :return:            handle of the shared table or the subcases with flattened barriers
+    """
+    return share_subcases(subcases) if shared else freeze_barriers(subcases)
+
+
+def unpack_subcases(data: SharedSubcases | dict) -> dict:
+    """
+    Return the subcases received from another process.
+
+    :param data:    handle of the shared table or dict of subcases
+    :return:        dict of subcases
+    """
+    return load_subcases(data) if isinstance(data, SharedSubcases) else data
+
+
+def recv_subcases(channel: typing.Union[multiprocessing.SimpleQueue, SharedSubcases, dict]) -> dict:
+    """
+    Receive subcases from another process through the given queue or return the already received subcases.
+
+    :param channel: queue of a single transfer or the transferred subcases
+    :return:        dict of subcases
+    """
+    if isinstance(channel, (SharedSubcases, dict)):
+        return unpack_subcases(channel)
+    data = channel.get()
+    channel.close()
+    return unpack_subcases(data)
+
+
+def release_subcases(data: SharedSubcases | dict):
+    """
+    Release the shared memory block of transferred subcases without loading them.
+
+    :param data:    handle of the shared table or dict of subcases
+    """
+    if isinstance(data, SharedSubcases):
+        with contextlib.suppress(FileNotFoundError):
+            shm = open_shared_memory(data.arrays.name)
+            shm.close()
+            unlink_shared_memory(shm)
+
+
+def release_channel(channel: multiprocessing.SimpleQueue):
+    """
+    Release the subcases that are sent through the given queue but not received, e.g., due to an interruption.
+
+    Must be called only after all the processes using the queue are terminated, since the lock of the queue, which
+    might be held by a terminated receiver, is bypassed.
+
+    :param channel: queue of a single transfer
+    """
+    reader = channel._reader
+    with contextlib.suppress(OSError, EOFError):
+        while not reader.closed and reader.poll():
+            release_subcases(reader.recv())
+    channel.close()
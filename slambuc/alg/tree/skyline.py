@@ -0,0 +1,279 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+import itertools
+import typing
+
+# Type of latency and memory keys: single value or pair of values compared component-wise
+T_KEY = int | tuple[int, int]
+
+
+class SortedKeys:
+    """
+    Sorted sequence of unique keys stored in bounded chunks, which supports insertion and removal in sublinear time
+    and the iteration of keys from a lower bound.
+    """
+
+    def __init__(self, keys: typing.Iterable[T_KEY] = (), load: int = 256):
+        """
+        Initialize the sequence with the given *keys*.
+
+        :param keys:    initial keys
+        :param load:    chunk size (chunks are split at the double of the given size)
+        """
+        keys = sorted(keys)
+        self.load = load
+        self.chunks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self.maxes = [chunk[-1] for chunk in self.chunks]
+
+    def __len__(self) -> int:
+        return sum(map(len, self.chunks))
+
+    def __iter__(self) -> typing.Iterator[T_KEY]:
+        return itertools.chain.from_iterable(self.chunks)
+
+    def add(self, key: T_KEY):
+        """
+        Insert the given *key*.
+
+        :param key: new key
+        """
+        chunks = self.chunks
+        if not chunks:
+            chunks.append([key])
+            self.maxes.append(key)
+            return
+        i = bisect.bisect_left(self.maxes, key)
+        if i == len(chunks):
+            i -= 1
+        chunk = chunks[i]
+        bisect.insort(chunk, key)
+        self.maxes[i] = chunk[-1]
+        # Split oversized chunk to bound the cost of insertions
+        if len(chunk) > 2 * self.load:
+            chunks[i:i + 1] = chunk[:self.load], chunk[self.load:]
+            self.maxes[i:i + 1] = chunk[self.load - 1], chunk[-1]
+
+    def remove(self, key: T_KEY):
+        """
+        Remove the given existing *key*.
+
+        :param key: stored key
+        """
+        i = bisect.bisect_left(self.maxes, key)
+        chunk = self.chunks[i]
+        del chunk[bisect.bisect_left(chunk, key)]
+        if chunk:
+            self.maxes[i] = chunk[-1]
+        else:
+            del self.chunks[i], self.maxes[i]
+
+    def irange(self, start: T_KEY) -> typing.Iterator[T_KEY]:
+        """
+        Return an iterator over the stored keys not lower than *start* in increasing order.
+
+        :param start:   lower bound
+        :return:        iterator of keys
+        """
+        chunks = self.chunks
+        i = bisect.bisect_left(self.maxes, start)
+        if i == len(chunks):
+            return iter(())
+        chunk = chunks[i]
+        keys = itertools.islice(chunk, bisect.bisect_left(chunk, start), None)
+        if i + 1 == len(chunks):
+            return keys
+        return itertools.chain(keys, itertools.chain.from_iterable(itertools.islice(chunks, i + 1, None)))
+
+
+class ParetoSkyline(dict):
+    """
+    Store DP subcases in the form of ``skyline[lat][mem] -> subcase`` while supporting sorted insertion and
+    bisect-based dominance queries for bidirectional subcase elimination.
+
+    A stored subcase is dominated by a new subcase if its latency and memory keys are component-wise not lower
+    and its cost (the first field of the subcase) is not lower than the new subcase's cost.
+
+    Latency keys are kept in a sorted index, hence only the stored subcases with a not lower (first) latency component
+    are checked for dominance. Subcases of the same latency with single memory keys form a monotone memory-cost
+    frontier, i.e., the costs are strictly decreasing with increasing memory keys, hence the dominated subcases of a
+    latency are located by bisection on both the memory and cost axes. Subcases with memory pairs, which are only
+    partially ordered, are scanned instead.
+
+    Subcases must be stored by :meth:`add` or :meth:`insert` to keep the index intact, while reading a missing latency
+    key raises a :class:`KeyError`. Frontiers of subcases stored by :meth:`insert` or by :meth:`add` without
+    elimination are built lazily at the next dominance query by dropping their dominated subcases.
+    """
+
+    def __init__(self, *args):
+        """
+        Initialize skyline with the (optional) initial mapping of stored subcases.
+
+        :param args:    optional mapping of initial subcases in the form of ``{lat: {mem: subcase}}``
+        """
+        super().__init__(*args)
+        self._lats = SortedKeys(self)
+        # Memory keys and negated costs of the latency frontiers in increasing order
+        self._fronts: dict[T_KEY, tuple[list[int], list[int]]] = {}
+
+    def __reduce__(self) -> tuple:
+        # Serialize as a plain dict to avoid transferring the index between processes
+        return dict, (dict(self),)
+
+    def _frontier(self, lat: T_KEY) -> tuple[list[int], list[int]]:
+        """Return the memory-cost frontier of the single memory keys of *lat* while dropping dominated subcases."""
+        if (front := self._fronts.get(lat)) is None:
+            dpl, mems, negs = self[lat], [], []
+            for _m in sorted(dpl):
+                if negs and -negs[-1] <= dpl[_m][0]:
+                    # Subcase is dominated by a lower memory subcase of the same latency
+                    del dpl[_m]
+                else:
+                    mems.append(_m)
+                    negs.append(-dpl[_m][0])
+            front = self._fronts[lat] = mems, negs
+        return front
+
+    def _drop(self, lat: T_KEY):
+        """Remove all subcases of *lat* along with its index entries."""
+        del self[lat]
+        self._fronts.pop(lat, None)
+        self._lats.remove(lat)
+
+    def _ilats(self, lat: T_KEY) -> typing.Iterator[T_KEY]:
+        """Return an iterator over the stored latency keys component-wise not lower than *lat*."""
+        if lat.__class__ is tuple:
+            return (_l for _l in self._lats.irange((lat[0],)) if _l[1] >= lat[1])
+        return self._lats.irange(lat)
+
+    def _dominated_pairs(self, lat: T_KEY, mem: tuple[int, int], cost: int) -> list[tuple[T_KEY, T_KEY]]:
+        """Return the latency and memory keys of the dominated subcases by scanning the memory pairs."""
+        return [(_l, _m) for _l in self._ilats(lat) for _m, sub in self[_l].items()
+                if _m[0] >= mem[0] and _m[1] >= mem[1] and sub[0] >= cost]
+
+    def _dominated_ranges(self, lat: T_KEY, mem: int, cost: int) -> list[tuple[T_KEY, int, int]]:
+        """Return the latency keys along with the index ranges of the dominated subcases of their frontiers."""
+        dominated, fronts = [], self._fronts
+        for _l in self._ilats(lat):
+            mems, negs = fronts.get(_l) or self._frontier(_l)
+            # Dominated subcases of the frontier have not lower memory and not lower cost
+            if mems[-1] >= mem and -negs[0] >= cost:
+                i, j = bisect.bisect_left(mems, mem), bisect.bisect_right(negs, -cost)
+                if i < j:
+                    dominated.append((_l, i, j))
+        return dominated
+
+    def dominated(self, lat: T_KEY, mem: T_KEY, cost: int) -> list[tuple[T_KEY, T_KEY]]:
+        """
+        Return the latency and memory keys of the stored subcases dominated by the given attributes.
+
+        :param lat:     latency key
+        :param mem:     memory key
+        :param cost:    cost value
+        :return:        list of (latency, memory) keys of dominated subcases
+        """
+        if isinstance(mem, tuple):
+            return self._dominated_pairs(lat, mem, cost)
+        return [(_l, _m) for _l, i, j in self._dominated_ranges(lat, mem, cost) for _m in self._fronts[_l][0][i:j]]
+
+    def dominates(self, lat: T_KEY, mem: T_KEY, cost: int) -> bool:
+        """
+        Check whether a stored subcase of the same latency dominates the given attributes.
+
+        :param lat:     latency key
+        :param mem:     memory key
+        :param cost:    cost value
+        :return:        the given attributes are dominated
+        """
+        if lat not in self:
+            return False
+        elif isinstance(mem, tuple):
+            return any(_m[0] <= mem[0] and _m[1] <= mem[1] and sub[0] <= cost for _m, sub in self[lat].items())
+        mems, negs = self._fronts.get(lat) or self._frontier(lat)
+        # The subcase of the highest not greater memory key has the lowest cost among the lower memory subcases
+        i = bisect.bisect_right(mems, mem)
+        return i > 0 and -negs[i - 1] <= cost
+
+    def insert(self, lat: T_KEY, mem: T_KEY, subcase: typing.Any):
+        """
+        Store the given *subcase* for the state (*lat*, *mem*) without dominance checks.
+
+        :param lat:         latency key
+        :param mem:         memory key
+        :param subcase:     subcase
+        """
+        if lat not in self:
+            super().__setitem__(lat, {})
+            self._lats.add(lat)
+        else:
+            # Invalidate the frontier to be rebuilt lazily at the next query
+            self._fronts.pop(lat, None)
+        self[lat][mem] = subcase
+
+    def add(self, lat: T_KEY, mem: T_KEY, subcase: typing.Any, bidirectional: bool = True) -> bool:
+        """
+        Store the given *subcase* for the state (*lat*, *mem*) if it is better than the already stored one while
+        eliminating the prior subcases dominated by the new subcase.
+
+        :param lat:             latency key
+        :param mem:             memory key
+        :param subcase:         subcase
+        :param bidirectional:   eliminate prior subcases that are dominated by the new subcase
+        :return:                whether the subcase is stored
+        """
+        cost = subcase[0]
+        if not bidirectional or mem.__class__ is tuple:
+            if lat in self and mem in self[lat] and self[lat][mem][0] <= cost:
+                return False
+            elif not bidirectional:
+                self.insert(lat, mem, subcase)
+                return True
+            # Eliminate prior subcases that are dominated by the new subcase
+            for _l, _m in self._dominated_pairs(lat, mem, cost):
+                if len(dpl := self[_l]) > 1:
+                    del dpl[_m]
+                else:
+                    self._drop(_l)
+            # Add superior subcase
+            if lat in self:
+                self[lat][mem] = subcase
+            else:
+                super().__setitem__(lat, {mem: subcase})
+                self._lats.add(lat)
+            return True
+        # New subcase is dominated by a subcase of the same latency
+        if self.dominates(lat, mem, cost):
+            return False
+        # Eliminate prior subcases that are dominated by the new subcase
+        for _l, i, j in self._dominated_ranges(lat, mem, cost):
+            mems, negs = self._fronts[_l]
+            if j - i < len(mems):
+                dpl = self[_l]
+                for _m in mems[i:j]:
+                    del dpl[_m]
+                del mems[i:j], negs[i:j]
+            else:
+                self._drop(_l)
+        # Add superior subcase
+        if lat in self:
+            mems, negs = self._fronts[lat]
+            i = bisect.bisect_left(mems, mem)
+            mems.insert(i, mem)
+            negs.insert(i, -cost)
+            self[lat][mem] = subcase
+        else:
+            super().__setitem__(lat, {mem: subcase})
+            self._fronts[lat] = [mem], [-cost]
+            self._lats.add(lat)
+        return True
@@ -22,6 +22,7 @@ import pulp as lp
 
 from slambuc.alg import T_PART, T_BARRS
 from slambuc.alg.app.common import *
+from slambuc.alg.app.compact import CompactTree, as_digraph
 
 
 def verify_limits(tree: nx.DiGraph, cpath: set[int], M: int | float, L: int | float) -> tuple[bool, bool]:
@@ -316,6 +317,64 @@ def induced_subtrees(tree: nx.DiGraph, root: int,
         yield (p, n), subtrees[n]
 
 
+def subtree_codes(tree: nx.DiGraph, root: int, cpath: set[int] = frozenset()) -> dict[int, int]:
+    """
+    Calculate the canonical codes of all subtrees in a bottom-up traversal (AHU encoding).
+
+    Two subtrees get the same code if and only if they are isomorphic with respect to the node attributes, the
+    attributes of the ingress edges and the membership of the critical path, while the order of children is ignored.
+
+    :param tree:    input tree
+    :param root:    root node
+    :param cpath:   nodes of the critical path
+    :return:        dict of subtree codes
+    """
+    codes, labels = {}, {}
+    # Use the cached attributes of compact trees directly
+    attr = tree.attr if isinstance(tree, CompactTree) else None
+    for p, v in ipostorder_dfs(tree, root):
+        if attr is not None:
+            label = (attr.runtime[v], attr.memory[v], attr.cpu[v], attr.rate[v], attr.data[v], v in cpath,
+                     tuple(sorted(codes[c] for c in attr.children[attr.ptr[v]:attr.ptr[v + 1]])))
+        else:
+            label = (tree.nodes[v][RUNTIME], tree.nodes[v][MEMORY], tree.nodes[v].get(CPU, 1), tree[p][v][RATE],
+                     tree[p][v][DATA], v in cpath, tuple(sorted(codes[c] for c in tree.successors(v))))
+        codes[v] = labels.setdefault(label, len(labels))
+    return codes
+
+
+def isomorphic_subtrees(tree: nx.DiGraph, root: int,
+                        cpath: set[int] = frozenset()) -> dict[int, tuple[int, dict[int, int]]]:
+    """
+    Collect the maximal subtrees that are isomorphic to a subtree preceding them in the bottom-up traversal.
+
+    Isomorphic subtrees are identified by :func:`subtree_codes`, while each returned subtree is mapped to the first
+    isomorphic subtree in the bottom-up traversal order. Subtrees of the returned subtrees are omitted.
+
+    :param tree:    input tree
+    :param root:    root node
+    :param cpath:   nodes of the critical path
+    :return:        dict of subtree roots with the root of their isomorphic subtree and the node mapping between them
+    """
+    codes, first, iso = subtree_codes(tree, root, cpath), {}, {}
+    for p, v in ipostorder_dfs(tree, root):
+        # Collect the last subtree root as nested isomorphic subtrees are visited first
+        if (u := first.setdefault(codes[v], v)) != v:
+            for c in tree.successors(v):
+                iso.pop(c, None)
+            iso[v] = u
+    # Isomorphic subtrees are traversed in parallel while pairing children with the same codes
+    mappings = {}
+    for v, u in iso.items():
+        mapping, stack = {}, [(u, v)]
+        while stack:
+            x, y = stack.pop()
+            mapping[x] = y
+            stack.extend(zip(sorted(tree.successors(x), key=codes.get), sorted(tree.successors(y), key=codes.get)))
+        mappings[v] = u, mapping
+    return mappings
+
+
 def ihierarchical_edges(dag: nx.DiGraph, source: int) -> Generator[list[int]]:
     """
     Generate subgraph edges based on the hierarchical levels of BFS traversal.
@@ -461,6 +520,8 @@ def leaf_label_nodes(tree: nx.DiGraph) -> nx.DiGraph:
     :param tree:    input tree
     :return:        labeled tree
     """
+    # Node labels require a mutable graph
+    tree = as_digraph(tree)
     for _, v in ipostorder_dfs(tree, PLATFORM, inclusive=False):
         tree.nodes[v][LABEL] = set().union(*(tree.nodes[s][LABEL] for s in tree.succ[v])) if len(tree.succ[v]) else {v}
     return tree
@@ -503,7 +564,7 @@ def top_subtree_block(tree: nx.DiGraph, barr: T_BARRS) -> nx.Graph:
     :param barr:    set of barrier nodes
     :return:        top subtree
     """
-    return tree.subgraph(next(isubtrees(tree, sorted(barr)))[1])
+    return as_digraph(tree).subgraph(next(isubtrees(tree, sorted(barr)))[1])
 
 
 def path_blocks(partition: T_PART, path: typing.Iterable[int]) -> T_PART:
@@ -553,14 +614,105 @@ def recreate_subchain_blocks(tree: nx.DiGraph, barr: T_BARRS) -> T_PART:
     return sorted(p)
 
 
-def recreate_subtree_blocks(tree: nx.DiGraph, barr: T_BARRS) -> T_PART:
+class BarrierLink(typing.NamedTuple):
+    """
+    Persistent, structurally shared representation of the barrier nodes of a DP subcase.
+
+    Instead of copying the barrier set of the combined subcases, a subcase stores only its local decision (*node*)
+    and back-pointers to the barriers of the combined subcases. Links can also point to plain collections of barrier
+    nodes, e.g., to subcases received from other processes.
+    """
+    node: int | None = None  # Barrier node introduced by the local decision (if any)
+    prev: typing.Union['BarrierLink', T_BARRS, None] = None  # Barriers of the preceding subcase
+    sub: typing.Union['BarrierLink', T_BARRS, None] = None  # Barriers of the joined subcase
+
+
+def flatten_barriers(barr: BarrierLink | T_BARRS | None) -> set[int]:
+    """
+    Collect the barrier nodes of the given barrier link structure without recursion.
+
+    :param barr:    barrier link or collection of barrier nodes
+    :return:        set of barrier nodes
+    """
+    nodes, stack = set(), [barr]
+    while stack:
+        if (b := stack.pop()) is None:
+            continue
+        elif isinstance(b, BarrierLink):
+            if b.node is not None:
+                nodes.add(b.node)
+            stack.extend((b.prev, b.sub))
+        else:
+            nodes.update(b)
+    return nodes
+
+
+def freeze_barriers(subcases: dict) -> dict:
+    """
+    Return a copy of the given (nested) dict of DP subcases with barrier links replaced by flattened barrier sets.
+
+    Used to avoid the transfer of deeply nested barrier links between processes.
+
+    :param subcases:    (nested) dict of subcases with a *barr* attribute
+    :return:            dict of subcases with flattened barriers
+    """
+    return {k: freeze_barriers(s) if isinstance(s, dict) else s._replace(barr=flatten_barriers(s.barr))
+            for k, s in subcases.items()}
+
+
+def relabel_barriers(barr: BarrierLink | T_BARRS | None, mapping: dict[int, int],
+                     memo: dict[int, BarrierLink | T_BARRS] = None) -> BarrierLink | T_BARRS | None:
+    """
+    Return a copy of the given barrier link structure with nodes relabeled by *mapping* without recursion.
+
+    Links shared between structures are relabeled only once if the same *memo* is used.
+
+    :param barr:    barrier link or collection of barrier nodes
+    :param mapping: node mapping
+    :param memo:    already relabeled links
+    :return:        relabeled barrier links
+    """
+    memo, stack = memo if memo is not None else {}, [barr]
+    while stack:
+        if (b := stack[-1]) is None or id(b) in memo:
+            stack.pop()
+        elif not isinstance(b, BarrierLink):
+            stack.pop()
+            memo[id(b)] = type(b)(mapping[v] for v in b)
+        elif pending := [c for c in (b.prev, b.sub) if c is not None and id(c) not in memo]:
+            stack.extend(pending)
+        else:
+            stack.pop()
+            memo[id(b)] = BarrierLink(mapping[b.node] if b.node is not None else None,
+                                      memo[id(b.prev)] if b.prev is not None else None,
+                                      memo[id(b.sub)] if b.sub is not None else None)
+    return memo[id(barr)] if barr is not None else None
+
+
+def relabel_subcases(subcases: dict, mapping: dict[int, int], memo: dict[int, BarrierLink | T_BARRS] = None) -> dict:
+    """
+    Return a copy of the given (nested) dict of DP subcases with barrier nodes relabeled by *mapping*.
+
+    :param subcases:    (nested) dict of subcases with a *barr* attribute
+    :param mapping:     node mapping
+    :param memo:        already relabeled links
+    :return:            dict of relabeled subcases
+    """
+    memo = memo if memo is not None else {}
+    return {k: relabel_subcases(s, mapping, memo) if isinstance(s, dict)
+            else s._replace(barr=relabel_barriers(s.barr, mapping, memo)) for k, s in subcases.items()}
+
+
+def recreate_subtree_blocks(tree: nx.DiGraph, barr: T_BARRS | BarrierLink) -> T_PART:
     """
     Return the partition blocks of the given *tree* cut by the *barr* nodes.
 
     :param tree:    input tree
-    :param barr:    set of barrier nodes
+    :param barr:    set of barrier nodes or barrier link structure
     :return:        list of partition blocks
     """
+    if isinstance(barr, BarrierLink):
+        barr = flatten_barriers(barr)
     p = []
     for b in barr:
         blk = [b]
@@ -575,6 +727,22 @@ def recreate_subtree_blocks(tree: nx.DiGraph, barr: T_BARRS) -> T_PART:
     return sorted(p)
 
 
+def ipareto_frontier(subcases: typing.Iterable[tuple[int | float, int | float, typing.Any]]) -> Generator[
+    tuple[int | float, int | float, typing.Any]]:
+    """
+    Filter the cost-latency Pareto-optimal (non-dominated) entries of the given (cost, latency, subcase) tuples.
+
+    :param subcases:    iterable of cost, latency and related subcase
+    :return:            generator of non-dominated entries in increasing order of latency (decreasing order of cost)
+    """
+    min_cost = math.inf
+    for cost, lat, sub in sorted(subcases, key=operator.itemgetter(1, 0)):
+        # Keep only the entries that have lower cost than all the entries with lower latency
+        if cost < min_cost:
+            min_cost = cost
+            yield cost, lat, sub
+
+
 def split_chain(barr: T_BARRS, n: int, full: bool = True) -> T_PART:
     """
     Recreate partition blocks from barrier nodes for an *n*-size chain := [0, n-1].
@@ -882,6 +1050,9 @@ def ser_subtree_memory(tree: nx.DiGraph, nodes: typing.Iterable[int]) -> int:
     :param nodes:   set of block nodes
     :return:        calculated memory
     """
+    if isinstance(tree, CompactTree):
+        memory = tree.attr.memory
+        return sum(memory[v] for v in nodes)
     return sum(tree.nodes[v][MEMORY] for v in nodes)
 
 
@@ -895,6 +1066,10 @@ def ser_subtree_cost(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx
     :param nodes:   set of block nodes
     :return:        calculated cost
     """
+    if isinstance(tree, CompactTree):
+        _, runtime, _, rate, data, _, ptr, children = tree.attr
+        return sum((rate[v] * runtime[v] + sum(rate[s] * data[s] for s in children[ptr[v]:ptr[v + 1]]
+                                               if s not in nodes) for v in nodes), start=rate[barr] * data[barr])
     p = next(tree.predecessors(barr))
     return sum((tree[next(tree.predecessors(v))][v][RATE] * tree.nodes[v][RUNTIME] +
                 sum(vs[RATE] * vs[DATA] for s, vs in tree.succ[v].items() if s not in nodes)
@@ -938,6 +1113,11 @@ def ser_subchain_latency(tree: dict[str | int, dict[str | int, dict[str, int]]]
     chain = sorted(nodes & cpath)
     # Get next cpath node following the given group
     cb = next(filter(lambda v: v in cpath, tree.successors(chain[-1])), None)
+    if isinstance(tree, CompactTree):
+        _, runtime, _, rate, data, *_ = tree.attr
+        return sum((n_v * runtime[v] + (n_v * math.ceil(rate[cb] / rate[v]) * data[cb]
+                                        if v == chain[-1] and cb is not None else 0)
+                    for n_v, v in zip(iser_mul_factor(rate[v] for v in chain), chain)), start=data[barr])
     p = next(tree.predecessors(barr))
     return sum(((n_v * tree.nodes[v][RUNTIME] +
                  (n_v * math.ceil(tree[v][cb][RATE] / tree[u][v][RATE]) * tree[v][cb][DATA]
@@ -973,6 +1153,10 @@ def par_subtree_memory(tree: dict[str | int, dict[str | int, dict[str, int]]] |
     :param N:       CPU count
     :return:        calculated memory value
     """
+    if isinstance(tree, CompactTree):
+        _, _, memory, rate, *_ = tree.attr
+        return max(sum(memory[v] for v in nodes),
+                   max((min(math.ceil(rate[v] / rate[barr]), N) * memory[v] for v in nodes), default=0))
     r_b = tree[next(tree.predecessors(barr))][barr][RATE]
     return max(sum(tree.nodes[v][MEMORY] for v in nodes),
                max((min(math.ceil(tree[next(tree.predecessors(v))][v][RATE] / r_b), N) * tree.nodes[v][MEMORY]
@@ -990,6 +1174,12 @@ def par_subtree_cost(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx
     :param N:       CPU count
     :return:        calculated cost
     """
+    if isinstance(tree, CompactTree):
+        _, runtime, _, rate, data, _, ptr, children = tree.attr
+        r_b = rate[barr]
+        return sum((par_inst_count(r_b, rate[v], N) * runtime[v] +
+                    sum(par_inst_count(r_b, rate[s], N) * data[s] for s in children[ptr[v]:ptr[v + 1]]
+                        if s not in nodes) for v in nodes), start=r_b * data[barr])
     p = next(tree.predecessors(barr))
     r_b = tree[p][barr][RATE]
     return sum((par_inst_count(r_b, tree[next(tree.predecessors(v))][v][RATE], N) * tree.nodes[v][RUNTIME] +
@@ -1014,6 +1204,11 @@ def par_subchain_latency(tree: dict[str | int, dict[str | int, dict[str, int]]]
     chain = sorted(nodes & cpath)
     # Get the next cpath node following the given group
     cb = next(filter(lambda v: v in cpath, tree.successors(chain[-1])), None)
+    if isinstance(tree, CompactTree):
+        _, runtime, _, rate, data, *_ = tree.attr
+        return sum((n_v * runtime[v] + (n_v * math.ceil(rate[cb] / (rate[v] * N)) * data[cb]
+                                        if v == chain[-1] and cb is not None else 0)
+                    for n_v, v in zip(ipar_mul_factor((rate[v] for v in chain), N), chain)), start=data[barr])
     p = next(tree.predecessors(barr))
     return sum(((n_v * tree.nodes[v][RUNTIME] +
                  (n_v * math.ceil(tree[v][cb][RATE] / (tree[u][v][RATE] * N)) * tree[v][cb][DATA]
@@ -1037,6 +1232,10 @@ def gen_subtree_memory(tree: dict[str | int, dict[str | int, dict[str, int]]] |
     :param N:       CPU count
     :return:        calculated memory value
     """
+    if isinstance(tree, CompactTree):
+        _, _, memory, rate, _, cpu, *_ = tree.attr
+        return max(sum(memory[v] for v in nodes),
+                   max(min(math.ceil(rate[v] / rate[barr]), math.ceil(N / cpu[v])) * memory[v] for v in nodes))
     r_b = tree[next(tree.predecessors(barr))][barr][RATE]
     return max(sum(tree.nodes[v][MEMORY] for v in nodes),
                max(min(math.ceil(tree[next(tree.predecessors(v))][v][RATE] / r_b),
@@ -1059,6 +1258,12 @@ def gen_subtree_cost(tree: dict[str | int, dict[str | int, dict[str, int]]] | nx
     :param exec_calc:   calculator function
     :return:            calculated cost
     """
+    if isinstance(tree, CompactTree):
+        _, runtime, _, rate, data, cpu, ptr, children = tree.attr
+        r_b = rate[barr]
+        return sum((par_inst_count(r_b, rate[v], int(N / cpu[v])) * exec_calc(v, runtime[v], N) +
+                    sum(par_inst_count(r_b, rate[s], N) * data[s] for s in children[ptr[v]:ptr[v + 1]]
+                        if s not in nodes) for v in nodes), start=r_b * data[barr])
     p = next(tree.predecessors(barr))
     r_b = tree[p][barr][RATE]
     return sum((par_inst_count(r_b, tree[next(tree.predecessors(v))][v][RATE], int(N / tree.nodes[v].get(CPU, 1))) *
@@ -11,9 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import collections.abc
+import concurrent.futures
+import fnmatch
 import itertools
 import operator
+import os
 import pathlib
+import typing
 import warnings
 from collections.abc import Generator
 from functools import partial
@@ -23,6 +29,7 @@ import networkx as nx
 import numpy as np
 
 from slambuc.alg.app.common import *
+from slambuc.alg.app.compact import CompactTree, P_IDX, NO_PARENT, compact_tree, as_digraph
 
 
 def encode_service_tree(tree: nx.DiGraph, root: int = 0, pad_size: int = 0) -> np.ndarray:
@@ -54,35 +61,144 @@ def encode_service_tree(tree: nx.DiGraph, root: int = 0, pad_size: int = 0) -> n
     return np.pad(data_seq.reshape((5, -1)), pad_width=((0, 0), (0, pad_width)))
 
 
-def decode_service_tree(tdata: np.ndarray) -> nx.DiGraph:
+def decode_service_tree(tdata: np.ndarray, compact: bool = False) -> nx.DiGraph | CompactTree:
     """
     Decode and rebuild app tree from value arrays.
 
-    Inverse method of :func:`encode_service_tree`.
+    Inverse method of :func:`encode_service_tree`. Trees stored in the versioned format are decoded by
+    :func:`decode_service_tree_v2`.
 
     :param tdata:   array values
+    :param compact: return the tree in compact form
     :return:        app tree
     """
+    if is_versioned_tree(tdata):
+        return decode_service_tree_v2(tdata, compact)
     if tdata.shape[0] % 5:
         warnings.warn(f"Given data with shape {tdata.shape} is not a valid encoded tree!")
-    root, *prufer_seq = np.trim_zeros(tdata[0, :], 'b')
+    root, *prufer_seq = np.trim_zeros(tdata[0, :], 'b').tolist()
     tree = nx.bfs_tree(nx.from_prufer_sequence(prufer_seq), source=root, sort_neighbors=sorted)
     for u, v in tree.edges:
         tree[u][v][DATA], tree[u][v][RATE], tree.nodes[v][RUNTIME], tree.nodes[v][MEMORY] = tdata[1:, v - 1]
     nx.relabel_nodes(tree, {0: PLATFORM}, copy=False)
     tree.graph[NAME] = "tree_" + "".join(map(str, tdata[0]))
+    return CompactTree.from_digraph(tree) if compact else tree
+
+
+########################################################################################################################
+
+# Marker of the versioned tree formats in the first header field (v1 trees store the root node there)
+TREE_MAGIC = -0x534C414D
+# Current version of the versioned tree format
+TREE_VERSION = 2
+# Header flag of trees with CPU node attributes
+_FLAG_CPU = 0b1
+
+
+def encode_service_tree_v2(tree: nx.DiGraph | CompactTree, pad_size: int = 0) -> np.ndarray:
+    """
+    Encode the given app *tree* into a versioned array of size **6*(n+1+k)** based on the parent array of the tree,
+    where n is the highest node ID and k is the number of words storing the tree's name.
+
+    The node IDs must be positive integers, while the root's parent is PLATFORM (encoded as node *0*). Column *0* is
+    the header *[magic, version, n, flags, name_length, 0]*, column *i* (from *1* to *n*) stores the attributes
+    *[parent, rate, data, runtime, memory, cpu]* of node *i* with parent *-1* for missing node IDs, and the name of
+    the tree is stored in UTF-8 encoded 8-byte words in the first row of the remaining columns.
+
+    :param tree:        app tree
+    :param pad_size:    padding size for uniform length
+    :return:            encoded tree as value arrays
+    """
+    ctree = compact_tree(tree)
+    n, flags = len(ctree.parent) - 1, _FLAG_CPU if np.any(ctree.cpu[1:] != 1) else 0
+    name = str(ctree.graph.get(NAME, "")).encode()
+    words = -(-len(name) // 8)
+    tdata = np.zeros((6, max(1 + n + words, pad_size + 1)), dtype=np.int64)
+    tdata[:, 0] = TREE_MAGIC, TREE_VERSION, n, flags, len(name), 0
+    tdata[:, 1:n + 1] = np.stack((ctree.parent, ctree.rate, ctree.data, ctree.runtime, ctree.memory, ctree.cpu))[:, 1:]
+    tdata[0, n + 1:n + 1 + words] = np.frombuffer(name.ljust(8 * words, b'\0'), dtype='<i8')
+    return tdata
+
+
+def is_versioned_tree(tdata: np.ndarray) -> bool:
+    """
+    Check whether the given array stores an app tree in the versioned format.
+
+    :param tdata:   array values
+    :return:        the array is a versioned tree
+    """
+    return tdata.ndim == 2 and tdata.shape[0] == 6 and tdata.shape[1] > 0 and tdata[0, 0] == TREE_MAGIC
+
+
+def decode_service_tree_v2(tdata: np.ndarray, compact: bool = False) -> nx.DiGraph | CompactTree:
+    """
+    Decode and rebuild app tree from versioned value arrays in linear time without running graph algorithms.
+
+    Inverse method of :func:`encode_service_tree_v2`. Children of a node are ordered by their node IDs.
+
+    :param tdata:   array values
+    :param compact: return the tree in compact form
+    :return:        app tree
+    """
+    if not is_versioned_tree(tdata):
+        raise ValueError(f"Given data with shape {tdata.shape} is not a versioned tree!")
+    _, version, n, flags, name_len, _ = tdata[:, 0].tolist()
+    if version != TREE_VERSION:
+        raise ValueError(f"Unsupported tree format version: {version}")
+    words = -(-name_len // 8)
+    name = np.ascontiguousarray(tdata[0, n + 1:n + 1 + words], dtype='<i8').tobytes()[:name_len].decode()
+    graph = {NAME: name} if name_len else {}
+    parent, rate, data, runtime, memory, cpu = np.array(tdata[:, :n + 1], dtype=np.int64)
+    # Column 0 of the header is replaced by the attributes of the PLATFORM node
+    rate[0] = data[0] = runtime[0] = memory[0] = 0
+    parent[0], cpu[0] = NO_PARENT, 1
+    if compact:
+        # Children are grouped by their parents with a stable sort to keep the increasing ID order
+        nodes = np.flatnonzero(parent >= 0)
+        child_idx = nodes[np.argsort(parent[nodes], kind='stable')]
+        child_ptr = np.concatenate(([0], np.cumsum(np.bincount(parent[nodes], minlength=n + 1))))
+        return CompactTree(parent, child_ptr, child_idx, runtime, memory, rate, data, cpu, graph)
+    nodes = np.flatnonzero(parent >= 0).tolist()
+    parents = [PLATFORM if p == P_IDX else p for p in parent[nodes].tolist()]
+    attrs = ({RUNTIME: t, MEMORY: m} for t, m in zip(runtime[nodes].tolist(), memory[nodes].tolist()))
+    tree = nx.DiGraph(**graph)
+    tree.add_node(PLATFORM)
+    tree.add_nodes_from(zip(nodes, attrs))
+    if flags & _FLAG_CPU:
+        # Only the non-default CPU demands are set as in the case of compact trees
+        nx.set_node_attributes(tree, {v: c for v, c in zip(nodes, cpu[nodes].tolist()) if c != 1}, CPU)
+    # Edges are added in increasing order of node IDs, hence successors are also ordered
+    tree.add_edges_from((p, v, {RATE: r, DATA: d}) for p, v, r, d in
+                        zip(parents, nodes, rate[nodes].tolist(), data[nodes].tolist()))
     return tree
 
 
-def save_tree(tree: nx.DiGraph, file_name: str | pathlib.Path, padding: int = 0, raw: bool = True):
+def encode_tree(tree: nx.DiGraph | CompactTree, pad_size: int = 0, version: int = 1) -> np.ndarray:
+    """
+    Encode the given app *tree* with the given format *version*.
+
+    :param tree:        app tree
+    :param pad_size:    padding size for uniform length
+    :param version:     format version (1: Prufer sequence based, 2: parent array based)
+    :return:            encoded tree as value arrays
+    """
+    if version == 1:
+        return encode_service_tree(as_digraph(tree), pad_size=pad_size)
+    elif version == TREE_VERSION:
+        return encode_service_tree_v2(tree, pad_size=pad_size)
+    else:
+        raise ValueError(f"Unsupported tree format version: {version}")
+
+
+def save_tree(tree: nx.DiGraph, file_name: str | pathlib.Path, padding: int = 0, raw: bool = True, version: int = 1):
     """
     Convert trees into a compact format and save them in a single file.
     """
     saver = partial(np.save, allow_pickle=False) if raw else partial(np.savetxt, fmt='%i', delimiter=',')
-    saver(file_name, encode_service_tree(tree, pad_size=padding))
+    saver(file_name, encode_tree(tree, pad_size=padding, version=version))
 
 
-def load_tree(file_name: str | pathlib.Path, raw: bool = True) -> nx.DiGraph:
+def load_tree(file_name: str | pathlib.Path, raw: bool = True, compact: bool = False) -> nx.DiGraph | CompactTree:
     """
     Convert trees into a compact format and save them in a single file.
     """
@@ -90,44 +206,467 @@ def load_tree(file_name: str | pathlib.Path, raw: bool = True) -> nx.DiGraph:
         loader = partial(np.load, mmap_mode="r", allow_pickle=False)
     else:
         loader = partial(np.loadtxt, dtype=int, delimiter=',')
-    return decode_service_tree(loader(file_name))
+    return decode_service_tree(loader(file_name), compact)
 
 
-def save_trees_to_file(trees: list[nx.DiGraph], file_name: str | pathlib.Path = "test_trees.npy", padding: int = 0):
+def save_trees_to_file(trees: list[nx.DiGraph], file_name: str | pathlib.Path = "test_trees.npy", padding: int = 0,
+                       version: int = 1):
     """
     Convert trees into a compact format and save them in a single file.
 
+    Trees encoded in the versioned format are padded to the same length automatically.
+
     :param trees:       list of trees
     :param file_name:   output file name
     :param padding:     padding size
+    :param version:     format version (1: Prufer sequence based, 2: parent array based)
     """
-    enc_trees = list(encode_service_tree(t, pad_size=padding) for t in trees)
+    enc_trees = list(encode_tree(t, pad_size=padding, version=version) for t in trees)
+    if enc_trees and version != 1:
+        width = max(t.shape[1] for t in enc_trees)
+        enc_trees = [np.pad(t, ((0, 0), (0, width - t.shape[1]))) for t in enc_trees]
     if enc_trees:
         np.save(file_name, np.stack(enc_trees))
 
 
-def get_tree_from_file(file_name: str | pathlib.Path, tree_num: int) -> nx.DiGraph:
+def get_tree_from_file(file_name: str | pathlib.Path, tree_num: int,
+                       compact: bool = False) -> nx.DiGraph | CompactTree:
     """
     Load and decode an app tree from the given *file_name* with specific ID *tree_num*.
 
     :param file_name:   file name
     :param tree_num:    tree ID
+    :param compact:     return the tree in compact form
     :return:            loaded tree
     """
     np_trees = np.load(file_name, mmap_mode="r", allow_pickle=False)
-    return decode_service_tree(np_trees[tree_num - 1, :])
+    return decode_service_tree(np_trees[tree_num - 1, :], compact)
 
 
-def iload_trees_from_file(file_name: str | pathlib.Path) -> Generator[nx.DiGraph]:
+def iload_trees_from_file(file_name: str | pathlib.Path, compact: bool = False) -> Generator[nx.DiGraph | CompactTree]:
     """
     Generator of app trees loaded from given *file_name*.
 
     :param file_name:   tree file
+    :param compact:     return the trees in compact form
     :return:            generator of trees
     """
     np_trees = np.load(file_name, mmap_mode="r", allow_pickle=False)
     for idx in range(np_trees.shape[0]):
-        yield decode_service_tree(np_trees[idx, :])
+        yield decode_service_tree(np_trees[idx, :], compact)
+
+
+########################################################################################################################
+
+
+class TreeView:
+    """
+    Lightweight, read-only view of an encoded app tree backed directly by the (memory-mapped) array slice of the tree.
+
+    Node and edge attributes are exposed as zero-copy arrays of the nodes from *1* to *n* without decoding the tree,
+    while the decoded tree can be built on demand by :meth:`to_digraph` or :meth:`to_compact`.
+    """
+
+    def __init__(self, tdata: np.ndarray, index: int = None):
+        """
+        Initialize the view over the given encoded tree.
+
+        :param tdata:   array values of an encoded tree
+        :param index:   index of the tree in its archive
+        """
+        self.tdata = tdata
+        self.index = index
+        self.version = TREE_VERSION if is_versioned_tree(tdata) else 1
+        if self.version == 1:
+            # Trailing columns without any attribute values are considered as padding
+            used = np.flatnonzero(np.any(tdata[1:] != 0, axis=0))
+            self._n = int(used[-1]) + 1 if len(used) else 0
+        else:
+            self._n = int(tdata[2, 0])
+        self._compact = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index={self.index}, version={self.version}, nodes={self.size})"
+
+    def _row(self, row: int) -> np.ndarray:
+        """Return the zero-copy slice of the given attribute *row* in node ID order."""
+        return self.tdata[row, :self._n] if self.version == 1 else self.tdata[row, 1:self._n + 1]
+
+    @property
+    def size(self) -> int:
+        """Number of nodes including PLATFORM."""
+        if self.version == 1:
+            return self._n + 1
+        return int(np.count_nonzero(self.tdata[0, 1:self._n + 1] >= 0)) + 1
+
+    @property
+    def name(self) -> str | None:
+        """Name of the tree."""
+        if self.version == 1:
+            return "tree_" + "".join(map(str, self.tdata[0]))
+        name_len = int(self.tdata[4, 0])
+        words = self.tdata[0, self._n + 1:self._n + 1 + -(-name_len // 8)]
+        return np.ascontiguousarray(words, dtype='<i8').tobytes()[:name_len].decode() if name_len else None
+
+    @property
+    def parent(self) -> np.ndarray:
+        """Parent indices of nodes (PLATFORM: 0, missing node IDs: -1)."""
+        return self._row(0) if self.version != 1 else self.to_compact().parent[1:]
+
+    @property
+    def runtime(self) -> np.ndarray:
+        """Node runtime values."""
+        return self._row(3)
+
+    @property
+    def memory(self) -> np.ndarray:
+        """Node memory values."""
+        return self._row(4)
+
+    @property
+    def rate(self) -> np.ndarray:
+        """Invocation rates of the ingress edges of nodes."""
+        return self._row(2 if self.version == 1 else 1)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Data overheads of the ingress edges of nodes."""
+        return self._row(1 if self.version == 1 else 2)
+
+    @property
+    def cpu(self) -> np.ndarray:
+        """Node CPU demands."""
+        return self._row(5) if self.version != 1 else np.ones(self._n, dtype=np.int64)
+
+    def to_digraph(self) -> nx.DiGraph:
+        """
+        Decode the viewed tree.
+
+        :return:    app tree
+        """
+        return decode_service_tree(self.tdata)
+
+    def to_compact(self) -> CompactTree:
+        """
+        Decode the viewed tree into compact form (cached for the lifetime of the view).
+
+        :return:    compact tree
+        """
+        if self._compact is None:
+            self._compact = decode_service_tree(self.tdata, compact=True)
+        return self._compact
+
+
+class TreeArchive(collections.abc.Sequence):
+    """
+    Read-only, indexed collection of the app trees stored in a multi-tree file created by :func:`save_trees_to_file`.
+
+    The file is memory-mapped and trees are accessed as :class:`TreeView` objects, hence only the trees actually
+    decoded are materialized. Supports random access, slicing and filtering, where slices and filtered archives share
+    the same memory-mapped array.
+    """
+
+    def __init__(self, file_name: str | pathlib.Path | None, indices: np.ndarray = None, tdata: np.ndarray = None):
+        """
+        Open the given tree archive file.
+
+        :param file_name:   tree file
+        :param indices:     selected tree indices (default: all trees)
+        :param tdata:       already opened array of the encoded trees (used instead of *file_name*)
+        """
+        self.file_name = file_name
+        self.tdata = tdata if tdata is not None else np.load(file_name, mmap_mode="r", allow_pickle=False)
+        if self.tdata.ndim == 2:
+            self.tdata = self.tdata[np.newaxis]
+        self.indices = np.arange(self.tdata.shape[0]) if indices is None else np.asarray(indices, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item: int | slice) -> 'TreeView | TreeArchive':
+        if isinstance(item, slice):
+            return self._select(self.indices[item])
+        idx = int(self.indices[item])
+        return TreeView(self.tdata[idx], idx)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(file_name={str(self.file_name)!r}, trees={len(self)})"
+
+    def _select(self, indices: np.ndarray) -> 'TreeArchive':
+        """Return a new archive of the given tree *indices* sharing the underlying array."""
+        return TreeArchive(self.file_name, indices, self.tdata)
+
+    @property
+    def version(self) -> int:
+        """Format version of the stored trees."""
+        return TREE_VERSION if len(self.tdata) and is_versioned_tree(self.tdata[0]) else 1
+
+    def sizes(self) -> np.ndarray:
+        """
+        Return the number of nodes (including PLATFORM) of the archived trees without decoding them.
+
+        :return:    array of tree sizes
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.int64)
+        elif self.version == 1:
+            return np.fromiter((len(self[i]) for i in range(len(self))), dtype=np.int64, count=len(self))
+        # Only the parent values of node IDs from 1 to n are taken into account
+        n = self.tdata[self.indices, 2, 0]
+        cols = np.arange(self.tdata.shape[2])
+        mask = (cols >= 1) & (cols <= n[:, np.newaxis]) & (self.tdata[self.indices, 0, :] >= 0)
+        return np.count_nonzero(mask, axis=1) + 1
+
+    def filter(self, predicate: typing.Callable[[TreeView], bool] = None, min_size: int = None,
+               max_size: int = None) -> 'TreeArchive':
+        """
+        Return the archive of trees matching the given size limits and *predicate* without decoding the trees.
+
+        :param predicate:   function that decides whether a tree view is selected, e.g., based on node attributes
+        :param min_size:    min number of nodes (including PLATFORM)
+        :param max_size:    max number of nodes (including PLATFORM)
+        :return:            filtered archive
+        """
+        indices = self.indices
+        if min_size is not None or max_size is not None:
+            sizes = self.sizes()
+            keep = np.ones(len(indices), dtype=bool)
+            if min_size is not None:
+                keep &= sizes >= min_size
+            if max_size is not None:
+                keep &= sizes <= max_size
+            indices = indices[keep]
+        if predicate is not None:
+            indices = np.fromiter((i for i in indices.tolist() if predicate(TreeView(self.tdata[i], i))),
+                                  dtype=np.int64)
+        return self._select(indices)
+
+    def itrees(self, compact: bool = False) -> Generator[nx.DiGraph | CompactTree]:
+        """
+        Generator of the decoded trees of the archive.
+
+        :param compact: return the trees in compact form
+        :return:        generator of trees
+        """
+        for idx in self.indices.tolist():
+            yield decode_service_tree(self.tdata[idx], compact)
+
+
+def _load_tree_chunk(file_name: str | pathlib.Path, start: int, stop: int, compact: bool, min_size: int | None,
+                     max_size: int | None, name: str | None) -> list[nx.DiGraph | CompactTree]:
+    """
+    Load and decode the trees of the given index range from *file_name* matching the given filters.
+
+    :param file_name:   tree file
+    :param start:       index of the first tree
+    :param stop:        index after the last tree
+    :param compact:     return the trees in compact form
+    :param min_size:    min number of nodes (including PLATFORM)
+    :param max_size:    max number of nodes (including PLATFORM)
+    :param name:        shell-style pattern of tree names
+    :return:            list of decoded trees
+    """
+    archive = TreeArchive(file_name)[start:stop]
+    predicate = (lambda t: fnmatch.fnmatchcase(str(t.name), name)) if name is not None else None
+    archive = archive.filter(predicate, min_size, max_size)
+    return list(archive.itrees(compact))
+
+
+def iload_trees_parallel(file_name: str | pathlib.Path, workers: int = None, chunk_size: int = 64,
+                         prefetch: int = None, compact: bool = False, min_size: int = None, max_size: int = None,
+                         name: str = None) -> Generator[nx.DiGraph | CompactTree]:
+    """
+    Generator of app trees loaded from given *file_name* and decoded in a pool of worker processes.
+
+    Trees are decoded in chunks of *chunk_size* consecutive trees and returned in the order of the file, while at
+    most *prefetch* chunks are read ahead. Each worker memory-maps the file itself, hence only the decoded trees are
+    transferred between processes. Trees can be filtered by their size and name before decoding.
+
+    :param file_name:   tree file
+    :param workers:     number of worker processes (default: CPU count)
+    :param chunk_size:  number of trees decoded in one task
+    :param prefetch:    max number of chunks under decoding (default: 2 * workers)
+    :param compact:     return the trees in compact form
+    :param min_size:    min number of nodes (including PLATFORM)
+    :param max_size:    max number of nodes (including PLATFORM)
+    :param name:        shell-style pattern of tree names, e.g., ``random_tree_*``
+    :return:            generator of trees
+    """
+    workers = workers if workers else os.cpu_count()
+    prefetch = prefetch if prefetch else 2 * workers
+    file_name = pathlib.Path(file_name).resolve()
+    total = len(TreeArchive(file_name))
+    chunks = ((i, min(i + chunk_size, total)) for i in range(0, total, chunk_size))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        try:
+            while True:
+                # Keep the number of chunks under decoding bounded
+                while len(pending) < prefetch and (chunk := next(chunks, None)) is not None:
+                    pending.append(executor.submit(_load_tree_chunk, file_name, *chunk, compact, min_size, max_size,
+                                                   name))
+                if not pending:
+                    break
+                yield from pending.popleft().result()
+        finally:
+            for f in pending:
+                f.cancel()
+
+
+########################################################################################################################
+
+# Marker of encoded DAGs in the first header field
+DAG_MAGIC = -0x534C4447
+# Current version of the DAG format
+DAG_VERSION = 1
+# Size of the DAG header
+_DAG_HDR = 6
+
+
+def encode_dag(dag: nx.DiGraph, pad_size: int = 0) -> np.ndarray:
+    """
+    Encode the given app *dag* into a flat array based on the CSR (compressed sparse row) layout of its edges.
+
+    The DAG must contain the PLATFORM node, while other node IDs must be integers. The array's structure is
+    *[H_6, I_n, P_(n+2), S_m, R_m, D_m, T_n, M_n, C_n, N_k]*, where
+        - *H_6* is the header *[magic, version, n, m, flags, name_length]*,
+        - *I_n* is the list of node IDs in the node order of the DAG, while PLATFORM is at the implicit position *0*,
+        - *P_(n+2), S_m* are the CSR row offsets and the concatenated successor positions of the nodes,
+        - *R_m, D_m* are the edge attributes (RATE, DATA) in the order of *S_m*,
+        - *T_n, M_n, C_n* are the node attributes (RUNTIME, MEMORY, CPU) in the order of *I_n* and
+        - *N_k* is the UTF-8 encoded name of the DAG in 8-byte words.
+
+    :param dag:         app DAG
+    :param pad_size:    padding size for uniform length
+    :return:            encoded DAG as a value array
+    """
+    ids = [v for v in dag if v is not PLATFORM]
+    if PLATFORM not in dag or not all(isinstance(v, (int, np.integer)) for v in ids):
+        raise ValueError("DAG encoding requires the PLATFORM node and integer node IDs!")
+    nodes = [PLATFORM, *ids]
+    pos = {v: i for i, v in enumerate(nodes)}
+    ptr = np.fromiter(itertools.accumulate((dag.out_degree(v) for v in nodes), initial=0), dtype=np.int64,
+                      count=len(nodes) + 1)
+    edges = [(pos[c], d[RATE], d[DATA]) for v in nodes for c, d in dag.adj[v].items()]
+    succ, rate, data = np.array(edges, dtype=np.int64).reshape((-1, 3)).T
+    runtime, memory, cpu = np.array([(dag.nodes[v][RUNTIME], dag.nodes[v][MEMORY], dag.nodes[v].get(CPU, 1))
+                                     for v in ids], dtype=np.int64).reshape((-1, 3)).T
+    name = str(dag.graph.get(NAME, "")).encode()
+    flags = _FLAG_CPU if np.any(cpu != 1) else 0
+    header = np.array((DAG_MAGIC, DAG_VERSION, len(ids), len(edges), flags, len(name)), dtype=np.int64)
+    ddata = np.concatenate((header, np.array(ids, dtype=np.int64), ptr, succ, rate, data, runtime, memory, cpu,
+                            np.frombuffer(name.ljust(-(-len(name) // 8) * 8, b'\0'), dtype='<i8')))
+    return np.pad(ddata, (0, max(0, pad_size - len(ddata))))
+
+
+def is_encoded_dag(ddata: np.ndarray) -> bool:
+    """
+    Check whether the given array stores an encoded app DAG.
+
+    :param ddata:   array values
+    :return:        the array is an encoded DAG
+    """
+    return ddata.ndim == 1 and len(ddata) >= _DAG_HDR and ddata[0] == DAG_MAGIC
+
+
+def decode_dag(ddata: np.ndarray) -> nx.DiGraph:
+    """
+    Decode and rebuild app DAG from the value array.
+
+    Inverse method of :func:`encode_dag`.
+
+    :param ddata:   array values
+    :return:        app DAG
+    """
+    if not is_encoded_dag(ddata):
+        raise ValueError(f"Given data with shape {ddata.shape} is not a valid encoded DAG!")
+    _, version, n, m, flags, name_len = ddata[:_DAG_HDR].tolist()
+    if version != DAG_VERSION:
+        raise ValueError(f"Unsupported DAG format version: {version}")
+    # Split the flat array into the consecutive sections
+    ids, ptr, succ, rate, data, runtime, memory, cpu, name = np.split(np.asarray(ddata[_DAG_HDR:]), np.cumsum(
+        (n, n + 2, m, m, m, n, n, n)))
+    words = -(-name_len // 8)
+    name = np.ascontiguousarray(name[:words], dtype='<i8').tobytes()[:name_len].decode()
+    nodes = [PLATFORM, *ids.tolist()]
+    dag = nx.DiGraph(**{NAME: name} if name_len else {})
+    dag.add_node(PLATFORM)
+    dag.add_nodes_from(zip(nodes[1:], ({RUNTIME: t, MEMORY: mem} for t, mem in zip(runtime.tolist(),
+                                                                                  memory.tolist()))))
+    if flags & _FLAG_CPU:
+        # Only the non-default CPU demands are set as in the case of trees
+        nx.set_node_attributes(dag, {v: c for v, c in zip(nodes[1:], cpu.tolist()) if c != 1}, CPU)
+    # Tail nodes of edges are recovered from the CSR row offsets
+    src = np.repeat(np.arange(n + 1), np.diff(ptr)).tolist()
+    dag.add_edges_from((nodes[u], nodes[v], {RATE: r, DATA: d}) for u, v, r, d in
+                       zip(src, succ.tolist(), rate.tolist(), data.tolist()))
+    return dag
+
+
+def save_dags_to_file(dags: list[nx.DiGraph], file_name: str | pathlib.Path = "test_dags.npz", padding: int = 0):
+    """
+    Convert DAGs into a compact format and save them in a single file.
+
+    DAGs are stored as separate arrays in *.npz* files, otherwise, encoded DAGs are padded to the same length and
+    stored in a single 2D array.
+
+    :param dags:        list of DAGs
+    :param file_name:   output file name
+    :param padding:     padding size
+    """
+    enc_dags = [encode_dag(d, pad_size=padding) for d in dags]
+    if not enc_dags:
+        return
+    if pathlib.Path(file_name).suffix == '.npz':
+        np.savez(file_name, **{f"dag_{i}": d for i, d in enumerate(enc_dags)})
+    else:
+        width = max(map(len, enc_dags))
+        np.save(file_name, np.stack([np.pad(d, (0, width - len(d))) for d in enc_dags]), allow_pickle=False)
+
+
+def iload_dags_from_file(file_name: str | pathlib.Path) -> Generator[nx.DiGraph]:
+    """
+    Generator of app DAGs loaded from given *file_name*.
+
+    :param file_name:   DAG file (*.npy* or *.npz*)
+    :return:            generator of DAGs
+    """
+    if pathlib.Path(file_name).suffix == '.npz':
+        with np.load(file_name, allow_pickle=False) as npz_file:
+            for key in sorted(npz_file.keys(), key=lambda k: int(k.rpartition('_')[2])):
+                yield decode_dag(npz_file[key])
+    else:
+        np_dags = np.load(file_name, mmap_mode="r", allow_pickle=False)
+        for ddata in (np_dags[np.newaxis] if np_dags.ndim == 1 else np_dags):
+            yield decode_dag(ddata)
+
+
+def save_dag(dag: nx.DiGraph, file_name: str | pathlib.Path):
+    """
+    Convert the DAG into a compact format and save it into a *.npy* or *.npz* file.
+
+    :param dag:         app DAG
+    :param file_name:   output file name
+    """
+    save_dags_to_file([dag], file_name)
+
+
+def load_dag(file_name: str | pathlib.Path, dag_num: int = 1) -> nx.DiGraph:
+    """
+    Load and decode an app DAG from the given *file_name* with specific ID *dag_num*.
+
+    :param file_name:   DAG file (*.npy* or *.npz*)
+    :param dag_num:     DAG ID
+    :return:            loaded DAG
+    """
+    if pathlib.Path(file_name).suffix == '.npz':
+        with np.load(file_name, allow_pickle=False) as npz_file:
+            return decode_dag(npz_file[f"dag_{dag_num - 1}"])
+    np_dags = np.load(file_name, mmap_mode="r", allow_pickle=False)
+    return decode_dag(np_dags if np_dags.ndim == 1 else np_dags[dag_num - 1])
 
 
 def load_hist_params(hist_dir: str | pathlib.Path | Traversable, hist_name: str) -> tuple[..., ...]:
@@ -34,7 +34,10 @@ import pulp
 
 import slambuc
 from slambuc.alg import Flavor
-from slambuc.misc.io import load_tree
+from slambuc.alg.cache import ResultCache, result_key, DEFAULT_CACHE_SIZE
+from slambuc.alg.solver import SCIPY_MILP
+from slambuc.misc.io import load_tree, load_dag
+from slambuc.tool import daemon
 
 GLOBAL_CTX_SETTINGS = dict(
     help_option_names=['-h', '--help'],
@@ -44,19 +47,43 @@ GLOBAL_CTX_SETTINGS = dict(
 )
 
 
-@click.group('slambuc', context_settings=GLOBAL_CTX_SETTINGS,
+class ForwardingGroup(click.Group):
+    """Command group that keeps the raw command line arguments for forwarding them to a CLI daemon."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        ctx.meta['RAW_ARGS'] = list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group('slambuc', cls=ForwardingGroup, context_settings=GLOBAL_CTX_SETTINGS,
              epilog="See https://github.com/hsnlab/SLAMBUC for more details.")
 @click.option('-j', '--json', 'format_json', is_flag=True, default=False, help="Output as valid JSON")
 @click.option('-s', '--split', 'format_split', is_flag=True, default=False, help="Split result into separate lines")
 @click.option('-q', '--quiet', 'output_quiet', is_flag=True, default=False, help="Suppress logging messages")
+@click.option('--cache', 'cache_path', type=click.Path(dir_okay=False, path_type=pathlib.Path), default=None,
+              help="Reuse and store results in the given cache database")
+@click.option('--cache-size', 'cache_size', type=click.IntRange(min=1), default=DEFAULT_CACHE_SIZE // 2 ** 20,
+              help="Upper bound of the result cache size in MB")
+@click.option('--connect', 'connect', metavar='ADDRESS', default=None,
+              help="Execute the command by the daemon listening on the given socket path or [host:]port")
 @click.version_option(slambuc.__version__, "-v", "--version", package_name="slambuc")
 @click.pass_context
-def main(ctx: click.Context, format_json: bool, format_split: bool, output_quiet: bool):
+def main(ctx: click.Context, format_json: bool, format_split: bool, output_quiet: bool, cache_path: pathlib.Path,
+         cache_size: int, connect: str | None):
     """Serverless Layout Adaptation with Memory-Bounds and User Constraints (SLAMBUC)"""
     ctx.ensure_object(dict)
+    # Commands received by a daemon are executed locally regardless of the connect option
+    if connect and not ctx.obj.get(daemon.SERVING):
+        try:
+            ctx.exit(daemon.forward_command(connect, ctx.meta['RAW_ARGS']))
+        except (OSError, ValueError) as e:
+            click.secho(f"Failed to connect to daemon at {connect}: {e}", err=True, fg='red')
+            ctx.exit(os.EX_UNAVAILABLE)
     ctx.obj['FORMAT_JSON'] = format_json
     ctx.obj['FORMAT_SPLIT'] = format_split
     ctx.obj['OUTPUT_QUIET'] = output_quiet
+    ctx.obj['CACHE_PATH'] = cache_path
+    ctx.obj['CACHE_SIZE'] = cache_size
 
 
 ########################################################################################################################
@@ -155,6 +182,7 @@ class PulpSolverType(enum.Enum):
     cbc = pulp.PULP_CBC_CMD
     glpk = pulp.GLPK_CMD
     cplex = pulp.CPLEX_CMD
+    milp = SCIPY_MILP
     DEF = cbc
 
     @classmethod
@@ -269,6 +297,33 @@ unfold = click.option('--unfold/--barriers', 'unfold', metavar='BOOL', type=clic
                       help="Return full blocks or barrier nodes only")
 
 
+########################################################################################################################
+
+@main.command("serve")
+@click.option('--address', 'address', metavar='ADDRESS', default=str(daemon.DEFAULT_SOCKET),
+              help="Unix socket path or [host:]port to listen on")
+@click.option('--allow-remote', 'allow_remote', is_flag=True, default=False,
+              help="Allow listening on non-loopback TCP addresses without authentication")
+@click.pass_context
+def serve(ctx: click.Context, address: str, allow_remote: bool):
+    """Run a persistent daemon executing the commands of `slambuc --connect` clients.
+
+    Commands are executed sequentially in the same process using the clients' working directory and SLAMBUC_*
+    environment variables, hence interpreter startup and module imports are paid only once.
+
+    Requests are not authenticated, hence TCP addresses are restricted to loopback interfaces by default.
+    """
+    if ctx.obj.get(daemon.SERVING):
+        raise click.UsageError("Daemon cannot be started by a daemon request!")
+    try:
+        daemon.serve(main, address, verbose=not ctx.obj.get('OUTPUT_QUIET'),
+                     ready=lambda addr: log_info(f"Listening on {addr}..."), allow_remote=allow_remote)
+    except OSError as e:
+        log_err(f"Failed to start daemon: {e}")
+        sys.exit(os.EX_UNAVAILABLE)
+    log_info("Daemon stopped.")
+
+
 ########################################################################################################################
 
 class InputDataType(enum.StrEnum):
@@ -561,6 +616,7 @@ def tree__layout():
 class TreeLayoutILPType(enum.Enum):
     """Partitioning algorithms in `slambuc.alg.tree.layout.ilp`."""
     hybrid = "tree_gen_hybrid_partitioning"
+    colgen = "tree_gen_colgen_partitioning"
     mtx = "tree_gen_mtx_partitioning"
     all = "all_gen_tree_mtx_partitioning"
     DEF = mtx
@@ -601,6 +657,7 @@ class TreeParallelILPType(enum.Enum):
     """Partitioning algorithms in `slambuc.alg.tree.parallel.ilp`."""
     cfg = "tree_par_cfg_partitioning"
     hybrid = "tree_par_hybrid_partitioning"
+    colgen = "tree_par_colgen_partitioning"
     mtx = "tree_par_mtx_partitioning"
     all = "all_par_tree_mtx_partitioning"
     DEF = mtx
@@ -809,6 +866,28 @@ def tree__serial__bicriteria(filename: pathlib.Path, alg, **parameters: dict[str
     invoke_algorithm(filename=filename, alg=alg.value, parameters=parameters)
 
 
+class TreeSerialBicriteriaMPType(enum.Enum):
+    """Partitioning algorithms in `slambuc.alg.tree.serial.bicriteria_mp`."""
+    biheuristic = "biheuristic_mp_tree_partitioning"
+    bifptas = "bifptas_mp_tree_partitioning"
+    dual = "bifptas_dual_mp_tree_partitioning"
+    DEF = bifptas
+
+
+@tree__serial.command("bicriteria_mp")
+@algorithm(TreeSerialBicriteriaMPType, root, M, L, cp_end, delay, Epsilon, Lambda, bidirect)
+def tree__serial__bicriteria_mp(filename: pathlib.Path, alg, **parameters: dict[str, ...]):
+    """Cost-minimal partitioning based on approximation schemes using parallelized multiprocessing.
+
+    Calculates minimal-cost partitioning of an app graph(tree) with respect to an upper bound 'M' on the total
+    memory of blocks and a latency constraint 'L' defined on the subchain between 'root' and 'cp_end' nodes, while
+    trimming the state space based on the approximation ratios 'Epsilon' and 'Lambda'.
+
+    Arbitrary disjoint subtrees are partitioned in separate subprocesses.
+    """
+    invoke_algorithm(filename=filename, alg=alg.value, parameters=parameters)
+
+
 class TreeSerialGreedyType(enum.Enum):
     """Partitioning algorithms in `slambuc.alg.tree.serial.greedy`."""
     greedy = "greedy_ser_tree_partitioning"
@@ -829,6 +908,7 @@ class TreeSerialILPType(enum.Enum):
     """Partitioning algorithms in `slambuc.alg.tree.serial.ilp`."""
     cfg = "tree_cfg_partitioning"
     hybrid = "tree_hybrid_partitioning"
+    colgen = "tree_colgen_partitioning"
     mtx = "tree_mtx_partitioning"
     all = "all_tree_mtx_partitioning"
     DEF = mtx
@@ -908,6 +988,8 @@ def read_input_file(filename: pathlib.Path, data_type: str, arg_names: tuple[str
         if data_type == InputDataType.DAG:
             if suffix == '.gml':
                 data = nx.read_gml(filename, destringizer=int)
+            elif suffix in ('.npy', '.npz'):
+                data = load_dag(filename)
             else:
                 raise click.BadParameter(f"Unsupported format: {suffix!r} for data type: {data_type}.")
         elif data_type == InputDataType.TREE:
@@ -985,12 +1067,25 @@ def invoke_algorithm(filename: pathlib.Path, alg: str, parameters: dict[str, ...
         log_err("Failed to validate algorithm configuration! Exiting...")
         sys.exit(os.EX_CONFIG)
     ##################################
+    cache, key = None, None
+    if ctx.obj.get('CACHE_PATH'):
+        try:
+            key = result_key(f"{module_name}.{alg}", data)
+            cache = ResultCache(ctx.obj['CACHE_PATH'], max_size=ctx.obj['CACHE_SIZE'] * 2 ** 20)
+        except TypeError as e:
+            log_warn(f"Result caching is disabled: {e}")
+    ##################################
     try:
-        log_info(f"Executing partitioning algorithm...")
-        _start = time.perf_counter()
-        results = alg_method(**data)
-        _elapsed = (time.perf_counter() - _start) * 1e3
-        log_info(f"  -> Algorithm finished successfully in {_elapsed:.6f} ms!")
+        if cache is not None and (results := cache.get(key)) is not None:
+            log_info(f"Using cached result: {key} from {click.format_filename(cache.path)}")
+        else:
+            log_info(f"Executing partitioning algorithm...")
+            _start = time.perf_counter()
+            results = alg_method(**data)
+            _elapsed = (time.perf_counter() - _start) * 1e3
+            log_info(f"  -> Algorithm finished successfully in {_elapsed:.6f} ms!")
+            if cache is not None and cache.put(key, results):
+                log_info(f"Result is cached with key: {key}")
         result_metrics = list(map(bool, results[:-1]) if isinstance(results, tuple)
                               else itertools.chain(map(bool, r[:-1]) for r in results))
         feasible = all(result_metrics) if parameters.get('metrics', True) else result_metrics[0]
@@ -1009,6 +1104,9 @@ def invoke_algorithm(filename: pathlib.Path, alg: str, parameters: dict[str, ...
     except KeyboardInterrupt:
         log_info("Execution interrupted. Exiting...")
         sys.exit(os.EX_OK)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
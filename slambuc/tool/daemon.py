@@ -0,0 +1,272 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import io
+import ipaddress
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+import typing
+from collections.abc import Generator
+
+import click
+
+# Default Unix socket of the CLI daemon
+DEFAULT_SOCKET = pathlib.Path(os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir()), f"slambuc-{os.getuid()}.sock"
+                              if hasattr(os, 'getuid') else "slambuc.sock")
+# Default host of TCP addresses given only by port numbers
+DEFAULT_HOST = '127.0.0.1'
+# Prefix of the environment variables forwarded to the daemon
+ENV_PREFIX = 'SLAMBUC_'
+# Context object flag of commands executed by the daemon
+SERVING = 'SERVING'
+
+
+def parse_address(address: str | os.PathLike) -> str | tuple[str, int]:
+    """
+    Parse the given daemon address as a Unix socket path or a TCP address given in the forms of *port* or
+    *host:port*.
+
+    :param address: address of the daemon
+    :return:        socket path or (host, port) pair
+    """
+    address = str(address)
+    host, sep, port = address.rpartition(':')
+    if port.isdigit() and (sep or not pathlib.Path(address).exists()):
+        return host if host else DEFAULT_HOST, int(port)
+    return str(pathlib.Path(address).expanduser())
+
+
+@contextlib.contextmanager
+def _environment(cwd: str, env: dict[str, str]) -> Generator[None]:
+    """Temporarily change the working directory and replace the forwarded environment variables."""
+    prev_cwd = os.getcwd()
+    prev_env = {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+    try:
+        os.chdir(cwd)
+        for k in prev_env:
+            del os.environ[k]
+        os.environ.update(env)
+        yield
+    finally:
+        os.chdir(prev_cwd)
+        for k in [k for k in os.environ if k.startswith(ENV_PREFIX)]:
+            del os.environ[k]
+        os.environ.update(prev_env)
+
+
+def run_command(command: click.Command, args: list[str], cwd: str = None, env: dict[str, str] = None,
+                color: bool = False) -> tuple[int, str, str]:
+    """
+    Execute the given CLI *command* with the arguments *args* in the current process and capture its outputs.
+
+    Unexpected exceptions of the command are reported by the exit code ``EX_SOFTWARE`` and the traceback appended to
+    the standard error.
+
+    :param command: CLI command
+    :param args:    command line arguments
+    :param cwd:     working directory of the execution
+    :param env:     forwarded environment variables
+    :param color:   keep the ANSI color codes in the outputs
+    :return:        exit code, standard output and standard error
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with _environment(cwd if cwd else os.getcwd(), env if env else {}):
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                command.main(args, prog_name="slambuc", standalone_mode=True, obj={SERVING: True}, color=color)
+                code = os.EX_OK
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else os.EX_OK if e.code is None else os.EX_SOFTWARE
+            except Exception:
+                code = os.EX_SOFTWARE
+                err.write(traceback.format_exc())
+    return code, out.getvalue(), err.getvalue()
+
+
+class CommandRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single CLI request given as a JSON line and always reply its outcome in a JSON line."""
+    server: 'UnixCommandServer | TCPCommandServer'
+
+    def handle(self):
+        start, args = time.perf_counter(), None
+        try:
+            req = json.loads(self.rfile.readline())
+            args = list(req['args'])
+            code, out, err = run_command(self.server.command, args, req.get('cwd'), req.get('env'),
+                                         bool(req.get('color')))
+        except (ValueError, KeyError, TypeError) as e:
+            code, out, err = os.EX_PROTOCOL, "", f"Invalid request: {e}\n"
+        except Exception:
+            # Failures outside the command, e.g., an invalid working directory
+            code, out, err = os.EX_SOFTWARE, "", traceback.format_exc()
+        self.wfile.write(json.dumps(dict(code=code, stdout=out, stderr=err)).encode() + b'\n')
+        if self.server.verbose:
+            click.secho(f"Request: {args} -> exit code: {code} in {(time.perf_counter() - start) * 1e3:.3f} ms",
+                        err=True)
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Check whether the given host address is a loopback address.
+
+    :param host:    IP address
+    :return:        host is a loopback address
+    """
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class TCPCommandServer(socketserver.TCPServer):
+    """
+    Daemon executing CLI requests received on a TCP port one after another.
+
+    Requests are not authenticated, hence only loopback addresses are allowed by default.
+    """
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], command: click.Command, verbose: bool = True,
+                 allow_remote: bool = False):
+        self.command, self.verbose, self.allow_remote = command, verbose, allow_remote
+        super().__init__(address, CommandRequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+        if not (self.allow_remote or is_loopback(self.server_address[0])):
+            raise PermissionError(f"Binding to non-loopback address {self.server_address[0]} is not allowed "
+                                  f"without authentication!")
+
+    def verify_request(self, request: socket.socket, client_address: tuple[str, int]) -> bool:
+        # Reject remote clients unless they are explicitly allowed
+        return self.allow_remote or is_loopback(client_address[0])
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class UnixCommandServer(socketserver.UnixStreamServer):
+        """Daemon executing CLI requests received on a Unix socket one after another."""
+
+        def __init__(self, address: str, command: click.Command, verbose: bool = True):
+            self.command, self.verbose = command, verbose
+            super().__init__(address, CommandRequestHandler)
+
+        def server_bind(self):
+            # Only the owner is allowed to send requests, hence the socket file is created with restricted permissions
+            umask = os.umask(0o177)
+            try:
+                super().server_bind()
+            finally:
+                os.umask(umask)
+else:
+    UnixCommandServer = None
+
+
+def _is_listening(address: str | tuple[str, int]) -> bool:
+    """Check whether a daemon is already listening on the given address."""
+    try:
+        with socket.socket(socket.AF_UNIX if isinstance(address, str) else socket.AF_INET) as sock:
+            sock.connect(address)
+            return True
+    except OSError:
+        return False
+
+
+def serve(command: click.Command, address: str | os.PathLike = DEFAULT_SOCKET, verbose: bool = True,
+          ready: typing.Callable[[str | tuple[str, int]], None] = None, allow_remote: bool = False):
+    """
+    Run the CLI daemon that executes the received requests with the given *command* until interrupted.
+
+    Requests are executed sequentially in the daemon process, hence modules and solvers imported by previous requests
+    are reused. Stale socket files of terminated daemons are replaced.
+
+    Requests are not authenticated. Unix sockets are accessible only by the owner, while TCP addresses are restricted
+    to loopback interfaces unless *allow_remote* is set.
+
+    :param command:         CLI command
+    :param address:         Unix socket path or TCP address (*port* or *host:port*)
+    :param verbose:         log the served requests
+    :param ready:           callback called with the bound address when the daemon is ready to serve
+    :param allow_remote:    allow binding to non-loopback TCP addresses and serving remote clients
+    """
+    addr = parse_address(address)
+    if isinstance(addr, str):
+        if UnixCommandServer is None:
+            raise OSError("Unix sockets are not supported on this platform!")
+        if os.path.exists(addr):
+            if _is_listening(addr):
+                raise OSError(f"Address already in use: {addr}")
+            os.unlink(addr)
+        server = UnixCommandServer(addr, command, verbose)
+    else:
+        server = TCPCommandServer(addr, command, verbose, allow_remote)
+    try:
+        if ready:
+            ready(server.server_address)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(addr, str) and os.path.exists(addr):
+            os.unlink(addr)
+
+
+def send_request(address: str | os.PathLike, args: list[str], color: bool = False,
+                 timeout: float = None) -> tuple[int, str, str]:
+    """
+    Send the CLI arguments *args* to the daemon listening on *address* with the client's working directory and
+    ``SLAMBUC_*`` environment variables.
+
+    :param address: Unix socket path or TCP address (*port* or *host:port*)
+    :param args:    command line arguments
+    :param color:   request ANSI color codes in the outputs
+    :param timeout: socket timeout in sec
+    :return:        exit code, standard output and standard error
+    """
+    addr = parse_address(address)
+    env = {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX) and k != f"{ENV_PREFIX}CONNECT"}
+    req = json.dumps(dict(args=list(args), cwd=os.getcwd(), env=env, color=color)).encode() + b'\n'
+    with socket.socket(socket.AF_UNIX if isinstance(addr, str) else socket.AF_INET) as sock:
+        sock.settimeout(timeout)
+        sock.connect(addr)
+        sock.sendall(req)
+        with sock.makefile('rb') as stream:
+            if not (line := stream.readline()):
+                raise ConnectionError("Connection closed by the daemon without reply")
+            resp = json.loads(line)
+    return resp['code'], resp['stdout'], resp['stderr']
+
+
+def forward_command(address: str | os.PathLike, args: list[str], timeout: float = None) -> int:
+    """
+    Execute the CLI arguments *args* by the daemon listening on *address* and print its outputs.
+
+    :param address: Unix socket path or TCP address (*port* or *host:port*)
+    :param args:    command line arguments
+    :param timeout: socket timeout in sec
+    :return:        exit code of the command
+    """
+    code, out, err = send_request(address, args, color=sys.stdout.isatty(), timeout=timeout)
+    sys.stderr.write(err)
+    sys.stderr.flush()
+    sys.stdout.write(out)
+    sys.stdout.flush()
+    return code
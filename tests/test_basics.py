@@ -18,13 +18,17 @@ import random
 
 import networkx as nx
 
-from slambuc.alg.app import PLATFORM, RUNTIME, DATA
+from slambuc.alg.app import PLATFORM, RUNTIME, DATA, NAME, CompactTree
+from slambuc.alg.app.common import CPU
 from slambuc.alg.util import recreate_subtree_blocks, split_chain, recreate_subchain_blocks, ihierarchical_nodes, \
-    ihierarchical_edges, iclosed_subgraph, isubgraph_bfs
+    ihierarchical_edges, iclosed_subgraph, isubgraph_bfs, BarrierLink, flatten_barriers
 from slambuc.alg.tree.path.state import transform_autonomous_caching
-from slambuc.misc.io import encode_service_tree, decode_service_tree, save_trees_to_file, iload_trees_from_file
+from slambuc.alg.tree.serial.pseudo import pseudo_btree_partitioning, pseudo_ltree_partitioning
+from slambuc.misc.io import encode_service_tree, decode_service_tree, save_trees_to_file, iload_trees_from_file, \
+    encode_service_tree_v2, TreeArchive, iload_trees_parallel, encode_dag, decode_dag, save_dags_to_file, \
+    iload_dags_from_file
 from slambuc.misc.plot import draw_tree, draw_dag
-from slambuc.misc.random import get_random_chain, get_random_tree
+from slambuc.misc.random import get_random_chain, get_random_tree, get_random_dag
 from slambuc.misc.util import print_tree_summary, is_compatible
 
 
@@ -89,6 +93,67 @@ def test_tree_io():
     for i, tree in enumerate(iload_trees_from_file("test_trees.npy")):
         print(i, "->", tree)
         print("\tisomorphic:", nx.is_isomorphic(trees[i], tree), "compatible:", is_compatible(trees[i], tree))
+    pathlib.Path("test_trees.npy").unlink()
+
+
+def test_tree_enc_dec_v2(n: int = 10):
+    tree = get_random_tree(n)
+    tree.nodes[n // 2][CPU] = 2
+    print("Encoded tree:")
+    tdata = encode_service_tree_v2(tree)
+    print(tdata)
+    tree2 = decode_service_tree(tdata)
+    print("Decoded tree:")
+    print_tree_summary(tree2)
+    print(f"Equal: {nx.utils.graphs_equal(tree, tree2)}")
+    assert tree2.graph == tree.graph and tree2.nodes[n // 2][CPU] == 2
+    assert sorted(tree2.edges(data=True), key=str) == sorted(tree.edges(data=True), key=str)
+    ctree = decode_service_tree(tdata, compact=True)
+    print("Decoded compact tree:", ctree, ctree.parent, ctree.child_ptr, ctree.child_idx)
+    assert sorted(ctree.edges(), key=str) == sorted(tree.edges(), key=str)
+    trees = [get_random_tree(n) for n in range(5, 15)]
+    save_trees_to_file(trees, "test_trees.npy", version=2)
+    for i, tree in enumerate(iload_trees_from_file("test_trees.npy")):
+        print(i, "->", tree)
+        assert nx.utils.graphs_equal(trees[i], tree)
+    pathlib.Path("test_trees.npy").unlink()
+
+
+def test_tree_archive(version: int = 2):
+    trees = [get_random_tree(n) for n in range(5, 25)]
+    save_trees_to_file(trees, "test_trees.npy", padding=25, version=version)
+    archive = TreeArchive("test_trees.npy")
+    print("Archive:", archive, "sizes:", archive.sizes())
+    assert len(archive) == len(trees) and archive.sizes().tolist() == [len(t) for t in trees]
+    print("Views:", archive[0], archive[-1], archive[2:5])
+    print("Runtime:", archive[0].runtime, "parent:", archive[0].parent)
+    assert archive[0].runtime.tolist() == [trees[0].nodes[v][RUNTIME] for v in range(1, len(trees[0]))]
+    selected = archive.filter(min_size=10, max_size=20).filter(lambda t: t.runtime.sum() > 300)
+    print("Filtered trees:", selected, selected.indices)
+    for idx, tree in zip(selected.indices, selected.itrees()):
+        print(idx, "->", tree)
+        assert nx.is_isomorphic(trees[idx], tree) and 10 <= len(tree) <= 20
+    del archive, selected
+    pathlib.Path("test_trees.npy").unlink()
+
+
+def test_tree_parallel_loading(version: int = 2, workers: int = 2):
+    trees = [get_random_tree(n) for n in range(5, 35)]
+    trees[7].graph[NAME] = "selected_tree"
+    save_trees_to_file(trees, "test_trees.npy", padding=35, version=version)
+    loaded = list(iload_trees_parallel("test_trees.npy", workers=workers, chunk_size=4, prefetch=2))
+    print("Loaded trees:", len(loaded))
+    assert len(loaded) == len(trees)
+    assert all(nx.is_isomorphic(t1, t2) for t1, t2 in zip(trees, loaded))
+    filtered = list(iload_trees_parallel("test_trees.npy", workers=workers, chunk_size=4, compact=True, min_size=10,
+                                         max_size=20))
+    print("Filtered trees:", filtered)
+    assert [len(t) for t in filtered] == list(range(10, 21))
+    if version > 1:
+        named = list(iload_trees_parallel("test_trees.npy", workers=workers, name="selected_*"))
+        print("Named trees:", named)
+        assert len(named) == 1 and nx.is_isomorphic(named[0], trees[7])
+    pathlib.Path("test_trees.npy").unlink()
 
 
 def test_cache_transform():
@@ -101,6 +166,35 @@ def test_cache_transform():
     print(RUNTIME, pprint.pformat(nx.get_node_attributes(tree2, name=RUNTIME)))
 
 
+def test_compact_tree():
+    tree = get_random_tree(20)
+    ctree = CompactTree.from_digraph(tree)
+    print("Compact tree:", ctree)
+    print("Parent array:", ctree.parent)
+    print("CSR children:", ctree.child_ptr, ctree.child_idx)
+    assert list(ctree) == list(tree)
+    assert all(list(ctree.successors(v)) == list(tree.successors(v)) for v in tree)
+    assert all(ctree.nodes[v][RUNTIME] == tree.nodes[v][RUNTIME] for v in tree if v is not PLATFORM)
+    assert all(ctree[u][v][DATA] == tree[u][v][DATA] for u, v in tree.edges)
+    assert nx.utils.graphs_equal(tree, ctree.to_digraph())
+    for alg in (pseudo_btree_partitioning, pseudo_ltree_partitioning):
+        res, c_res = alg(tree, 1, M=6, cp_end=10), alg(ctree, 1, M=6, cp_end=10)
+        print(f"{alg.__name__}:", res, c_res)
+        assert res == c_res
+
+
+def test_barrier_link():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree.gml", destringizer=int)
+    # Barriers 2 and 6 are shared by two subcases, while 7 and 9 are given as a plain set of another process
+    shared = BarrierLink(6, BarrierLink(2))
+    barr1, barr2 = BarrierLink(1, shared, {7, 9}), BarrierLink(1, shared)
+    print("Barrier links:", barr1, barr2, sep="\n")
+    assert flatten_barriers(barr1) == {1, 2, 6, 7, 9} and flatten_barriers(barr2) == {1, 2, 6}
+    partition = recreate_subtree_blocks(tree, barr1)
+    print("Partition", partition)
+    assert partition == recreate_subtree_blocks(tree, [1, 2, 6, 7, 9])
+
+
 def test_dag_traversal(dag_file: str = pathlib.Path(__file__).parent / "data/graph_test_dag.gml"):
     print(dag_file)
     dag = nx.read_gml(dag_file, destringizer=int)
@@ -121,6 +215,24 @@ def test_dag_traversal(dag_file: str = pathlib.Path(__file__).parent / "data/gra
             print(v)
 
 
+def test_dag_enc_dec(dag_file: str = pathlib.Path(__file__).parent / "data/graph_test_dag.gml"):
+    dag = nx.read_gml(dag_file, destringizer=int)
+    print("Encoded DAG:")
+    ddata = encode_dag(dag)
+    print(ddata)
+    dag2 = decode_dag(ddata)
+    print("Decoded DAG:", dag2)
+    assert nx.utils.graphs_equal(dag, dag2)
+    assert all(list(dag.successors(v)) == list(dag2.successors(v)) for v in dag)
+    dags = [get_random_dag(n, crossing=n // 3) for n in range(5, 15)]
+    for file_name in ("test_dags.npy", "test_dags.npz"):
+        save_dags_to_file(dags, file_name)
+        for i, dag in enumerate(iload_dags_from_file(file_name)):
+            print(i, "->", dag)
+            assert nx.utils.graphs_equal(dags[i], dag)
+        pathlib.Path(file_name).unlink()
+
+
 if __name__ == '__main__':
     # test_chain_plotter()
     # test_chain_tree_plotter()
@@ -131,6 +243,12 @@ if __name__ == '__main__':
     # draw_tree_from_file(pathlib.Path(__file__).parent / "data/graph_test_tree_par_ltree.gml", draw_weights=False)
     # test_tree_enc_dec()
     # test_tree_io()
+    # test_tree_enc_dec_v2()
+    # test_tree_archive()
+    # test_tree_parallel_loading()
     # test_cache_transform()
+    # test_compact_tree()
+    # test_barrier_link()
     # test_dag_traversal()
+    # test_dag_enc_dec()
     test_dag_traversal("failed.gml")
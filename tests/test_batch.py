@@ -0,0 +1,64 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import time
+
+import networkx as nx
+
+from slambuc.alg.batch import partition_many, ipartition_many
+from slambuc.alg.tree.serial.pseudo import pseudo_ltree_partitioning
+from slambuc.misc.random import get_random_tree
+
+
+def get_params(tree: nx.DiGraph) -> dict:
+    return dict(root=1, M=6, L=math.inf, cp_end=len(tree) - 1, delay=10)
+
+
+def sleepy_partitioning(tree: nx.DiGraph, sleep: float = 0.0, **kwargs) -> int:
+    time.sleep(sleep if len(tree) > 10 else 0)
+    return len(tree)
+
+
+def test_batch_partitioning(n: int = 10, num: int = 12, workers: int = 2):
+    trees = [get_random_tree(n) for _ in range(num)]
+    results = partition_many(iter(trees), "slambuc.alg.tree.serial.pseudo.pseudo_ltree_partitioning", get_params,
+                             workers=workers, prefetch=3)
+    for res in results:
+        print(res)
+    assert [res.index for res in results] == list(range(num))
+    assert [res.result for res in results] == [pseudo_ltree_partitioning(t, **get_params(t)) for t in trees]
+
+
+def test_batch_partitioning_unordered(n: int = 10, num: int = 12, workers: int = 2):
+    trees = [get_random_tree(n) for _ in range(num)]
+    results = list(ipartition_many(trees, pseudo_ltree_partitioning, dict(M=6, delay=10), workers=workers,
+                                   ordered=False))
+    print("Completion order:", [res.index for res in results])
+    assert sorted(res.index for res in results) == list(range(num))
+    assert all(res.error is None for res in results)
+
+
+def test_batch_partitioning_timeout(workers: int = 2):
+    trees = [get_random_tree(n) for n in (5, 20, 5)]
+    results = partition_many(trees, sleepy_partitioning, dict(sleep=5), workers=workers, timeout=0.5)
+    for res in results:
+        print(res)
+    assert isinstance(results[1].error, TimeoutError)
+    assert results[0].result == results[2].result == 6
+
+
+if __name__ == '__main__':
+    test_batch_partitioning()
+    # test_batch_partitioning_unordered()
+    # test_batch_partitioning_timeout()
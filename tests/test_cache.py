@@ -0,0 +1,104 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import pathlib
+import tempfile
+
+import pulp
+import pytest
+
+from slambuc.alg import Flavor
+from slambuc.alg.app import NAME, RUNTIME
+from slambuc.alg.app.compact import compact_tree
+from slambuc.alg.cache import ResultCache, cached, normalize_value, result_key, tree_fingerprint
+from slambuc.alg.solver import SCIPY_MILP
+from slambuc.alg.tree.serial.ilp import tree_hybrid_partitioning
+from slambuc.alg.tree.serial.pseudo import pseudo_ltree_partitioning
+from slambuc.misc.random import get_random_tree
+
+
+def test_tree_fingerprint(n: int = 10):
+    tree = get_random_tree(n)
+    fp = tree_fingerprint(tree)
+    print("Fingerprint:", fp)
+    tree.graph[NAME] = "renamed"
+    assert tree_fingerprint(tree) == tree_fingerprint(compact_tree(tree)) == fp
+    tree.nodes[n][RUNTIME] += 1
+    assert tree_fingerprint(tree) != fp
+    key = result_key("alg", dict(tree=tree, M=6, L=math.inf, flavors=[Flavor()]))
+    assert key == result_key("alg", dict(flavors=[Flavor()], L=float('inf'), M=6.0, tree=compact_tree(tree)))
+    assert key != result_key("alg", dict(tree=tree, M=7, L=math.inf, flavors=[Flavor()]))
+
+
+def test_normalize_solver():
+    solver = normalize_value(pulp.PULP_CBC_CMD(msg=False, timeLimit=10))
+    print("Solver:", solver)
+    assert solver == normalize_value(pulp.PULP_CBC_CMD(msg=True, timeLimit=10.0))
+    assert solver != normalize_value(pulp.PULP_CBC_CMD(msg=False, timeLimit=20))
+    assert solver != normalize_value(pulp.PULP_CBC_CMD(msg=False, timeLimit=10, gapRel=0.1))
+    assert solver != normalize_value(pulp.PULP_CBC_CMD(msg=False, timeLimit=10, mip=False))
+    assert solver != normalize_value(pulp.PULP_CBC_CMD(msg=False, timeLimit=10, options=['presolve off']))
+    assert normalize_value(SCIPY_MILP(msg=False)) != normalize_value(SCIPY_MILP(msg=False, gapRel=0.1))
+    assert normalize_value(math.ceil) == "math.ceil"
+    # Objects without a stable identity are refused
+    for value in (lambda x: x, object()):
+        with pytest.raises(TypeError):
+            normalize_value(value)
+
+
+def test_cached_solver(n: int = 10):
+    tree = get_random_tree(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        alg = cached(pathlib.Path(tmp, "cache.db"))(tree_hybrid_partitioning)
+        res = alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10, solver=pulp.PULP_CBC_CMD(msg=False))
+        print("Result:", res)
+        assert alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10, solver=pulp.PULP_CBC_CMD(msg=True)) == res
+        assert len(alg.cache) == 1
+        alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10, solver=pulp.PULP_CBC_CMD(msg=False, timeLimit=10))
+        assert len(alg.cache) == 2
+        # Calls with arguments that cannot be normalized bypass the cache
+        apply = cached(alg.cache)(lambda x, func: func(x))
+        assert apply(2, lambda x: x + 1) == 3 and apply(2, lambda x: x * 3) == 6 and len(alg.cache) == 2
+        alg.cache.close()
+
+
+def test_result_cache_eviction():
+    with tempfile.TemporaryDirectory() as tmp, ResultCache(pathlib.Path(tmp, "cache.db"), max_size=1024) as cache:
+        for i in range(10):
+            cache.put(f"key{i}", list(range(100)))
+            # Keep the first result recently used
+            assert cache.get("key0") is not None
+        print(cache, "entries:", len(cache), "size:", cache.size)
+        assert cache.size <= 1024 and "key0" in cache and "key9" in cache and "key1" not in cache
+
+
+def test_cached_partitioning(n: int = 10):
+    tree = get_random_tree(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        alg = cached(pathlib.Path(tmp, "cache.db"))(pseudo_ltree_partitioning)
+        res = alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10)
+        print("Result:", res)
+        assert res == pseudo_ltree_partitioning(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10)
+        assert alg(tree, 1, 6, cp_end=n, delay=10) == res and len(alg.cache) == 1
+        alg(tree, root=1, M=5, L=math.inf, cp_end=n, delay=10)
+        assert len(alg.cache) == 2
+        alg.cache.close()
+
+
+if __name__ == '__main__':
+    test_tree_fingerprint()
+    # test_normalize_solver()
+    # test_cached_solver()
+    # test_result_cache_eviction()
+    # test_cached_partitioning()
@@ -0,0 +1,114 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import pathlib
+import stat
+import sys
+import tempfile
+import threading
+
+import click
+import pytest
+
+from slambuc.tool import daemon
+
+
+@click.group('slambuc')
+@click.option('-j', '--json', 'format_json', is_flag=True, default=False)
+@click.pass_context
+def dummy_cli(ctx: click.Context, format_json: bool):
+    ctx.ensure_object(dict)
+    ctx.obj['FORMAT_JSON'] = format_json
+
+
+@dummy_cli.command("run")
+@click.argument('filename', type=click.Path(exists=True, dir_okay=False, resolve_path=True))
+@click.pass_context
+def dummy_run(ctx: click.Context, filename: str):
+    click.secho(f"Loading input data from file: {filename}", err=True)
+    click.echo(json.dumps(dict(file=filename, M=os.environ.get('SLAMBUC_M'), json=ctx.obj['FORMAT_JSON'],
+                               served=ctx.obj.get(daemon.SERVING, False))))
+    if pathlib.Path(filename).suffix == '.err':
+        sys.exit(os.EX_DATAERR)
+    elif pathlib.Path(filename).suffix == '.bug':
+        raise RuntimeError("Unexpected failure")
+
+
+def start_daemon(address: str) -> str | tuple[str, int]:
+    ready = threading.Event()
+    bound = []
+    threading.Thread(target=daemon.serve, args=(dummy_cli, address),
+                     kwargs=dict(verbose=True, ready=lambda addr: (bound.append(addr), ready.set())),
+                     daemon=True).start()
+    assert ready.wait(timeout=10)
+    return bound[0]
+
+
+def test_parse_address():
+    print(daemon.parse_address("/tmp/slambuc.sock"), daemon.parse_address("8000"),
+          daemon.parse_address("localhost:8000"))
+    assert daemon.parse_address("/tmp/slambuc.sock") == "/tmp/slambuc.sock"
+    assert daemon.parse_address("8000") == (daemon.DEFAULT_HOST, 8000)
+    assert daemon.parse_address("localhost:8000") == ("localhost", 8000)
+
+
+def test_daemon_requests():
+    with tempfile.TemporaryDirectory() as tmp:
+        addr = start_daemon(str(pathlib.Path(tmp, "slambuc.sock")))
+        print("Daemon address:", addr)
+        pathlib.Path(tmp, "tree.gml").touch()
+        pathlib.Path(tmp, "tree.err").touch()
+        pathlib.Path(tmp, "tree.bug").touch()
+        assert stat.S_IMODE(os.stat(addr).st_mode) == 0o600
+        cwd = os.getcwd()
+        try:
+            # Relative paths are resolved in the client's working directory
+            os.chdir(tmp)
+            os.environ['SLAMBUC_M'] = "6"
+            code, out, err = daemon.send_request(addr, ["-j", "run", "tree.gml"])
+            print(code, out, err, sep='\n')
+            assert code == os.EX_OK and json.loads(out) == dict(file=str(pathlib.Path(tmp, "tree.gml").resolve()),
+                                                                M="6", json=True, served=True)
+            assert err.startswith("Loading input data")
+            code, out, err = daemon.send_request(addr, ["run", "missing.gml"])
+            print(code, out, err, sep='\n')
+            assert code == 2 and "does not exist" in err
+            code, out, err = daemon.send_request(addr, ["run", "tree.err"])
+            print(code, out, err, sep='\n')
+            assert code == os.EX_DATAERR and json.loads(out)['json'] is False
+            code, out, err = daemon.send_request(addr, ["run", "tree.bug"])
+            print(code, out, err, sep='\n')
+            assert code == os.EX_SOFTWARE and "RuntimeError: Unexpected failure" in err
+        finally:
+            os.environ.pop('SLAMBUC_M', None)
+            os.chdir(cwd)
+
+
+def test_daemon_tcp():
+    addr = start_daemon(f"{daemon.DEFAULT_HOST}:0")
+    print("Daemon address:", addr)
+    code, out, err = daemon.send_request(f"{addr[0]}:{addr[1]}", ["run", __file__])
+    print(code, out, err, sep='\n')
+    assert code == os.EX_OK and json.loads(out)['file'] == str(pathlib.Path(__file__).resolve())
+    # Unauthenticated requests are allowed only from loopback interfaces by default
+    assert daemon.is_loopback("127.0.0.1") and daemon.is_loopback("::1") and not daemon.is_loopback("0.0.0.0")
+    with pytest.raises(PermissionError):
+        daemon.serve(dummy_cli, "0.0.0.0:0", verbose=False)
+
+
+if __name__ == '__main__':
+    test_parse_address()
+    # test_daemon_requests()
+    # test_daemon_tcp()
@@ -0,0 +1,109 @@
+# Copyright 2025 Janos Czentye
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import pathlib
+import subprocess
+import sys
+import textwrap
+
+import networkx as nx
+
+from slambuc.alg.app import NAME
+from slambuc.alg.tree.pool import WorkerPool
+from slambuc.alg.tree.serial.bicriteria import (biheuristic_btree_partitioning, bifptas_ltree_partitioning,
+                                                bifptas_dual_ltree_partitioning)
+from slambuc.alg.tree.serial.bicriteria_mp import (biheuristic_mp_btree_partitioning, bifptas_mp_ltree_partitioning,
+                                                   bifptas_dual_mp_ltree_partitioning)
+from slambuc.misc.random import get_random_tree
+from slambuc.misc.util import evaluate_ser_tree_partitioning
+
+
+def run_test(tree: nx.DiGraph, M: int, L: int, root: int = 1, cp_end: int = None, delay: int = 10,
+             Epsilon: float = 0.0, Lambda: float = 0.0):
+    for alg in (biheuristic_mp_btree_partitioning, bifptas_mp_ltree_partitioning, bifptas_dual_mp_ltree_partitioning):
+        print(f" Run {alg.__name__} ".center(80, '#'))
+        partition, opt_cost, opt_lat = alg(tree, root, M, L, cp_end, delay, Epsilon, Lambda)
+        evaluate_ser_tree_partitioning(tree, partition, opt_cost, opt_lat, root, cp_end, M, L, delay)
+
+
+def test_ser_bicriteria_mp_tree_partitioning():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
+    tree.graph[NAME] += "-ser_bic_mp"
+    params = dict(tree=tree,
+                  root=1,
+                  cp_end=10,
+                  M=6,
+                  L=430,
+                  delay=10)
+    run_test(**params)
+
+
+def test_random_bicriteria_mp_tree_partitioning(n: int = 30, M: int = 15, L: int = math.inf, Epsilon: float = 0.5,
+                                                Lambda: float = 0.2):
+    tree = get_random_tree(n)
+    for seq_alg, mp_alg in ((biheuristic_btree_partitioning, biheuristic_mp_btree_partitioning),
+                            (bifptas_ltree_partitioning, bifptas_mp_ltree_partitioning),
+                            (bifptas_dual_ltree_partitioning, bifptas_dual_mp_ltree_partitioning)):
+        res_seq = seq_alg(tree, 1, M, L, n, 10, Epsilon, Lambda)
+        res_mp = mp_alg(tree, 1, M, L, n, 10, Epsilon, Lambda)
+        print(f"{mp_alg.__name__}: {res_seq=}, {res_mp=}")
+        assert res_seq[1:] == res_mp[1:]
+
+
+def test_bicriteria_mp_worker_pool(n: int = 30, M: int = 15, L: int = 800, workers: int = 2):
+    tree = get_random_tree(n)
+    with WorkerPool(workers) as pool:
+        for alg in (biheuristic_mp_btree_partitioning, bifptas_mp_ltree_partitioning,
+                    bifptas_dual_mp_ltree_partitioning):
+            res_pool = alg(tree, 1, M, L, n, 10, 0.3, 0.0, pool=pool, workers=workers)
+            res_proc = alg(tree, 1, M, L, n, 10, 0.3, 0.0, shared=False)
+            print(f"{alg.__name__}: {res_pool=}, {res_proc=}")
+            assert res_pool[1:] == res_proc[1:]
+
+
+def test_bicriteria_mp_shared_memory(n: int = 30, M: int = 15, trials: int = 5):
+    # Shared memory blocks must be released without resource tracker warnings in both subprocesses and pool workers
+    code = textwrap.dedent(f"""
+        import math, pathlib, random
+        from slambuc.alg.tree.pool import WorkerPool
+        from slambuc.alg.tree.serial.bicriteria_mp import (biheuristic_mp_btree_partitioning,
+                                                           bifptas_mp_ltree_partitioning,
+                                                           bifptas_dual_mp_ltree_partitioning)
+        from slambuc.misc.random import get_random_tree
+        if __name__ == '__main__':
+            blocks = set(pathlib.Path("/dev/shm").glob("psm_*"))
+            with WorkerPool(2) as pool:
+                for i in range({trials}):
+                    random.seed(i)
+                    tree = get_random_tree({n})
+                    for alg in (biheuristic_mp_btree_partitioning, bifptas_mp_ltree_partitioning,
+                                bifptas_dual_mp_ltree_partitioning):
+                        for L in (math.inf, 600):
+                            print(alg(tree, 1, {M}, L, {n}, 10, 0.3, 0.0)[1:],
+                                  alg(tree, 1, {M}, L, {n}, 10, 0.3, 0.0, pool=pool)[1:])
+            print("Leaked blocks:", set(pathlib.Path("/dev/shm").glob("psm_*")) - blocks)
+        """)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          cwd=pathlib.Path(__file__).parent.parent, timeout=300)
+    print(proc.stdout, proc.stderr, sep='\n')
+    assert proc.returncode == 0 and 'Traceback' not in proc.stderr and 'resource_tracker' not in proc.stderr
+    assert "Leaked blocks: set()" in proc.stdout
+
+
+if __name__ == '__main__':
+    test_ser_bicriteria_mp_tree_partitioning()
+    # test_random_bicriteria_mp_tree_partitioning()
+    # test_random_bicriteria_mp_tree_partitioning(n=50, L=600, Epsilon=0.0, Lambda=0.0)
+    # test_bicriteria_mp_worker_pool()
+    # test_bicriteria_mp_shared_memory()
@@ -16,9 +16,10 @@ import pathlib
 
 import networkx as nx
 
+from slambuc.alg import INFEASIBLE
 from slambuc.alg.app import NAME
-from slambuc.alg.tree.serial.greedy import greedy_ser_tree_partitioning
-from slambuc.alg.util import leaf_label_nodes
+from slambuc.alg.tree.serial.greedy import greedy_ser_tree_partitioning, isubtrees_exhaustive
+from slambuc.alg.util import leaf_label_nodes, isubtrees, ser_subtree_cost, ibacktrack_chain, ser_subchain_latency
 from slambuc.misc.random import get_random_tree
 from slambuc.misc.util import evaluate_ser_tree_partitioning
 
@@ -58,6 +59,28 @@ def test_random_greedy_partitioning(n: int = 10):
     run_test(**params)
 
 
+def test_bnb_greedy_partitioning(n: int = 10, M: int = 6, L: int = 500, delay: int = 10):
+    tree = get_random_tree(n)
+    cpath = set(ibacktrack_chain(tree, 1, n))
+    results = greedy_ser_tree_partitioning(tree, 1, M, L, n, delay)
+    print("B&B:", results)
+    # Reference: exhaustive enumeration of feasible cuttings
+    ref_res, ref_cost = [INFEASIBLE], math.inf
+    for barrs in isubtrees_exhaustive(tree, 1, M):
+        partition = sorted(nodes for _, nodes in isubtrees(tree, barrs))
+        sum_cost = sum(ser_subtree_cost(tree, blk[0], blk) for blk in partition)
+        blk_lats = [ser_subchain_latency(tree, blk[0], set(blk), cpath) for blk in partition]
+        sum_lat = sum(blk_lats) + (sum(map(bool, blk_lats)) - 1) * delay
+        if sum_lat <= L:
+            if sum_cost == ref_cost:
+                ref_res.append((partition, sum_cost, sum_lat))
+            elif sum_cost < ref_cost:
+                ref_res, ref_cost = [(partition, sum_cost, sum_lat)], sum_cost
+    print("Exhaustive:", ref_res)
+    assert results == ref_res
+
+
 if __name__ == '__main__':
     test_ser_tree_greedy_partitioning()
     # test_random_greedy_partitioning()
+    # test_bnb_greedy_partitioning()
@@ -24,9 +24,12 @@ import tabulate
 
 from slambuc.alg.app import *
 from slambuc.alg.tree.serial.ilp import (ifeasible_subtrees, ifeasible_greedy_subtrees, build_tree_cfg_model,
+                                         ifeasible_connected_subtrees,
                                          tree_hybrid_partitioning, extract_subtrees_from_xdict,
-                                         recreate_subtrees_from_xdict)
-from slambuc.alg.util import ibacktrack_chain
+                                         recreate_subtrees_from_xdict, tree_colgen_partitioning, BlockMetrics,
+                                         solve_cfg_colgen_model)
+from slambuc.alg.ext.greedy import min_weight_greedy_partitioning
+from slambuc.alg.util import ibacktrack_chain, ser_subtree_cost, ser_subtree_memory, ser_subchain_latency
 from slambuc.misc.random import get_random_tree
 from slambuc.misc.util import print_lp_desc, evaluate_ser_tree_partitioning, get_cplex_path, get_glpk_path
 
@@ -83,6 +86,27 @@ def test_restricted_feasible_subtrees():
     print(tabulate.tabulate(blocks_data, ('Block', 'Memory', 'Sum')))
 
 
+def test_connected_feasible_subtrees():
+    memory, M = {i: m for i, m in enumerate((3, 3, 2, 1, 3, 1, 3, 2, 2, 1, 2, 1, 1, 3, 3, 2))}, 6
+    print(f"Data: {memory = }, {M = }")
+    tree = nx.balanced_tree(2, 3, create_using=nx.DiGraph)
+    nx.set_node_attributes(tree, memory, MEMORY)
+    tree.add_edge(PLATFORM, 0)
+    print("  Restricted blocks (connected)  ".center(80, '='))
+    _start = time.perf_counter()
+    blocks = list(ifeasible_connected_subtrees(tree, root=0, M=M))
+    _stop = time.perf_counter()
+    print(f"Number of generated blocks: {len(blocks)}")
+    print(f"Sum time: {(_stop - _start) * 1000} ms")
+    _start = time.perf_counter()
+    greedy_blocks = list(ifeasible_greedy_subtrees(tree, root=None, M=M))
+    _stop = time.perf_counter()
+    print(f"Number of greedy blocks: {len(greedy_blocks)}")
+    print(f"Sum time: {(_stop - _start) * 1000} ms")
+    assert sorted(map(sorted, (b for _, b in blocks))) == sorted(map(sorted, (b for _, b in greedy_blocks)))
+    assert all(sum(memory[v] for v in b) <= M for _, b in blocks)
+
+
 def test_model_creation(tree_file: str = pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml",
                         save_file: bool = False):
     tree = nx.read_gml(tree_file, destringizer=int)
@@ -168,6 +192,57 @@ def test_model_solution_glpk():
     print(f"Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
 
 
+def test_model_solution_colgen():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
+    tree.graph[NAME] += "-ser_ilp_cfg"
+    params = dict(tree=tree,
+                  root=1,
+                  cp_end=10,
+                  M=6,
+                  L=430,
+                  delay=10)
+    print("  Column generation  ".center(80, '='))
+    partition, opt_cost, opt_lat = tree_colgen_partitioning(**params)
+    print(f"Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
+    evaluate_ser_tree_partitioning(partition=partition, opt_cost=opt_cost, opt_lat=opt_lat, **params)
+    print("  Hybrid  ".center(80, '='))
+    ref_partition, ref_cost, ref_lat = tree_hybrid_partitioning(**params)
+    print(f"Partitioning: {ref_partition}, {ref_cost = }, {ref_lat = }")
+    assert opt_cost == ref_cost and opt_lat <= params['L']
+
+
+def test_random_colgen(n: int = 9, trials: int = 10):
+    for _ in range(trials):
+        tree = get_random_tree(n)
+        for L in (math.inf, 500, 400):
+            params = dict(tree=tree, root=1, cp_end=n, M=8, L=L, delay=10)
+            partition, opt_cost, opt_lat = tree_colgen_partitioning(**params)
+            ref_partition, ref_cost, ref_lat = tree_hybrid_partitioning(**params)
+            print(f"{L = }: {partition}, {opt_cost = } <-> {ref_partition}, {ref_cost = }")
+            assert opt_cost == ref_cost
+
+
+def test_infeasible_colgen(n: int = 12):
+    tree = get_random_tree(n)
+    cpath = set(ibacktrack_chain(tree, 1, n))
+    metrics = BlockMetrics(6, lambda b, v: ser_subtree_cost(tree, b, v), lambda b, v: ser_subtree_memory(tree, v),
+                           lambda b, v: ser_subchain_latency(tree, b, v, cpath))
+    seeds = [min_weight_greedy_partitioning(tree, 1, 6, 1, 10, metrics=False)[0]]
+    models = []
+
+    def build(cols):
+        model, X = build_tree_cfg_model(tree, 1, 6, math.inf, cpath, 10, isubtrees=lambda *_: iter(cols[0]))
+        # Restrict the integer model of the generated columns to be infeasible
+        model += model.objective <= -1
+        models.append(model)
+        return model, X
+
+    status, model, X = solve_cfg_colgen_model(tree, 1, math.inf, cpath, 10, [metrics], seeds, build)
+    print(f"Status: {pulp.LpStatus[status]}, built models: {len(models)}")
+    # No columns are enumerated without an integer solution
+    assert status == pulp.LpStatusInfeasible and len(models) == 1
+
+
 def evaluate_ilp_cfg_model():
     tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
     tree.graph[NAME] += "-ser_ilp_cfg"
@@ -226,10 +301,14 @@ def test_random_ser_tree(n: int = 10):
 if __name__ == '__main__':
     # test_feasible_subtrees(branch=2, depth=2)
     # test_restricted_feasible_subtrees()
+    # test_connected_feasible_subtrees()
     # test_model_creation(save_file=False)
     # test_model_solution()
     # test_model_solution_cplex()
     # test_model_solution_glpk()
+    # test_model_solution_colgen()
+    # test_random_colgen()
+    # test_infeasible_colgen()
     # evaluate_ilp_cfg_model()
     test_ser_tree()
     # test_random_ser_tree()
@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import importlib.util
 import math
 import pathlib
 import pprint
 import sys
 import time
+import warnings
 
 import networkx as nx
 import numpy as np
@@ -25,8 +27,10 @@ import tabulate
 
 from slambuc.alg import LP_LAT
 from slambuc.alg.app import NAME, PLATFORM
+from slambuc.alg.solver import SCIPY_MILP, SparseLpModel
 from slambuc.alg.tree.serial.ilp import (build_tree_mtx_model, tree_mtx_partitioning, recreate_subtrees_from_xmatrix,
-                                         extract_subtrees_from_xmatrix, build_greedy_tree_mtx_model)
+                                         extract_subtrees_from_xmatrix, build_greedy_tree_mtx_model,
+                                         init_xmatrix_from_partition, MtxModelTemplate)
 from slambuc.alg.util import induced_subtrees, ibacktrack_chain
 from slambuc.misc.plot import draw_tree
 from slambuc.misc.random import get_random_tree
@@ -197,6 +201,116 @@ def test_mtx_model_solution_glpk():
     print(f"Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
 
 
+@pytest.mark.skipif(importlib.util.find_spec('scipy') is None, reason="SciPy is not available!")
+def test_mtx_model_solution_milp():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
+    tree.graph[NAME] += "-ser_ilp_mtx"
+    params = dict(tree=tree,
+                  root=1,
+                  cp_end=10,
+                  M=6,
+                  L=430,
+                  delay=10)
+    print("  Run in-process HiGHS solver  ".center(80, '='))
+    partition, opt_cost, opt_lat = tree_mtx_partitioning(**params, solver=SCIPY_MILP(mip=True, msg=True))
+    print(f"Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
+    evaluate_ser_tree_partitioning(partition=partition, opt_cost=opt_cost, opt_lat=opt_lat, **params)
+    cbc_partition, cbc_cost, cbc_lat = tree_mtx_partitioning(**params, solver=pulp.PULP_CBC_CMD(mip=True, msg=False))
+    assert opt_cost == cbc_cost and opt_lat <= params['L']
+
+
+def test_mtx_model_warm_start():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
+    tree.graph[NAME] += "-ser_ilp_mtx"
+    params = dict(tree=tree,
+                  root=1,
+                  cp_end=10,
+                  M=6,
+                  L=430,
+                  delay=10)
+    model, X = build_tree_mtx_model(tree, 1, 6, 430, set(ibacktrack_chain(tree, 1, 10)), False, 10)
+    assert init_xmatrix_from_partition(X, [[1, 2], [3, 4, 5], [6, 8, 9], [7], [10]])
+    print("Initial blocks:", [[v for v in X if j in X[v] and pulp.value(X[v][j])] for j in X if pulp.value(X[j][j])])
+    assert not init_xmatrix_from_partition(X, [[1, 2], [3, 4, 5]])
+    assert not init_xmatrix_from_partition(X, [[1], [2, 3]])
+    print("  Cold start  ".center(80, '='))
+    partition, opt_cost, opt_lat = tree_mtx_partitioning(**params)
+    print(f"Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
+    print("  Warm start  ".center(80, '='))
+    ws_partition, ws_cost, ws_lat = tree_mtx_partitioning(**params, warm_start=True)
+    print(f"Partitioning: {ws_partition}, {ws_cost = }, {ws_lat = }")
+    evaluate_ser_tree_partitioning(partition=ws_partition, opt_cost=ws_cost, opt_lat=ws_lat, **params)
+    assert ws_cost == opt_cost and ws_lat <= params['L']
+    # Warm start must not alter the given solver and is ignored by the solvers without warm start support
+    solver = pulp.PULP_CBC_CMD(mip=True, msg=False)
+    assert tree_mtx_partitioning(**params, solver=solver, warm_start=True)[1] == opt_cost
+    assert not solver.optionsDict.get('warmStart')
+    if importlib.util.find_spec('scipy'):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assert tree_mtx_partitioning(**params, solver=SCIPY_MILP(msg=False), warm_start=True)[1] == opt_cost
+        assert not any('warmStart' in str(w.message) for w in caught)
+
+
+def test_mtx_model_template():
+    tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
+    tree.graph[NAME] += "-ser_ilp_mtx"
+    template = MtxModelTemplate(tree, root=1, cp_end=10, delay=10)
+    print("  Parameter sweep  ".center(80, '='))
+    for M, L in ((6, 430), (math.inf, 430), (6, math.inf), (4, 600), (6, 430), (3, 430)):
+        partition, opt_cost, opt_lat = template.solve(M, L)
+        print(f"{M = }, {L = } => Partitioning: {partition}, {opt_cost = }, {opt_lat = }")
+        ref_partition, ref_cost, ref_lat = tree_mtx_partitioning(tree, root=1, M=M, L=L, cp_end=10, delay=10)
+        assert opt_cost == ref_cost and (opt_lat is None) == (ref_lat is None)
+        if partition:
+            evaluate_ser_tree_partitioning(tree, partition, opt_cost, opt_lat, root=1, cp_end=10, M=M, L=L, delay=10)
+
+
+def test_sparse_model():
+    model = SparseLpModel(name="Sparse_Test")
+    x, y, z = (model.add_variable(name) for name in ("x", "y", "z"))
+    model.add_objective(x, 3)
+    model.add_objective(y, 2)
+    model.add_objective(z, 4)
+    model.add_objective(None, 1)
+    model.add_constraint(((x, 1), (y, 1), (z, 1)), pulp.LpConstraintGE, 2, name="C_cover")
+    model.add_constraint(((x, 1), (y, 1), (y, 1), (None, 1)), pulp.LpConstraintLE, 3, name="C_dup")
+    print("  Sparse matrix  ".center(80, '='))
+    indptr, cols, vals = model.csr()
+    print(f"{indptr = }, {cols = }, {vals = }")
+    assert indptr.tolist() == [0, 3, 5] and vals.tolist() == [1, 1, 1, 1, 2]
+    problem = model.to_problem()
+    print(problem)
+    assert list(problem.constraints) == ["C_cover", "C_dup"]
+    assert {v.name: c for v, c in problem.constraints["C_dup"].items()} == {"x": 1, "y": 2}
+    problem.solve(pulp.PULP_CBC_CMD(mip=True, msg=False))
+    print(f"Solution: {[(v.name, v.varValue) for v in problem.variables()]}")
+    assert pulp.value(problem.objective) == 7
+    print("  Batch rows  ".center(80, '='))
+    batch = SparseLpModel(name="Batch_Test")
+    x, y, z = batch.add_variables(("x", "y", "z"))
+    batch.add_objectives((x, y, z), (3, 2, 4))
+    batch.add_objective(None, 1)
+    batch.add_sum_constraints([(x, y, z)], pulp.LpConstraintGE, 2, names=["C_cover"])
+    batch.add_constraints((0, 0), (x, y), (1, 2), pulp.LpConstraintLE, (2,), names=["C_dup"])
+    batch.add_difference_constraints((None, x), (z, y), pulp.LpConstraintGE, names=["C_d1", "C_d2"])
+    print(batch.to_problem())
+    assert batch.csr()[0].tolist() == [0, 3, 5, 6, 8] and batch.consts == [-2, -2, 1, 0]
+    assert batch.solve(pulp.PULP_CBC_CMD(mip=True, msg=False)) == pulp.LpStatusOptimal
+    print(f"Solution: {batch.values.tolist()}")
+    assert batch.objective_value() == 8 and batch.values.tolist() == [1, 0, 1]
+    assert batch.constraint_value("C_cover") == 0
+    if importlib.util.find_spec('scipy') is not None:
+        sparse = SparseLpModel(name="Sparse_Test")
+        cols = sparse.add_variables(("x", "y", "z"))
+        sparse.add_objectives(cols, (3, 2, 4))
+        sparse.add_sum_constraints([cols], pulp.LpConstraintGE, 2, names=["C_cover"])
+        # Arrays are passed to HiGHS directly without creating PuLP objects
+        assert sparse.solve(SCIPY_MILP(msg=False)) == pulp.LpStatusOptimal and not sparse._variables
+        print(f"Solution: {sparse.values.tolist()}")
+        assert sparse.objective_value() == 5 and sparse.values.tolist() == [1, 1, 0]
+
+
 def evaluate_ilp_mtx_model():
     tree = nx.read_gml(pathlib.Path(__file__).parent / "data/graph_test_tree_ser.gml", destringizer=int)
     tree.graph[NAME] += "-ser_ilp_mtx"
@@ -280,6 +394,10 @@ if __name__ == '__main__':
     # test_mtx_model_solution()
     # test_mtx_model_solution_cplex()
     # test_mtx_model_solution_glpk()
+    # test_mtx_model_solution_milp()
+    # test_sparse_model()
+    # test_mtx_model_warm_start()
+    # test_mtx_model_template()
     # evaluate_ilp_mtx_model()
     # evaluate_ilp_mtx_subchains_model()
     # test_ser_tree()
@@ -15,13 +15,19 @@ import math
 import pathlib
 
 import networkx as nx
+import pytest
 import tabulate
 
-from slambuc.alg.app import NAME
-from slambuc.alg.tree.serial.pseudo import pseudo_btree_partitioning, pseudo_ltree_partitioning
-from slambuc.alg.util import ipostorder_dfs, ileft_right_dfs
+from slambuc.alg.app import NAME, RUNTIME, RATE
+from slambuc.alg.tree.serial.bicriteria import bifptas_ltree_partitioning
+from slambuc.alg.tree.parallel.pseudo import pseudo_par_btree_partitioning, pseudo_par_ltree_partitioning
+from slambuc.alg.tree.serial.pseudo import (pseudo_btree_partitioning, pseudo_ltree_partitioning, SubLTreePart,
+                                            IncrementalTreePartitioner, BTREE, LTREE)
+from slambuc.alg.tree.skyline import ParetoSkyline
+from slambuc.alg.util import ipostorder_dfs, ileft_right_dfs, isomorphic_subtrees
+from slambuc.generator.transform import faasify_dag_by_duplication
 from slambuc.misc.plot import draw_tree
-from slambuc.misc.random import get_random_tree
+from slambuc.misc.random import get_random_tree, get_random_dag
 from slambuc.misc.util import evaluate_ser_tree_partitioning
 
 
@@ -94,8 +100,113 @@ def test_random_tree_partitioning(n: int = 10):
     run_test(**params)
 
 
+def test_pareto_skyline():
+    skyline = ParetoSkyline()
+    for lat, mem, cost in ((30, 5, 60), (10, 3, 50), (20, 4, 40), (15, 2, 45), (10, 3, 55)):
+        added = skyline.add(lat, mem, SubLTreePart(cost, 1, set()))
+        print(f"Add subcase: {lat=}, {mem=}, {cost=} -> {added}")
+    print("Skyline:", {l: {m: s.cost for m, s in dpl.items()} for l, dpl in skyline.items()})
+    assert skyline == {10: {3: (50, 1, set())}, 15: {2: (45, 1, set())}, 20: {4: (40, 1, set())}}
+    assert skyline.dominated(10, 2, 45) == [(10, 3), (15, 2)]
+    # Subcases dominated within the same latency are rejected
+    assert skyline.dominates(20, 6, 40) and not skyline.add(20, 6, SubLTreePart(40, 1, set()))
+    assert skyline.add(20, 6, SubLTreePart(35, 1, set())) and list(skyline[20]) == [4, 6]
+    # Missing latency keys are not created by reading
+    with pytest.raises(KeyError):
+        _ = skyline[25]
+    assert 25 not in skyline and list(skyline._lats) == [10, 15, 20]
+    # Explicitly inserted subcases are filtered at the next query
+    skyline.insert(25, 7, SubLTreePart(38, 1, set()))
+    skyline.insert(25, 8, SubLTreePart(39, 1, set()))
+    assert skyline.add(25, 6, SubLTreePart(30, 1, set())) and skyline[25] == {6: (30, 1, set())}
+    # Memory pairs are compared component-wise
+    pairs = ParetoSkyline()
+    for lat, mem, cost in ((10, (3, 5), 50), (10, (5, 3), 50), (20, (4, 6), 60), (10, (2, 2), 45)):
+        pairs.add(lat, mem, SubLTreePart(cost, 1, set()))
+    print("Skyline pairs:", {l: {m: s.cost for m, s in dpl.items()} for l, dpl in pairs.items()})
+    assert pairs == {10: {(2, 2): (45, 1, set())}}
+
+
+def test_pareto_frontier(n: int = 10):
+    tree = get_random_tree(n)
+    for alg in (pseudo_btree_partitioning, pseudo_ltree_partitioning,
+                pseudo_par_btree_partitioning, pseudo_par_ltree_partitioning):
+        frontier = alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10, pareto=True)
+        print(f"{alg.__name__}:", [(cost, lat) for _, cost, lat in frontier])
+        assert frontier and all(c1 > c2 and l1 < l2 for (_, c1, l1), (_, c2, l2) in zip(frontier, frontier[1:]))
+        # Each trade-off point is the min-cost partitioning wrt. its own latency limit
+        for partition, cost, lat in frontier:
+            assert alg(tree, root=1, M=6, L=lat, cp_end=n, delay=10)[1] == cost
+        assert alg(tree, root=1, M=6, L=0, cp_end=n, delay=10, pareto=True) == []
+
+
+def test_incremental_partitioning(n: int = 20):
+    tree = get_random_tree(n)
+    for traversal, alg in ((BTREE, pseudo_btree_partitioning), (LTREE, pseudo_ltree_partitioning)):
+        partitioner = IncrementalTreePartitioner(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10,
+                                                 traversal=traversal)
+        print(partitioner)
+        assert partitioner.partition() == alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10)
+        assert not partitioner.dirty
+        # Change the runtime of a leaf and the invocation rate of an inner edge
+        leaf = next(v for v in tree if v != 'P' and not tree.succ[v])
+        inner = next(v for v in tree if v not in ('P', 1) and tree.succ[v])
+        tree.nodes[leaf][RUNTIME] += 100
+        tree[next(tree.predecessors(inner))][inner][RATE] += 1
+        changed = partitioner.update(tree)
+        print(f"Changed nodes: {changed}, invalidated subtrees: {len(partitioner.dirty)}/{n}")
+        assert changed == {leaf, inner} and {1, leaf, inner} <= partitioner.dirty
+        assert partitioner.partition() == alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10)
+        assert partitioner.partition(pareto=True) == alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10,
+                                                         pareto=True)
+
+
+def test_arbitrary_node_ids(n: int = 20):
+    tree = get_random_tree(n)
+    for labeling in (lambda v: f"f{v}", lambda v: v - 1):
+        mapping = {v: labeling(v) if v != 'P' else v for v in tree}
+        labeled = nx.relabel_nodes(tree, mapping)
+        for traversal, alg in ((BTREE, pseudo_btree_partitioning), (LTREE, pseudo_ltree_partitioning)):
+            res = alg(tree, root=1, M=6, L=math.inf, cp_end=n, delay=10)
+            labeled_res = alg(labeled, root=mapping[1], M=6, L=math.inf, cp_end=mapping[n], delay=10)
+            print(f"{alg.__name__}: {res} <-> {labeled_res}")
+            assert labeled_res[1:] == res[1:]
+            assert sorted(map(sorted, labeled_res[0])) == sorted(sorted(map(mapping.get, blk)) for blk in res[0])
+            assert [r[1:] for r in alg(labeled, root=mapping[1], M=6, L=math.inf, cp_end=mapping[n], delay=10,
+                                       pareto=True)] == [r[1:] for r in alg(tree, root=1, M=6, L=math.inf,
+                                                                            cp_end=n, delay=10, pareto=True)]
+            partitioner = IncrementalTreePartitioner(labeled, root=mapping[1], M=6, cp_end=mapping[n], delay=10,
+                                                     traversal=traversal)
+            assert partitioner.partition() == labeled_res
+            leaf = next(v for v in labeled if v != 'P' and not labeled.succ[v])
+            labeled.nodes[leaf][RUNTIME] += 100
+            assert partitioner.update(labeled) == {leaf}
+            assert partitioner.partition() == alg(labeled, root=mapping[1], M=6, L=math.inf, cp_end=mapping[n],
+                                                  delay=10)
+            labeled.nodes[leaf][RUNTIME] -= 100
+
+
+def test_isomorphic_subtree_reuse(n: int = 20, crossing: int = 5):
+    tree = faasify_dag_by_duplication(get_random_dag(n, crossing), 1)
+    cp_end = max(v for v in tree if v != 'P' and not tree.succ[v])
+    iso = isomorphic_subtrees(tree, 1)
+    print(f"Tree size: {len(tree)}, reused subtrees: {[(u, v) for v, (u, _) in iso.items()]}")
+    assert all(mapping[u] == v and all(tree.nodes[x][RUNTIME] == tree.nodes[y][RUNTIME] for x, y in mapping.items())
+               for v, (u, mapping) in iso.items())
+    for alg in (pseudo_btree_partitioning, pseudo_ltree_partitioning, bifptas_ltree_partitioning):
+        res = alg(tree, root=1, M=6, L=math.inf, cp_end=cp_end, delay=10)
+        dedup_res = alg(tree, root=1, M=6, L=math.inf, cp_end=cp_end, delay=10, dedup=True)
+        print(f"{alg.__name__}: {res} <-> {dedup_res}")
+        assert res[1:] == dedup_res[1:] and sorted(sum(dedup_res[0], [])) == sorted(v for v in tree if v != 'P')
+
+
 if __name__ == '__main__':
     # test_btree_traversal()
     # test_ltree_traversal()
     test_ser_tree_pseudo_partitioning()
     # test_random_tree_partitioning()
+    # test_pareto_skyline()
+    # test_pareto_frontier()
+    # test_incremental_partitioning()
+    # test_arbitrary_node_ids()
+    # test_isomorphic_subtree_reuse()
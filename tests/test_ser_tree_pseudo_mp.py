@@ -13,12 +13,23 @@
 # limitations under the License.
 import math
 import pathlib
+import random
+import subprocess
+import sys
+import textwrap
+import time
 
 import networkx as nx
+import pytest
 
-from slambuc.alg.app import NAME
+from slambuc.alg.app import NAME, PLATFORM
 from slambuc.alg.tree.serial.pseudo_mp import (isubtree_cutoffs, isubtree_sync_cutoffs, isubtree_splits, get_cpu_splits,
-                                               pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning)
+                                               get_balanced_splits, predict_makespan, pseudo_mp_btree_partitioning,
+                                               pseudo_mp_ltree_partitioning)
+from slambuc.alg.tree.serial.pseudo_mp import _ltree_partitioning
+from slambuc.alg.tree.pool import WorkerPool, THREAD, get_backend, partition_subtrees
+from slambuc.alg.tree.shared import share_subcases, load_subcases, shared_tree, attach_tree
+from slambuc.alg.util import ibacktrack_chain, freeze_barriers, flatten_barriers
 from slambuc.misc.plot import draw_tree
 from slambuc.misc.random import get_random_tree
 from slambuc.misc.util import evaluate_ser_tree_partitioning
@@ -137,6 +148,156 @@ def test_random_tree_partitioning(n: int = 10):
     run_test(**params)
 
 
+def test_shared_subcases(n: int = 20, M: int = 6):
+    tree = get_random_tree(n)
+    cpath = set(ibacktrack_chain(tree, 1, n))
+    TDP = _ltree_partitioning(None, {}, tree, 1, M, math.inf, cpath, 10)
+    frozen = freeze_barriers(TDP)
+    loaded = load_subcases(share_subcases(TDP))
+    print(f"Subcases: {sum(map(len, TDP.values()))}")
+    assert loaded.keys() == frozen.keys()
+    for n, subcases in frozen.items():
+        assert loaded[n].keys() == subcases.keys()
+        for lat, sub in subcases.items():
+            assert loaded[n][lat][:-1] == sub[:-1] and flatten_barriers(loaded[n][lat].barr) == sub.barr
+    with shared_tree(tree) as stree:
+        ctree = attach_tree(stree)
+        print(f"Shared tree: {ctree}")
+        assert set(ctree.edges()) == set(tree.edges)
+
+
+def test_shared_mp_partitioning(n: int = 40, M: int = 15):
+    tree = get_random_tree(n)
+    for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+        res_shm = alg(tree, 1, M, math.inf, n, 10, shared=True)
+        res_pkl = alg(tree, 1, M, math.inf, n, 10, shared=False)
+        print(f"{alg.__name__}: {res_shm=}, {res_pkl=}")
+        assert res_shm[1:] == res_pkl[1:]
+
+
+def test_worker_pool_partitioning(n: int = 30, M: int = 15, repeat: int = 3):
+    with WorkerPool(2) as pool:
+        for _ in range(repeat):
+            tree = get_random_tree(n)
+            for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+                res_pool = alg(tree, 1, M, math.inf, n, 10, pool=pool)
+                res_proc = alg(tree, 1, M, math.inf, n, 10)
+                print(f"{alg.__name__}: {res_pool=}, {res_proc=}")
+                assert res_pool[1:] == res_proc[1:]
+        print(pool)
+
+
+def test_worker_pool_shared_memory(n: int = 30, M: int = 15):
+    # Worker processes must not track the shared memory blocks of other processes
+    code = textwrap.dedent(f"""
+        import math
+        from slambuc.alg.tree.pool import WorkerPool
+        from slambuc.alg.tree.serial.pseudo_mp import pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning
+        from slambuc.misc.random import get_random_tree
+        if __name__ == '__main__':
+            with WorkerPool(2) as pool:
+                tree = get_random_tree({n})
+                for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+                    print(alg(tree, 1, {M}, math.inf, {n}, 10, pool=pool, shared=True)[1:])
+        """)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          cwd=pathlib.Path(__file__).parent.parent, timeout=120)
+    print(proc.stdout, proc.stderr, sep='\n')
+    assert proc.returncode == 0 and 'resource_tracker' not in proc.stderr
+
+
+def test_shared_memory_tracking(n: int = 30, M: int = 15):
+    # Forked subprocesses share the resource tracker of the main process
+    code = textwrap.dedent(f"""
+        import math
+        from slambuc.alg.tree.parallel.pseudo_mp import pseudo_par_mp_ltree_partitioning
+        from slambuc.alg.tree.serial.pseudo_mp import pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning
+        from slambuc.misc.random import get_random_tree
+        if __name__ == '__main__':
+            tree = get_random_tree({n})
+            for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+                print(alg(tree, 1, {M}, math.inf, {n}, 10)[1:])
+            print(pseudo_par_mp_ltree_partitioning(tree, 1, {M}, math.inf, 2, {n}, 10)[1:])
+        """)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          cwd=pathlib.Path(__file__).parent.parent, timeout=120)
+    print(proc.stdout, proc.stderr, sep='\n')
+    assert proc.returncode == 0 and 'Traceback' not in proc.stderr and 'resource_tracker' not in proc.stderr
+
+
+def _failing_ltree_partitioning(ready, sync, tree, root, *args):
+    if ready is None:
+        # Fail in the main process after the subcases of the sync points are sent
+        while any(q.empty() for q in sync.values()):
+            time.sleep(0.01)
+        raise RuntimeError("Interrupted")
+    return _ltree_partitioning(ready, sync, tree, root, *args)
+
+
+@pytest.mark.skipif(not pathlib.Path("/dev/shm").is_dir(), reason="requires POSIX shared memory")
+def test_interrupted_shared_memory(n: int = 30, M: int = 15):
+    tree = get_random_tree(n)
+    cpath = set(ibacktrack_chain(tree, 1, n))
+    blocks = set(pathlib.Path("/dev/shm").glob("psm_*"))
+    splits = list(isubtree_splits(tree, 1))
+    with pytest.raises(RuntimeError):
+        partition_subtrees(_failing_ltree_partitioning, tree, 1, splits, (M, math.inf, cpath, 10))
+    leaked = set(pathlib.Path("/dev/shm").glob("psm_*")) - blocks
+    print(f"Splits: {len(splits)}, leaked blocks: {leaked}")
+    assert len(splits) > 1 and not leaked
+
+
+@pytest.mark.skipif(not pathlib.Path("/dev/shm").is_dir(), reason="requires POSIX shared memory")
+def test_infeasible_shared_memory(M: int = 15, trials: int = 12):
+    blocks = set(pathlib.Path("/dev/shm").glob("psm_*"))
+    with WorkerPool(2) as pool:
+        for i in range(trials):
+            random.seed(i)
+            n = random.randint(15, 35)
+            tree = get_random_tree(n)
+            # Subcases of sync points are also released if the subtree above them has no feasible subcases
+            for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+                print(alg.__name__, alg(tree, 1, M, 600, n, 10)[1:], alg(tree, 1, M, 600, n, 10, pool=pool)[1:])
+    leaked = set(pathlib.Path("/dev/shm").glob("psm_*")) - blocks
+    print(f"Leaked blocks: {leaked}")
+    assert not leaked
+
+
+def test_worker_pool_unsatisfiable_sync(n: int = 20):
+    tree = get_random_tree(n)
+    with WorkerPool(1, warmup=False) as pool:
+        with pytest.raises(ValueError):
+            pool.run_subtrees(_ltree_partitioning, [((1, 2), {n + 1})], tree, (math.inf, math.inf, None, 10))
+
+
+def test_balanced_splits(n: int = 40, M: int = 15, workers: int = 3):
+    tree = get_random_tree(n)
+    cpath = set(ibacktrack_chain(tree, 1, n))
+    splits = get_balanced_splits(tree, 1, workers, M, cpath)
+    for s in splits:
+        print(s)
+    print(f"Predicted makespan: {predict_makespan(splits, workers)}, "
+          f"sqrt(n) splits: {len(list(isubtree_splits(tree, 1)))}")
+    assert splits[-1].edge == (PLATFORM, 1)
+    for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+        res_bal = alg(tree, 1, M, math.inf, n, 10, workers=workers)
+        res_def = alg(tree, 1, M, math.inf, n, 10)
+        print(f"{alg.__name__}: {res_bal=}, {res_def=}")
+        assert res_bal[1:] == res_def[1:]
+
+
+def test_thread_backend_partitioning(n: int = 30, M: int = 15):
+    tree = get_random_tree(n)
+    print(f"Applied backend for threads: {get_backend(THREAD)}")
+    with WorkerPool(2, backend=THREAD) as pool:
+        for alg in (pseudo_mp_btree_partitioning, pseudo_mp_ltree_partitioning):
+            res_thread = alg(tree, 1, M, math.inf, n, 10, pool=pool)
+            res_backend = alg(tree, 1, M, math.inf, n, 10, backend=THREAD)
+            res_proc = alg(tree, 1, M, math.inf, n, 10)
+            print(f"{alg.__name__}: {res_thread=}, {res_backend=}, {res_proc=}")
+            assert res_thread[1:] == res_backend[1:] == res_proc[1:]
+
+
 if __name__ == '__main__':
     # test_cpu_cutoff(cut_factor=3)
     # test_subtree_split(size=2)
@@ -147,3 +308,13 @@ if __name__ == '__main__':
 
     test_ser_tree_pseudo_partitioning()
     # test_random_tree_partitioning()
+    # test_shared_subcases()
+    # test_shared_mp_partitioning()
+    # test_worker_pool_partitioning()
+    # test_worker_pool_shared_memory()
+    # test_shared_memory_tracking()
+    # test_interrupted_shared_memory()
+    # test_infeasible_shared_memory()
+    # test_worker_pool_unsatisfiable_sync()
+    # test_balanced_splits()
+    # test_thread_backend_partitioning()
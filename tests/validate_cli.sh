@@ -32,6 +32,8 @@ slambuc chain serial ilp ./data/chain_test_sequence_serial.npy --alg mtx
 
 slambuc dag ilp ./data/graph_test_dag.gml --alg greedy
 slambuc dag ilp ./data/graph_test_dag.gml --alg dag
+slambuc dag ilp ./data/graph_test_dag.npy --alg greedy
+slambuc dag ilp ./data/graph_test_dag.npy --alg dag
 
 slambuc ext baseline ./data/graph_test_tree.gml --alg singleton
 slambuc ext baseline ./data/graph_test_tree.gml --alg no